@@ -1,5 +1,5 @@
 # pylint: disable=logging-fstring-interpolation
-from typing import Dict, List, Optional, Type
+from typing import Dict, List, Optional, Type, cast
 
 import numpy as np
 import torch
@@ -190,7 +190,7 @@ class BioBERTNERPredictor(FixedSizeBatchProcessor):
                     token.ner = 'I-' + self.ft_configs.ner_type
 
                 begin = first_token.span.begin
-                end = data_pack.get_entry(last_tid).span.end
+                end = cast(Subword, data_pack.get_entry(last_tid)).span.end
                 entity = EntityMention(data_pack, begin, end)
                 entity.ner_type = self.ft_configs.ner_type
 
@@ -199,8 +199,7 @@ class BioBERTNERPredictor(FixedSizeBatchProcessor):
         r"""Default config for NER Predictor"""
 
         configs = super().default_configs()
-        # TODO: Batcher in NER need to be update to use the sytem one.
-        configs["batcher"] = {"batch_size": 10}
+        configs["batcher"]["batch_size"] = 10
 
         more_configs = {'model_path': None,
                         'ner_type': 'BioEntity',
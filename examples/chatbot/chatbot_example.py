@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import cast
+
 import yaml
 
 from termcolor import colored
@@ -26,7 +28,8 @@ from forte.processors.ir import SearchProcessor, BertBasedQueryCreator
 from forte.data.selector import NameMatchSelector
 from forte.processors.nltk_processors import (
     NLTKSentenceSegmenter, NLTKWordTokenizer, NLTKPOSTagger)
-from ft.onto.base_ontology import PredicateLink, Sentence
+from ft.onto.base_ontology import (
+    PredicateArgument, PredicateLink, PredicateMention, Sentence)
 
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
@@ -100,8 +103,8 @@ def main(config: Config):
 
             print(colored("Semantic role labels:", 'red'))
             for link in pack.get(PredicateLink, sentence):
-                parent = link.get_parent()
-                child = link.get_child()
+                parent = cast(PredicateMention, link.get_parent())
+                child = cast(PredicateArgument, link.get_child())
                 print(f"  - \"{child.text}\" is role "
                       f"{link.arg_type} of "
                       f"predicate \"{parent.text}\"")
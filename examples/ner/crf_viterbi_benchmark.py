@@ -0,0 +1,93 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the batched Viterbi decoding of `ConditionalRandomField.viterbi_tags`
+with decoding the sequences one by one with `viterbi_decode`, which is how
+`viterbi_tags` used to work.
+"""
+import argparse
+import time
+
+import torch
+
+from forte.models.ner.conditional_random_field import (
+    ConditionalRandomField, allowed_transitions, viterbi_decode)
+
+
+def sequential_viterbi_tags(crf: ConditionalRandomField,
+                            logits: torch.Tensor, mask: torch.Tensor):
+    num_tags = crf.num_tags
+    start_tag, end_tag = num_tags, num_tags + 1
+    transitions = torch.full((num_tags + 2, num_tags + 2), -10000.0)
+    # pylint: disable=protected-access
+    inner, start, end = crf._constrained_transitions()
+    transitions[:num_tags, :num_tags] = inner
+    transitions[start_tag, :num_tags] = start
+    transitions[:num_tags, end_tag] = end
+
+    best_paths = []
+    for prediction, prediction_mask in zip(logits, mask):
+        length = int(prediction_mask.sum())
+        tag_sequence = torch.full((length + 2, num_tags + 2), -10000.0)
+        tag_sequence[0, start_tag] = 0.0
+        tag_sequence[1:length + 1, :num_tags] = prediction[:length]
+        tag_sequence[length + 1, end_tag] = 0.0
+        path, score = viterbi_decode(tag_sequence, transitions)
+        best_paths.append((path[1:-1], score.item()))
+    return best_paths
+
+
+def timeit(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(batch_size: int, max_length: int, repeat: int):
+    torch.manual_seed(0)
+    entity_types = ["PER", "LOC", "ORG", "MISC"]
+    labels = ["O"] + [f"{p}-{t}" for t in entity_types for p in "BI"]
+    crf = ConditionalRandomField(
+        len(labels), constraints=allowed_transitions(
+            "BIO", dict(enumerate(labels))))
+
+    logits = torch.randn(batch_size, max_length, len(labels))
+    lengths = torch.randint(1, max_length + 1, (batch_size,))
+    mask = (torch.arange(max_length).unsqueeze(0) <
+            lengths.unsqueeze(1)).long()
+
+    with torch.no_grad():
+        batched = crf.viterbi_tags(logits, mask)
+        sequential = sequential_viterbi_tags(crf, logits, mask)
+        assert [p for p, _ in batched] == [p for p, _ in sequential]
+
+        sequential_time = timeit(
+            lambda: sequential_viterbi_tags(crf, logits, mask), repeat)
+        batched_time = timeit(lambda: crf.viterbi_tags(logits, mask), repeat)
+
+    print(f"batch size {batch_size}, max length {max_length}, "
+          f"{len(labels)} tags, averaged over {repeat} runs.")
+    print(f"{'sequential':>12}: {sequential_time * 1000:9.2f} ms")
+    print(f"{'batched':>12}: {batched_time * 1000:9.2f} ms "
+          f"({sequential_time / batched_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--max-length", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    main(args.batch_size, args.max_length, args.repeat)
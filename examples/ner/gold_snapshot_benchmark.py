@@ -0,0 +1,75 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the time and the memory of the gold copies of the packs kept for an
+evaluator: the full copies (`view`) and the snapshots of only the entry types
+used by the CoNLL NER evaluator (`snapshot`).
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List
+
+from forte.data.data_pack import DataPack
+from forte.data.readers import OntonotesReader
+from forte.evaluation.ner_evaluator import CoNLLNEREvaluator
+from forte.pipeline import Pipeline
+
+
+def measure(packs: List[DataPack], copy: Callable[[DataPack], DataPack],
+            repeat: int):
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    copies = [copy(pack) for pack in packs]
+    memory = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+    del copies
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for pack in packs:
+            copy(pack)
+    elapsed = (time.perf_counter() - start) / repeat
+    return memory, elapsed
+
+
+def main(data_path: str, repeat: int):
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(OntonotesReader())
+    pipeline.initialize()
+    packs: List[DataPack] = list(pipeline.process_dataset(data_path))
+    num_entries = sum(len(list(pack)) for pack in packs)
+
+    entry_types = CoNLLNEREvaluator().gold_entry_types()
+    # The snapshot keeps all the entries if the types are not given.
+    kept = "all the entries" if entry_types is None else sorted(
+        t.__name__ for t in entry_types)
+    print(f"{len(packs)} packs, {num_entries} entries, keeping {kept}, "
+          f"averaged over {repeat} runs.")
+    print(f"{'method':>9} {'memory (KB)':>12} {'time (ms)':>10}")
+    for name, copy in (
+            ("view", lambda p: p.view()),
+            ("snapshot", lambda p: p.snapshot(entry_types))):
+        memory, elapsed = measure(packs, copy, repeat)
+        print(f"{name:>9} {memory / 1024:12.1f} {elapsed * 1000:10.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-path", default="data_samples/ontonotes/00",
+                        help="The directory of the OntoNotes files.")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="The number of runs to average the time over.")
+    args = parser.parse_args()
+    main(args.data_path, args.repeat)
@@ -0,0 +1,79 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the memory used per token by the default generated ontology classes
+and by the classes generated with `__slots__` (the `use_slots` option of the
+ontology code generator), for a pack with many tokens.
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+import tracemalloc
+
+import forte
+from forte.data.data_pack import DataPack
+from forte.data.ontology.ontology_code_generator import OntologyCodeGenerator
+from ft.onto import base_ontology
+
+
+def load_slotted_ontology():
+    spec_path = os.path.join(
+        os.path.dirname(forte.__file__), "ontology_specs",
+        "base_ontology.json")
+    generator = OntologyCodeGenerator(generate_all=True, use_slots=True)
+    folder = generator.generate(spec_path, is_dry_run=True)
+
+    module_name = "slotted_base_ontology"
+    spec = importlib.util.spec_from_file_location(
+        module_name, os.path.join(folder, "ft/onto/base_ontology.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(token_type, num_tokens: int):
+    pack = DataPack()
+    pack.set_text("a " * num_tokens)
+
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for i in range(num_tokens):
+        token = token_type(pack, 2 * i, 2 * i + 1)
+        token.pos = "NN"
+        pack.add_entry(token)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0] - start_memory
+    tracemalloc.stop()
+    return memory / num_tokens, elapsed
+
+
+def main(num_tokens: int):
+    slotted = load_slotted_ontology()
+    print(f"{num_tokens} tokens")
+    print(f"{'classes':>10} {'bytes/token':>12} {'time (s)':>9}")
+    for name, module in (("default", base_ontology), ("slots", slotted)):
+        per_token, elapsed = measure(module.Token, num_tokens)
+        print(f"{name:>10} {per_token:12.1f} {elapsed:9.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-tokens", type=int, default=1000000,
+                        help="The number of tokens in the pack.")
+    args = parser.parse_args()
+    main(args.num_tokens)
@@ -0,0 +1,146 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the latency of scoring the candidate documents of a query with
+`BertRerankingProcessor.score_documents`, which scores them in padded
+batches, with scoring them one by one, which is how the processor used to
+work. A small randomly initialized BERT classifier is used, so no pretrained
+model needs to be downloaded.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import List
+
+import torch
+from texar.torch.data.tokenizers.bert_tokenizer import BERTTokenizer
+from texar.torch.modules import BERTClassifier
+
+from forte.common.configuration import Config
+from forte.processors.ir.bert_reranking_processor import (
+    BertRerankingProcessor)
+
+WORDS = [f"word{i}" for i in range(1000)]
+
+
+def build_reranker(vocab_path: str, batch_size: int,
+                   max_seq_length: int) -> BertRerankingProcessor:
+    with open(vocab_path, "w") as vocab:
+        vocab.write("\n".join(
+            ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + WORDS))
+
+    # pylint: disable=attribute-defined-outside-init
+    reranker = BertRerankingProcessor()
+    reranker.config = Config(
+        {"batch_size": batch_size, "max_seq_length": max_seq_length},
+        BertRerankingProcessor.default_configs())
+    reranker.device = torch.device("cpu")
+    reranker.tokenizer = BERTTokenizer(
+        pretrained_model_name=None,
+        hparams={"pretrained_model_name": None, "vocab_file": vocab_path})
+    reranker.model = BERTClassifier(pretrained_model_name=None, hparams={
+        "pretrained_model_name": None,
+        "num_classes": 2,
+        "vocab_size": len(WORDS) + 5,
+        "hidden_size": 128,
+        "embed": {"dim": 128},
+        "segment_embed": {"dim": 128},
+        "position_embed": {"dim": 128},
+        "position_size": max_seq_length,
+        "max_seq_length": max_seq_length,
+        "encoder": {
+            "dim": 128,
+            "num_blocks": 2,
+            "multihead_attention": {
+                "num_heads": 2, "num_units": 128, "output_dim": 128},
+            "poswise_feedforward": {"layers": [
+                {"type": "Linear",
+                 "kwargs": {"in_features": 128, "out_features": 512,
+                            "bias": True}},
+                {"type": "BertGELU"},
+                {"type": "Linear",
+                 "kwargs": {"in_features": 512, "out_features": 128,
+                            "bias": True}},
+            ]},
+        },
+    })
+    reranker.model.eval()
+    return reranker
+
+
+def sequential_scores(reranker: BertRerankingProcessor, query_text: str,
+                      document_texts: List[str]) -> List[float]:
+    scores = []
+    with torch.no_grad():
+        for document_text in document_texts:
+            input_ids, segment_ids, input_mask = [
+                torch.LongTensor(item).unsqueeze(0)
+                for item in reranker.tokenizer.encode_text(
+                    query_text, document_text,
+                    reranker.config.max_seq_length)]
+            seq_length = (input_mask == 1).sum(dim=-1)
+            logits, _ = reranker.model(input_ids, seq_length, segment_ids)
+            preds = torch.nn.functional.softmax(logits, dim=1)
+            scores.append(preds[0][1].item())
+    return scores
+
+
+def timeit(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(num_documents: int, batch_size: int, max_seq_length: int,
+         repeat: int):
+    random.seed(0)
+    torch.manual_seed(0)
+    query_text = " ".join(random.choices(WORDS, k=8))
+    document_texts = [
+        " ".join(random.choices(WORDS, k=random.randint(20, 200)))
+        for _ in range(num_documents)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reranker = build_reranker(
+            os.path.join(tmp_dir, "vocab.txt"), batch_size, max_seq_length)
+
+    sequential = sequential_scores(reranker, query_text, document_texts)
+    batched = reranker.score_documents(query_text, document_texts)
+    assert torch.allclose(torch.tensor(sequential), torch.tensor(batched),
+                          atol=1e-5)
+
+    sequential_time = timeit(lambda: sequential_scores(
+        reranker, query_text, document_texts), repeat)
+    batched_time = timeit(lambda: reranker.score_documents(
+        query_text, document_texts), repeat)
+
+    print(f"{num_documents} documents, batch size {batch_size}, max "
+          f"sequence length {max_seq_length}, averaged over {repeat} runs.")
+    print(f"{'sequential':>12}: {sequential_time * 1000:9.2f} ms")
+    print(f"{'batched':>12}: {batched_time * 1000:9.2f} ms "
+          f"({sequential_time / batched_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-documents", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-seq-length", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.num_documents, args.batch_size, args.max_seq_length,
+         args.repeat)
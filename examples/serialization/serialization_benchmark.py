@@ -0,0 +1,72 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the JSON (jsonpickle) and the binary serialization of data packs, in
+terms of the serialized size and the time of serialization, deserialization
+and of re-parsing the raw CoNLL files.
+"""
+import argparse
+import time
+from typing import Callable, List
+
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize, serialize
+from forte.data.readers import OntonotesReader
+from forte.pipeline import Pipeline
+
+
+def timeit(func: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(data_path: str, repeat: int):
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(OntonotesReader())
+    pipeline.initialize()
+
+    packs: List[DataPack] = list(pipeline.process_dataset(data_path))
+    num_annotations = sum(len(pack.annotations) for pack in packs)
+    print(f"{len(packs)} packs, {num_annotations} annotations, "
+          f"averaged over {repeat} runs.")
+
+    parse_time = timeit(
+        lambda: list(pipeline.process_dataset(data_path)), repeat)
+    print(f"{'parse CoNLL':>12}: {parse_time * 1000:9.2f} ms")
+
+    print(f"{'method':>12} {'size (KB)':>10} {'serialize (ms)':>15} "
+          f"{'deserialize (ms)':>17}")
+    for method in ("jsonpickle", "binary"):
+        data = [serialize(pack, serialize_method=method) for pack in packs]
+        size = sum(len(d) for d in data) / 1024
+        serialize_time = timeit(
+            lambda m=method: [serialize(p, serialize_method=m)  # type: ignore
+                              for p in packs], repeat)
+        deserialize_time = timeit(
+            lambda d=data: [deserialize(s) for s in d], repeat)  # type: ignore
+        print(f"{method:>12} {size:10.1f} {serialize_time * 1000:15.2f} "
+              f"{deserialize_time * 1000:17.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data-path",
+                        default="../../data_samples/ontonotes/00/",
+                        help="A directory of CoNLL files.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="The number of runs to average over.")
+    args = parser.parse_args()
+    main(args.data_path, args.repeat)
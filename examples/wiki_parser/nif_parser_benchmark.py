@@ -0,0 +1,97 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the throughput of reading a NIF dump by parsing each line with an
+rdflib graph, with the streaming N-Quads parser (producing rdflib terms), and
+with the streaming parser producing plain strings. A synthetic dump in the
+format of the DBpedia NIF dumps is generated if no file is given.
+"""
+import argparse
+import bz2
+import os
+import tempfile
+import time
+
+import rdflib
+
+from forte.data.datasets.wikipedia.db_utils import NIFParser
+from forte.data.datasets.wikipedia.nquads import open_nquads, parse_nquads
+
+NIF = "http://persistence.uni-leipzig.org/nlp2rdf/ontologies/nif-core#"
+
+
+def write_synthetic_dump(path: str, num_pages: int):
+    with bz2.open(path, "wt", encoding="utf-8") as f:
+        for i in range(num_pages):
+            page = f"http://dbpedia.org/resource/Page_{i}"
+            context = f"<{page}?dbpv=2016-10&nif=context>"
+            graph = f"<http://en.wikipedia.org/wiki/Page_{i}?oldid={i}>"
+            text = " ".join(f"word{j} \\\"quoted\\\"" for j in range(200))
+            f.write(f"{context} <http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+                    f"type> <{NIF}Context> {graph} .\n")
+            f.write(f"{context} <{NIF}beginIndex> \"0\"^^<http://www.w3.org/"
+                    f"2001/XMLSchema#nonNegativeInteger> {graph} .\n")
+            f.write(f"{context} <{NIF}isString> \"{text}\"@en {graph} .\n")
+            for j in range(20):
+                f.write(f"<{page}?dbpv=2016-10&nif=phrase_{j}_{j + 5}> "
+                        f"<{NIF}referenceContext> {context} {graph} .\n")
+
+
+def read_with_graphs(path: str) -> int:
+    count = 0
+    with open_nquads(path) as lines:
+        for line in lines:
+            graph = rdflib.ConjunctiveGraph()
+            graph.parse(data=line, format="nquads")
+            count += len(list(graph.quads()))
+    return count
+
+
+def read_with_parser(path: str) -> int:
+    with NIFParser(path) as parser:
+        return sum(len(statements) for statements in parser)
+
+
+def read_plain(path: str) -> int:
+    with open_nquads(path) as lines:
+        return sum(1 for _ in parse_nquads(lines))
+
+
+def main(nif_path: str, num_pages: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if nif_path is None:
+            nif_path = os.path.join(tmp_dir, "synthetic.nq.bz2")
+            write_synthetic_dump(nif_path, num_pages)
+
+        print(f"{'method':>14} {'statements':>11} {'time (s)':>9} "
+              f"{'statements/s':>13}")
+        for name, read in (("rdflib graphs", read_with_graphs),
+                           ("NIFParser", read_with_parser),
+                           ("plain strings", read_plain)):
+            start = time.perf_counter()
+            count = read(nif_path)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>14} {count:11d} {elapsed:9.2f} "
+                  f"{count / elapsed:13.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nif-path", default=None,
+                        help="The N-Quads file to read, can be bz2 "
+                             "compressed.")
+    parser.add_argument("--num-pages", type=int, default=2000,
+                        help="The number of pages in the synthetic dump.")
+    args = parser.parse_args()
+    main(args.nif_path, args.num_pages)
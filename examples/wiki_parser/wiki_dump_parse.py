@@ -17,10 +17,11 @@ as MultiPacks onto disk.
 """
 import csv
 import logging
+import multiprocessing
 import os
 import pickle
 import sys
-from typing import TextIO, Any, Dict
+from typing import TextIO, Any, Dict, Optional, Tuple, cast
 
 from forte.common.configuration import Config
 from forte.common.resources import Resources
@@ -30,6 +31,8 @@ from forte.data.datasets.wikipedia.db_utils import load_redirects, \
 from forte.data.datasets.wikipedia.dbpedia_based_reader import DBpediaWikiReader
 from forte.data.datasets.wikipedia.dbpedia_infobox_reader import \
     DBpediaInfoBoxReader
+from forte.data.datasets.wikipedia.sharding import (
+    merge_pack_indices, shard_nif_file)
 from forte.pipeline import Pipeline
 from forte.processors.base.writers import JsonPackWriter
 from ft.onto.wikipedia import WikiPage
@@ -60,7 +63,7 @@ class WikiArticleWriter(JsonPackWriter):
 
     def sub_output_path(self, pack: DataPack) -> str:
         sub_dir = str(int(self.article_count / 2000)).zfill(5)
-        pid = pack.get_single(WikiPage).page_id
+        pid = cast(WikiPage, pack.get_single(WikiPage)).page_id
         doc_name = f'doc_{self.article_count}' if pid is None else pid
 
         return os.path.join(sub_dir, doc_name + '.json')
@@ -98,10 +101,7 @@ class WikiArticleWriter(JsonPackWriter):
         self.article_index.close()
 
 
-def main(nif_context: str, nif_page_structure: str, mapping_literals: str,
-         mapping_objects: str, nif_text_links: str, redirects: str,
-         info_boxs: str, output_path: str):
-    # Load redirects.
+def load_redirect_map(redirects: str, output_path: str) -> Dict[str, str]:
     print_progress('Loading redirects', '\n')
     logging.info("Loading redirects")
     redirect_pickle = os.path.join(output_path, 'redirects.pickle')
@@ -115,11 +115,14 @@ def main(nif_context: str, nif_page_structure: str, mapping_literals: str,
             pickle.dump(redirect_map, pickle_f)
     print_progress('\nLoading redirects', '\n')
     logging.info("Done loading.")
+    return redirect_map
 
-    # The datasets are read in two steps.
-    raw_pack_dir = os.path.join(output_path, 'nif_raw')
 
-    # First, we create the NIF reader that read the NIF in order.
+def run_text_pipeline(nif_context: str, nif_page_structure: str,
+                      nif_text_links: str, redirects: str,
+                      redirect_map: Dict[str, str], output_dir: str,
+                      context_index_dir: Optional[str] = None):
+    # The NIF reader that read the NIF in order.
     nif_pl = Pipeline[DataPack]()
     nif_pl.resource.update(redirects=redirect_map)
 
@@ -128,13 +131,14 @@ def main(nif_context: str, nif_page_structure: str, mapping_literals: str,
             'redirect_path': redirects,
             'nif_page_structure': nif_page_structure,
             'nif_text_links': nif_text_links,
+            'context_index_dir': context_index_dir,
         },
         DBpediaWikiReader.default_configs()
     ))
 
     nif_pl.add(WikiArticleWriter(), config=Config(
         {
-            'output_dir': raw_pack_dir,
+            'output_dir': output_dir,
             'zip_pack': True,
         },
         WikiArticleWriter.default_configs()
@@ -145,23 +149,28 @@ def main(nif_context: str, nif_page_structure: str, mapping_literals: str,
     print_progress('Start running the DBpedia text pipeline.', '\n')
     nif_pl.run(nif_context)
 
-    # Second, we add info boxes to the packs with NIF.
+
+def run_info_box_pipeline(info_boxs: str, mapping_literals: str,
+                          mapping_objects: str, redirect_map: Dict[str, str],
+                          pack_dir: str, output_dir: str, reading_log: str,
+                          context_index_dir: Optional[str] = None):
     ib_pl = Pipeline[DataPack]()
     ib_pl.resource.update(redirects=redirect_map)
     ib_pl.set_reader(DBpediaInfoBoxReader(), config=Config(
         {
-            'pack_index': os.path.join(raw_pack_dir, 'article.idx'),
-            'pack_dir': raw_pack_dir,
+            'pack_index': os.path.join(pack_dir, 'article.idx'),
+            'pack_dir': pack_dir,
             'mapping_literals': mapping_literals,
             'mapping_objects': mapping_objects,
-            'reading_log': os.path.join(output_path, 'infobox.log')
+            'context_index_dir': context_index_dir,
+            'reading_log': reading_log
         },
         DBpediaInfoBoxReader.default_configs()
     ))
 
     ib_pl.add(WikiArticleWriter(), config=Config(
         {
-            'output_dir': os.path.join(output_path, 'nif_info_box'),
+            'output_dir': output_dir,
             'zip_pack': True,
         },
         WikiArticleWriter.default_configs()
@@ -171,6 +180,113 @@ def main(nif_context: str, nif_page_structure: str, mapping_literals: str,
     ib_pl.run(info_boxs)
 
 
+# The redirects loaded once by each worker process of the sharded mode.
+_worker_redirects: Dict[str, str] = {}
+
+
+def _init_worker(redirects: str, output_path: str):
+    global _worker_redirects  # pylint: disable=global-statement
+    _worker_redirects = load_redirect_map(redirects, output_path)
+
+
+def _run_text_shard(
+        args: Tuple[str, str, str, str, str, Optional[str]]) -> str:
+    nif_context, nif_page_structure, nif_text_links, redirects, \
+        output_dir, context_index_dir = args
+    run_text_pipeline(nif_context, nif_page_structure, nif_text_links,
+                      redirects, _worker_redirects, output_dir,
+                      context_index_dir)
+    return output_dir
+
+
+def _run_info_box_shard(
+        args: Tuple[str, str, str, str, str, str, Optional[str]]) -> str:
+    info_boxs, mapping_literals, mapping_objects, pack_dir, output_dir, \
+        reading_log, context_index_dir = args
+    run_info_box_pipeline(info_boxs, mapping_literals, mapping_objects,
+                          _worker_redirects, pack_dir, output_dir,
+                          reading_log, context_index_dir)
+    return output_dir
+
+
+def sharded_main(nif_context: str, nif_page_structure: str,
+                 mapping_literals: str, mapping_objects: str,
+                 nif_text_links: str, redirects: str, info_boxs: str,
+                 output_path: str, num_workers: int,
+                 context_index_dir: Optional[str] = None):
+    r"""Process the dumps in ``num_workers`` processes. The dumps are split
+    into shards by the page contexts first, so each shard of the NIF context
+    can be joined with the same shards of the other dumps independently. The
+    packs of each shard are written to their own directories, and the pack
+    indices of the shards are merged."""
+    # Load the redirects once, so that the workers read them from the pickle.
+    load_redirect_map(redirects, output_path)
+    shard_dir = os.path.join(output_path, 'shards')
+    raw_pack_dir = os.path.join(output_path, 'nif_raw')
+    info_box_dir = os.path.join(output_path, 'nif_info_box')
+
+    with multiprocessing.Pool(
+            num_workers, initializer=_init_worker,
+            initargs=(redirects, output_path)) as pool:
+        dumps = [nif_context, nif_page_structure, nif_text_links, info_boxs,
+                 mapping_literals, mapping_objects]
+        shards = pool.starmap(
+            shard_nif_file,
+            [(dump, shard_dir, num_workers) for dump in dumps])
+        logging.info("Split the dumps into %d shards.", num_workers)
+
+        # First, the NIF context shards are read with the same shards of the
+        # page structure and the text links.
+        shard_output_dirs = pool.map(_run_text_shard, [
+            (shards[0][i], shards[1][i], shards[2][i], redirects,
+             os.path.join(raw_pack_dir, f'shard_{i:05d}'), context_index_dir)
+            for i in range(num_workers)])
+        merge_pack_indices(shard_output_dirs, raw_pack_dir)
+
+        # Second, we add info boxes to the packs with NIF.
+        shard_output_dirs = pool.map(_run_info_box_shard, [
+            (shards[3][i], shards[4][i], shards[5][i], raw_pack_dir,
+             os.path.join(info_box_dir, f'shard_{i:05d}'),
+             os.path.join(output_path, f'infobox_{i:05d}.log'),
+             context_index_dir)
+            for i in range(num_workers)])
+        merge_pack_indices(shard_output_dirs, info_box_dir)
+
+
+def main(nif_context: str, nif_page_structure: str, mapping_literals: str,
+         mapping_objects: str, nif_text_links: str, redirects: str,
+         info_boxs: str, output_path: str, num_workers: int = 1,
+         use_context_index: bool = False):
+    # With the context index, the page structure, the text links and the
+    # info boxes are looked up by the page context in on-disk indices, instead
+    # of in a window of the dumps read in the same order.
+    context_index_dir = os.path.join(
+        output_path, 'context_index') if use_context_index else None
+
+    if num_workers > 1:
+        sharded_main(nif_context, nif_page_structure, mapping_literals,
+                     mapping_objects, nif_text_links, redirects, info_boxs,
+                     output_path, num_workers, context_index_dir)
+        return
+
+    # Load redirects.
+    redirect_map = load_redirect_map(redirects, output_path)
+
+    # The datasets are read in two steps.
+    raw_pack_dir = os.path.join(output_path, 'nif_raw')
+
+    # First, we create the NIF reader that read the NIF in order.
+    run_text_pipeline(nif_context, nif_page_structure, nif_text_links,
+                      redirects, redirect_map, raw_pack_dir,
+                      context_index_dir)
+
+    # Second, we add info boxes to the packs with NIF.
+    run_info_box_pipeline(
+        info_boxs, mapping_literals, mapping_objects, redirect_map,
+        raw_pack_dir, os.path.join(output_path, 'nif_info_box'),
+        os.path.join(output_path, 'infobox.log'), context_index_dir)
+
+
 def get_data(dataset: str):
     p = os.path.join(base_dir, dataset)
     if os.path.exists(p):
@@ -182,6 +298,11 @@ def get_data(dataset: str):
 
 if __name__ == '__main__':
     base_dir = sys.argv[1]
+    # The number of worker processes, the dumps are processed in shards if
+    # more than one worker is used.
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    # Look up the contexts in on-disk indices, built on the first run.
+    context_index = len(sys.argv) > 3 and sys.argv[3] == 'index'
 
     pack_output = os.path.join(base_dir, 'packs')
 
@@ -198,5 +319,7 @@ if __name__ == '__main__':
         get_data('nif_text_links_en.tql.bz2'),
         get_data('redirects_en.tql.bz2'),
         get_data('infobox_properties_mapped_en.tql.bz2'),
-        pack_output
+        pack_output,
+        workers,
+        context_index,
     )
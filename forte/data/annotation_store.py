@@ -0,0 +1,659 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Columnar storage of the annotations in a
+:class:`~forte.data.data_pack.DataPack`.
+
+The spans and tids of each annotation type are kept in contiguous arrays, and
+the :class:`~forte.data.ontology.top.Annotation` objects are only created
+when they are actually accessed. The columns can be shared between packs
+copy-on-write, see :meth:`AnnotationStore.fork`.
+"""
+import copy
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union,
+    TYPE_CHECKING, cast, overload)
+
+import numpy as np
+
+from forte.data.ontology.top import Annotation
+
+if TYPE_CHECKING:
+    from forte.data.data_pack import DataPack
+
+__all__ = [
+    "AnnotationColumns",
+    "AnnotationStore",
+    "to_columns",
+]
+
+# Placeholder of a field value that is not stored in the columns, either
+# because the row is represented by a live object, or because the original
+# entry does not have this field.
+_ABSENT = object()
+
+# The entry fields that are represented by the span and tid arrays.
+_ROW_FIELDS = ('_tid', '_span')
+
+# The field values that can be shared without copying.
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, bytes, tuple,
+                    frozenset)
+
+
+def to_columns(states: Iterable[Dict[str, Any]]
+               ) -> Tuple[Dict[str, List[Any]], Dict[str, List[int]]]:
+    r"""Convert the entry states (the field dicts of the entries) into one
+    list per field name.
+
+    Args:
+        states: The states of the entries.
+
+    Returns:
+        A tuple of the field columns, and a dict from the field names to the
+        rows where the field is missing. The missing values are filled with
+        `None` in the columns.
+    """
+    fields: Dict[str, List[Any]] = {}
+    absent: Dict[str, List[int]] = {}
+    for row, state in enumerate(states):
+        for name, value in state.items():
+            if name not in fields:
+                fields[name] = [None] * row
+                if row > 0:
+                    absent[name] = list(range(row))
+            fields[name].append(value)
+        for name, column in fields.items():
+            if len(column) == row:
+                column.append(None)
+                absent.setdefault(name, []).append(row)
+    return fields, absent
+
+
+class AnnotationColumns:
+    r"""The columns of all the annotations of one concrete annotation type.
+
+    The ``begin``, ``end`` and ``tid`` columns are stored in one growable
+    ``int64`` buffer, the rows are kept in insertion order. The sorted view by
+    ``(begin, end, tid)`` is computed when first requested after a change.
+
+    The columns created by :meth:`share` use the same buffer and field lists
+    as the original, each side copies them on its first modification.
+
+    Args:
+        entry_type: The concrete annotation type stored in these columns.
+    """
+
+    def __init__(self, entry_type: Type[Annotation]):
+        self.entry_type: Type[Annotation] = entry_type
+        self._data: np.ndarray = np.empty((3, 16), dtype=np.int64)
+        self._size: int = 0
+
+        # Field values of the rows that are not materialized as objects.
+        self._fields: Dict[str, List[Any]] = {}
+
+        self._sorted_rows: Optional[np.ndarray] = None
+        self._sorted_begin: Optional[np.ndarray] = None
+        self._tid_rows: Optional[np.ndarray] = None
+
+        # Whether the buffer and the field lists may be used by other columns.
+        self._shared: bool = False
+        # Whether the field values may be referred to by other columns, the
+        # mutable values are copied when a row is read.
+        self._aliased: bool = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def begin(self) -> np.ndarray:
+        return self._data[0, :self._size]
+
+    @property
+    def end(self) -> np.ndarray:
+        return self._data[1, :self._size]
+
+    @property
+    def tid(self) -> np.ndarray:
+        return self._data[2, :self._size]
+
+    def share(self) -> "AnnotationColumns":
+        r"""Create a copy-on-write copy of the columns. The buffer and the
+        field lists are shared until either of the two columns is modified.
+        """
+        other = AnnotationColumns.__new__(AnnotationColumns)
+        other.__dict__.update(self.__dict__)
+        self._shared = other._shared = True
+        self._aliased = other._aliased = True
+        return other
+
+    def _own(self):
+        if self._shared:
+            self._data = self._data.copy()
+            self._fields = {
+                name: list(column) for name, column in self._fields.items()}
+            self._shared = False
+
+    def _invalidate(self):
+        self._sorted_rows = None
+        self._sorted_begin = None
+        self._tid_rows = None
+
+    def _reserve(self, size: int):
+        capacity = self._data.shape[1]
+        if size > capacity:
+            while capacity < size:
+                capacity *= 2
+            data = np.empty((3, capacity), dtype=np.int64)
+            data[:, :self._size] = self._data[:, :self._size]
+            self._data = data
+
+    def append(self, begin: int, end: int, tid: int,
+               fields: Optional[Dict[str, Any]] = None):
+        r"""Append one row to the columns.
+
+        Args:
+            begin: The begin offset of the annotation.
+            end: The end offset of the annotation.
+            tid: The tid of the annotation.
+            fields: The field values of this row if it is not represented
+                by an object, `None` otherwise.
+        """
+        self._own()
+        row = self._size
+        self._reserve(row + 1)
+        self._data[0, row] = begin
+        self._data[1, row] = end
+        self._data[2, row] = tid
+        self._size += 1
+
+        if fields:
+            for name in fields:
+                if name not in self._fields:
+                    self._fields[name] = [_ABSENT] * row
+        for name, column in self._fields.items():
+            column.append(
+                _ABSENT if fields is None else fields.get(name, _ABSENT))
+
+        self._invalidate()
+
+    def extend(self, begins: np.ndarray, ends: np.ndarray, tids: np.ndarray,
+               fields: Optional[Dict[str, List[Any]]] = None):
+        r"""Append a block of rows to the columns.
+
+        Args:
+            begins: The begin offsets of the annotations.
+            ends: The end offsets of the annotations.
+            tids: The tids of the annotations.
+            fields: The field columns of these rows, each value list should
+                have the same length as ``tids``, missing values should be
+                ``_ABSENT``. `None` if the rows are represented by objects.
+        """
+        self._own()
+        start = self._size
+        n = len(tids)
+        self._reserve(start + n)
+        self._data[0, start:start + n] = begins
+        self._data[1, start:start + n] = ends
+        self._data[2, start:start + n] = tids
+        self._size += n
+
+        if fields:
+            for name in fields:
+                if name not in self._fields:
+                    self._fields[name] = [_ABSENT] * start
+        for name, column in self._fields.items():
+            if fields is None or name not in fields:
+                column.extend([_ABSENT] * n)
+            else:
+                column.extend(fields[name])
+
+        self._invalidate()
+
+    def remove_row(self, row: int):
+        r"""Remove the row at position ``row``."""
+        self._own()
+        self._data[:, row:self._size - 1] = self._data[:, row + 1:self._size]
+        self._size -= 1
+        for column in self._fields.values():
+            column.pop(row)
+        self._invalidate()
+
+    def row_fields(self, row: int) -> Dict[str, Any]:
+        r"""Return the stored field values of ``row``. The mutable values are
+        copied if they may be referred to by other columns."""
+        fields = {name: column[row] for name, column in self._fields.items()
+                  if column[row] is not _ABSENT}
+        if self._aliased:
+            for name, value in fields.items():
+                if not isinstance(value, _IMMUTABLE_TYPES):
+                    fields[name] = copy.deepcopy(value)
+        return fields
+
+    def set_row_fields(self, row: int, fields: Dict[str, Any]):
+        r"""Store the field values of ``row``, the other fields of the row
+        are left absent."""
+        self._own()
+        for name, value in fields.items():
+            if name not in self._fields:
+                self._fields[name] = [_ABSENT] * self._size
+            self._fields[name][row] = value
+
+    def release_row(self, row: int):
+        r"""Drop the stored field values of ``row``, this is called once the
+        row is represented by an object. The values are kept while the field
+        lists are shared, to avoid copying the lists."""
+        if self._shared:
+            return
+        for column in self._fields.values():
+            column[row] = _ABSENT
+
+    def sorted_rows(self) -> np.ndarray:
+        r"""The row positions sorted by ``(begin, end, tid)``."""
+        if self._sorted_rows is None:
+            self._sorted_rows = np.lexsort((self.tid, self.end, self.begin))
+            self._sorted_begin = self.begin[self._sorted_rows]
+        return self._sorted_rows
+
+    def find_row(self, tid: int) -> int:
+        r"""Find the row position of the entry ``tid``, return -1 if the tid
+        is not stored here."""
+        if self._tid_rows is None:
+            self._tid_rows = np.argsort(self.tid, kind='stable')
+        tids = self.tid
+        pos = int(np.searchsorted(tids, tid, sorter=self._tid_rows))
+        if pos < len(tids) and tids[self._tid_rows[pos]] == tid:
+            return int(self._tid_rows[pos])
+        return -1
+
+    def rows_in_range(self, begin: int, end: int) -> np.ndarray:
+        r"""The sorted row positions whose span lies within ``[begin, end]``.
+        """
+        rows = self.sorted_rows()
+        sorted_begin = cast(np.ndarray, self._sorted_begin)
+        lo = int(np.searchsorted(sorted_begin, begin, side='left'))
+        hi = int(np.searchsorted(sorted_begin, end, side='right'))
+        rows = rows[lo:hi]
+        return rows[self.end[rows] <= end]
+
+
+class AnnotationStore:
+    r"""A columnar replacement of the sorted annotation list in a
+    :class:`~forte.data.data_pack.DataPack`, used when the pack is created
+    with ``columnar=True``.
+
+    The annotations of each concrete type are stored in
+    :class:`AnnotationColumns`. An :class:`Annotation` object is created only
+    when the row is accessed, and is cached afterwards, so that modifications
+    to the object are kept. The store provides the same sequence interface
+    as the sorted list, the order is by ``(begin, end, type, tid)``, same as
+    the ordering of :class:`Annotation`.
+
+    Args:
+        pack: The data pack that owns this store.
+    """
+
+    def __init__(self, pack: "DataPack"):
+        self._pack: "DataPack" = pack
+        self._columns: Dict[Type[Annotation], AnnotationColumns] = {}
+        self._objects: Dict[int, Annotation] = {}
+
+        # The global order, as pairs of (column index, row), built lazily.
+        self._order: Optional[Tuple[List[AnnotationColumns], np.ndarray,
+                                    np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return sum(len(c) for c in self._columns.values())
+
+    def columns(self, entry_type: Type[Annotation]
+                ) -> Iterator[AnnotationColumns]:
+        r"""Iterate the columns of ``entry_type`` and its subclasses."""
+        for t, c in self._columns.items():
+            if issubclass(t, entry_type) and len(c) > 0:
+                yield c
+
+    @property
+    def num_materialized(self) -> int:
+        r"""The number of annotations that are represented by objects."""
+        return len(self._objects)
+
+    def _get_columns(self, entry_type: Type[Annotation]) -> AnnotationColumns:
+        try:
+            return self._columns[entry_type]
+        except KeyError:
+            c = AnnotationColumns(entry_type)
+            self._columns[entry_type] = c
+            return c
+
+    def add(self, entry: Annotation):
+        r"""Add an annotation object to the store."""
+        self._get_columns(type(entry)).append(
+            entry.begin, entry.end, entry.tid)
+        self._objects[entry.tid] = entry
+        self._order = None
+
+    def add_row(self, entry_type: Type[Annotation], begin: int, end: int,
+                tid: int, fields: Dict[str, Any]):
+        r"""Add an annotation without creating the object, the object will be
+        created from ``fields`` when it is first accessed.
+
+        Args:
+            entry_type: The type of the annotation.
+            begin: The begin offset of the annotation.
+            end: The end offset of the annotation.
+            tid: The tid of the annotation.
+            fields: The field values of the annotation, in the same format of
+                the state produced by :meth:`Entry.__getstate__`.
+        """
+        self._get_columns(entry_type).append(begin, end, tid, fields)
+        self._order = None
+
+    def add_rows(self, entry_type: Type[Annotation], begins: np.ndarray,
+                 ends: np.ndarray, tids: np.ndarray,
+                 fields: Dict[str, List[Any]]):
+        r"""Add a block of annotations without creating the objects, see
+        :meth:`add_row`.
+
+        Args:
+            entry_type: The type of the annotations.
+            begins: The begin offsets of the annotations.
+            ends: The end offsets of the annotations.
+            tids: The tids of the annotations.
+            fields: The field columns of the annotations, each has a value
+                per annotation in the state format.
+        """
+        self._get_columns(entry_type).extend(begins, ends, tids, fields)
+        self._order = None
+
+    def discard(self, entry: Annotation) -> bool:
+        r"""Remove an annotation from the store.
+
+        Returns:
+            Whether the annotation is found and removed.
+        """
+        columns = self._columns.get(type(entry))
+        if columns is None:
+            return False
+        row = columns.find_row(entry.tid)
+        if row < 0:
+            return False
+        columns.remove_row(row)
+        self._objects.pop(entry.tid, None)
+        self._order = None
+        return True
+
+    def _materialize(self, columns: AnnotationColumns, row: int) -> Annotation:
+        tid = int(columns.tid[row])
+        obj = self._objects.get(tid)
+        if obj is None:
+            state = columns.row_fields(row)
+            state['_tid'] = tid
+            state['_begin'] = int(columns.begin[row])
+            state['_end'] = int(columns.end[row])
+            entry_type = columns.entry_type
+            obj = entry_type.__new__(entry_type)
+            obj.__setstate__(state)
+            obj.set_pack(self._pack)
+            columns.release_row(row)
+            self._objects[tid] = obj
+            self._pack.index.update_entry_index(obj)
+        return obj
+
+    def get_by_tid(self, tid: int) -> Optional[Annotation]:
+        r"""Get the annotation with ``tid``, return `None` if not found."""
+        obj = self._objects.get(tid)
+        if obj is not None:
+            return obj
+        for columns in self._columns.values():
+            row = columns.find_row(tid)
+            if row >= 0:
+                return self._materialize(columns, row)
+        return None
+
+    def iter_type(self, entry_type: Type[Annotation],
+                  begin: Optional[int] = None,
+                  end: Optional[int] = None,
+                  tids: Optional[Set[int]] = None) -> Iterator[Annotation]:
+        r"""Iterate the annotations of ``entry_type`` (and its subclasses) in
+        order. Only the returned annotations are materialized.
+
+        Args:
+            entry_type: The annotation type to iterate.
+            begin: If provided together with ``end``, only the annotations
+                within ``[begin, end]`` are returned.
+            end: See ``begin``.
+            tids: If provided, only the annotations whose tid is in this set
+                are returned.
+        """
+        parts = []
+        for columns in self.columns(entry_type):
+            if begin is None or end is None:
+                rows = columns.sorted_rows()
+            else:
+                rows = columns.rows_in_range(begin, end)
+            if tids is not None and len(rows) > 0:
+                rows = rows[[t in tids for t in columns.tid[rows].tolist()]]
+            if len(rows) > 0:
+                parts.append((columns, rows))
+
+        if len(parts) == 1:
+            columns, rows = parts[0]
+            for row in rows.tolist():
+                yield self._materialize(columns, row)
+        elif len(parts) > 1:
+            yield from self._iter_merged(parts)
+
+    def _iter_merged(self, parts) -> Iterator[Annotation]:
+        ranks = self._type_ranks(c for c, _ in parts)
+        begins = np.concatenate([c.begin[r] for c, r in parts])
+        ends = np.concatenate([c.end[r] for c, r in parts])
+        type_ranks = np.concatenate(
+            [np.full(len(r), ranks[c.entry_type]) for c, r in parts])
+        tids = np.concatenate([c.tid[r] for c, r in parts])
+        part_ids = np.concatenate(
+            [np.full(len(r), i) for i, (_, r) in enumerate(parts)])
+        rows = np.concatenate([r for _, r in parts])
+        order = np.lexsort((tids, type_ranks, ends, begins))
+        for p, row in zip(part_ids[order].tolist(), rows[order].tolist()):
+            yield self._materialize(parts[p][0], row)
+
+    @staticmethod
+    def _type_ranks(columns) -> Dict[Type, int]:
+        names = sorted({str(c.entry_type): c.entry_type for c in columns}
+                       .items())
+        return {t: i for i, (_, t) in enumerate(names)}
+
+    def _global_order(self):
+        if self._order is None:
+            all_columns = [c for c in self._columns.values() if len(c) > 0]
+            ranks = self._type_ranks(all_columns)
+            if all_columns:
+                begins = np.concatenate([c.begin for c in all_columns])
+                ends = np.concatenate([c.end for c in all_columns])
+                type_ranks = np.concatenate(
+                    [np.full(len(c), ranks[c.entry_type])
+                     for c in all_columns])
+                tids = np.concatenate([c.tid for c in all_columns])
+                col_ids = np.concatenate(
+                    [np.full(len(c), i) for i, c in enumerate(all_columns)])
+                rows = np.concatenate(
+                    [np.arange(len(c)) for c in all_columns])
+                order = np.lexsort((tids, type_ranks, ends, begins))
+                self._order = (all_columns, col_ids[order], rows[order])
+            else:
+                self._order = ([], np.empty(0, dtype=np.int64),
+                               np.empty(0, dtype=np.int64))
+        return self._order
+
+    def __iter__(self) -> Iterator[Annotation]:
+        all_columns, col_ids, rows = self._global_order()
+        for c, r in zip(col_ids.tolist(), rows.tolist()):
+            yield self._materialize(all_columns[c], r)
+
+    @overload
+    def __getitem__(self, index: int) -> Annotation:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Annotation]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[Annotation, List[Annotation]]:
+        all_columns, col_ids, rows = self._global_order()
+        if isinstance(index, slice):
+            return [self._materialize(all_columns[c], r) for c, r in
+                    zip(col_ids[index].tolist(), rows[index].tolist())]
+        return self._materialize(all_columns[col_ids[index]], rows[index])
+
+    def _key(self, pos: int) -> Tuple[int, int, str, int]:
+        all_columns, col_ids, rows = self._global_order()
+        c = all_columns[col_ids[pos]]
+        r = rows[pos]
+        return (int(c.begin[r]), int(c.end[r]), str(c.entry_type),
+                int(c.tid[r]))
+
+    def bisect_left(self, entry: Annotation) -> int:
+        key = (entry.begin, entry.end, str(type(entry)), entry.tid)
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def bisect_right(self, entry: Annotation) -> int:
+        key = (entry.begin, entry.end, str(type(entry)), entry.tid)
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key < self._key(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    bisect = bisect_right
+
+    def pop(self, index: int = -1) -> Annotation:
+        entry = self[index]
+        self.discard(entry)
+        return entry
+
+    def __contains__(self, entry: Annotation) -> bool:
+        return any(e == entry for e in self.iter_type(
+            type(entry), entry.begin, entry.end))
+
+    def index(self, entry: Annotation) -> int:
+        for i in range(self.bisect_left(entry), len(self)):
+            if self[i] == entry:
+                return i
+        raise ValueError(f"{entry} is not in the store.")
+
+    def fork(self, pack: "DataPack",
+             entry_types: Optional[Tuple[Type, ...]] = None
+             ) -> "AnnotationStore":
+        r"""Create a store for ``pack`` that shares the columns of this store
+        copy-on-write (see :meth:`AnnotationColumns.share`), so only the
+        columns that are modified afterwards by either store are copied. The
+        annotations already represented by objects in this store are copied
+        into the columns of the new store, the new store creates its own
+        objects.
+
+        Args:
+            pack: The data pack that owns the new store.
+            entry_types (tuple, optional): If given, only the annotations of
+                these types (and their sub-types) are kept in the new store.
+
+        Returns:
+            The new store.
+        """
+        store = AnnotationStore(pack)
+        for entry_type, columns in self._columns.items():
+            if len(columns) == 0:
+                continue
+            if entry_types is not None and \
+                    not issubclass(entry_type, entry_types):
+                continue
+            store._columns[entry_type] = columns.share()
+
+        for tid, obj in self._objects.items():
+            columns = store._columns.get(type(obj))
+            if columns is None:
+                continue
+            row_state = obj.__getstate__()
+            for f in _ROW_FIELDS:
+                row_state.pop(f, None)
+            columns.set_row_fields(
+                columns.find_row(tid), copy.deepcopy(row_state))
+        return store
+
+    def dump_state(self, entry_types: Optional[Tuple[Type, ...]] = None
+                   ) -> List[Dict[str, Any]]:
+        r"""The columnar state, each annotation type is stored as one block of
+        ``begin``, ``end`` and ``tid`` lists, plus one list per field. The
+        fields missing in some rows are recorded in ``absent``.
+
+        Args:
+            entry_types (tuple, optional): If given, only the annotations of
+                these types (and their sub-types) are dumped.
+        """
+        blocks = []
+        for entry_type, columns in self._columns.items():
+            if len(columns) == 0:
+                continue
+            if entry_types is not None and \
+                    not issubclass(entry_type, entry_types):
+                continue
+            tids = columns.tid.tolist()
+            fields, absent = to_columns(
+                self._row_state(columns, row, tid)
+                for row, tid in enumerate(tids))
+            blocks.append({
+                'entry_type': columns.entry_type,
+                'begin': columns.begin.tolist(),
+                'end': columns.end.tolist(),
+                'tid': tids,
+                'fields': fields,
+                'absent': absent,
+            })
+        return blocks
+
+    def _row_state(self, columns: AnnotationColumns, row: int, tid: int
+                   ) -> Dict[str, Any]:
+        obj = self._objects.get(tid)
+        if obj is None:
+            return columns.row_fields(row)
+        row_state = obj.__getstate__()
+        for f in _ROW_FIELDS:
+            row_state.pop(f, None)
+        return row_state
+
+    def load_state(self, blocks: List[Dict[str, Any]]):
+        r"""Load the blocks produced by :meth:`dump_state`, no annotation
+        object is created during the loading."""
+        for block in blocks:
+            fields: Dict[str, List[Any]] = {}
+            for name, values in block['fields'].items():
+                column = list(values)
+                for row in block['absent'].get(name, ()):
+                    column[row] = _ABSENT
+                fields[name] = column
+            self._get_columns(block['entry_type']).extend(
+                np.asarray(block['begin'], dtype=np.int64),
+                np.asarray(block['end'], dtype=np.int64),
+                np.asarray(block['tid'], dtype=np.int64),
+                fields)
+        self._order = None
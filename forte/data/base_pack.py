@@ -15,7 +15,8 @@
 import copy
 from abc import abstractmethod
 from typing import (
-    List, Optional, Set, Type, TypeVar, Union, Iterator, Dict, Tuple, Any)
+    List, Optional, Set, Type, TypeVar, Union, Iterator, Dict, Tuple, Any,
+    Iterable)
 import uuid
 
 import jsonpickle
@@ -213,6 +214,23 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
     def view(self):
         return copy.deepcopy(self)
 
+    def snapshot(self, entry_types: Optional[Iterable[Type[Entry]]] = None):
+        r"""Create a copy of the pack that keeps only the entries of the
+        given types (and their sub-types), such as the gold copy used by an
+        evaluator. The entries referred to by the kept entries are not kept
+        unless their types are given as well. By default this is a full copy
+        as :meth:`view`.
+
+        Args:
+            entry_types (iterable, optional): The entry types to keep. If
+                `None`, all the entries are kept.
+
+        Returns:
+            The copy of the pack.
+        """
+        # pylint: disable=unused-argument
+        return self.view()
+
     def set_control_component(self, component: str):
         """
         Record the current component that is taking control of this pack.
@@ -238,6 +256,22 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             except KeyError:
                 self.creation_records[c] = {entry.tid}
 
+    def record_entries(self, tids: Iterable[int],
+                       component_name: Optional[str] = None):
+        r"""Record the creation of the entries of ``tids`` at once, see
+        :meth:`record_entry`."""
+        c = component_name
+
+        if c is None:
+            # Use the auto-inferred control component.
+            c = self.__control_component
+
+        if c is not None:
+            try:
+                self.creation_records[c].update(tids)
+            except KeyError:
+                self.creation_records[c] = set(tids)
+
     def record_field(self, entry_id: int, field_name: str):
         """
         Record who modifies the entry, will be called
@@ -368,11 +402,25 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
              and also includes instances of the subclasses of entry_type).
         """
         subclass_index: Set[int] = set()
-        for index_key, index_val in self.index.iter_type_index():
-            if issubclass(index_key, entry_type):
-                subclass_index.update(index_val)
+        for tids in self.index.type_ids(entry_type):
+            subclass_index.update(tids)
         return subclass_index
 
+    def iter_ids_by_type(self, entry_type: Type[EntryType]) -> Iterator[int]:
+        r"""Iterate the tids of ``entry_type`` (and its subclasses) directly
+        from the type_index, without copying them into a new set like
+        :meth:`get_ids_by_type`. Entries of these types should not be added
+        or removed during the iteration.
+
+        Args:
+            entry_type: The type of the entry you are looking for.
+
+        Returns:
+             An iterator of entry tids.
+        """
+        for tids in self.index.type_ids(entry_type):
+            yield from tids
+
     def get_entries_by_type(
             self, entry_type: Type[EntryType]) -> List[EntryType]:
         """
@@ -15,22 +15,30 @@
 # pylint: disable=attribute-defined-outside-init
 
 from abc import abstractmethod
+from collections import defaultdict
 from typing import (
-    Dict, List, Iterable, Union, Optional, Tuple, Type, Generic, Iterator, Any)
+    Dict, List, Iterable, Union, Optional, Tuple, Type, Generic, Iterator, Any,
+    DefaultDict)
+
+import numpy as np
 
 from forte.common.configuration import Config
 from forte.data.base_pack import PackType
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.types import DataRequest
-from forte.data.data_utils_io import merge_batches, batch_instances
+from forte.data.data_utils_io import (
+    merge_batches, batch_instances, slice_columnar_data, take_columnar_data)
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.core import Entry
 
 __all__ = [
     "ProcessingBatcher",
     "FixedSizeDataPackBatcher",
+    "TokenBudgetDataPackBatcher",
+    "LengthBucketingDataPackBatcher",
     "FixedSizeMultiPackProcessingBatcher",
+    "FixedSizePackBatcher",
 ]
 
 
@@ -88,6 +96,27 @@ class ProcessingBatcher(Generic[PackType]):
             self.current_batch = {}
             self.current_batch_sources = []
 
+    def finished_pool_end(self, batch_packed: bool) -> Optional[int]:
+        r"""The packs in :attr:`data_pack_pool` whose instances are all
+        packed, they are removed from the pool by ``update_batcher_pool`` of
+        the :mod:`~forte.processors.base.batch_processor`.
+
+        Args:
+            batch_packed (bool): `True` if this is called after a batch is
+                packed, `False` if this is called after all the batches of a
+                new pack are packed.
+
+        Returns:
+            The ``end`` argument of ``update_batcher_pool``.
+        """
+        if batch_packed:
+            # The batches are made sequentially, so only the last pack can
+            # have instances left.
+            return -1
+        if len(self.current_batch_sources) == 0:
+            return None
+        return 0
+
     def get_batch(
             self, input_pack: PackType, context_type: Type[Annotation],
             requests: DataRequest) -> Iterator[Dict]:
@@ -148,29 +177,33 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
             requests: Optional[Dict[Type[Entry], Union[Dict, List]]] = None,
             offset: int = 0) -> Iterable[Tuple[Dict, int]]:
         r"""Try to get batches from a dataset  with ``batch_size``, but will
-        yield an incomplete batch if the data_pack is exhausted.
+        yield an incomplete batch if the data_pack is exhausted. The data of
+        the whole pack is fetched at once with
+        :meth:`~forte.data.data_pack.DataPack.get_columnar_data`, and the
+        batches are sliced from it.
 
         Returns:
             An iterator of tuples ``(batch, cnt)``, ``batch`` is a dict
             containing the required annotations and context, and ``cnt`` is
             the number of instances in the batch.
         """
-        instances: List[Dict] = []
         current_size = sum(self.current_batch_sources)
-
-        for data in data_pack.get_data(context_type, requests, offset):
-            instances.append(data)
-            if len(instances) == self.batch_size - current_size:
-                batch = batch_instances(instances)
-                self.batch_is_full = True
-                yield (batch, len(instances))
-                instances = []
-                self.batch_is_full = False
+        size = max(self.batch_size - current_size, 1)
+
+        data = data_pack.get_columnar_data(context_type, requests, offset)
+        num_instances = len(data["context"])
+        start = 0
+        while num_instances - start >= size:
+            batch = slice_columnar_data(data, start, start + size)
+            self.batch_is_full = True
+            yield (batch, size)
+            start += size
+            self.batch_is_full = False
 
         # Flush the remaining data.
-        if len(instances) > 0:
-            batch = batch_instances(instances)
-            yield (batch, len(instances))
+        if start < num_instances:
+            batch = slice_columnar_data(data, start, num_instances)
+            yield (batch, num_instances - start)
 
     @classmethod
     def default_configs(cls) -> Dict:
@@ -179,6 +212,209 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
         }
 
 
+# An instance waiting in a buffered batcher: the pack, the index of the
+# instance in the columnar data of the pack, and the length of the instance.
+_Instance = Tuple[DataPack, int, int]
+
+
+class _BufferedDataPackBatcher(ProcessingBatcher[DataPack]):
+    r"""The base class of the batchers that buffer the instances of the packs
+    and choose the instances of each batch by their lengths. The instances of
+    a batch can come from any packs in :attr:`data_pack_pool`, they are
+    grouped by the packs in the batch so that the results are written back
+    to the right packs by
+    :meth:`~forte.processors.base.batch_processor.BaseBatchProcessor.pack_all`.
+
+    The length of an instance is the number of entries of ``length_type`` in
+    the instance, or the number of characters of the context if
+    ``length_type`` is `None` and no annotation is requested. A batch holds
+    at most ``batch_size`` instances, and at most ``max_tokens`` tokens
+    after padding, i.e. the number of instances times the longest length. An
+    instance longer than ``max_tokens`` is put in a batch by itself.
+    """
+
+    def __init__(self, cross_pack: bool = True):
+        super().__init__(cross_pack)
+        self.max_tokens: Optional[int] = None
+        self.batch_size: Optional[int] = None
+        self.length_type: Optional[str] = None
+        self._data: Dict[int, Dict[str, Any]] = {}
+        self._num_pending: DefaultDict[int, int] = defaultdict(int)
+        self._pending: List[_Instance] = []
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        self.max_tokens = config.max_tokens
+        self.batch_size = config.batch_size
+        self.length_type = config.length_type
+        if self.max_tokens is None and self.batch_size is None:
+            raise ValueError(
+                "One of max_tokens and batch_size should be given.")
+        self._data.clear()
+        self._num_pending.clear()
+        self._pending.clear()
+
+    def _should_yield(self) -> bool:
+        return False
+
+    @abstractmethod
+    def _next_batches(self, final: bool) -> List[List[_Instance]]:
+        r"""Take the instances of the next batches from the buffer.
+
+        Args:
+            final (bool): Whether no more instances will come, i.e. all the
+                buffered instances should be batched.
+        """
+        raise NotImplementedError
+
+    def get_batch(
+            self, input_pack: DataPack, context_type: Type[Annotation],
+            requests: DataRequest) -> Iterator[Dict]:
+        self.data_pack_pool.append(input_pack)
+        data = input_pack.get_columnar_data(context_type, requests)
+        lengths = self._instance_lengths(data)
+        if lengths:
+            self._data[id(input_pack)] = data
+            self._num_pending[id(input_pack)] = len(lengths)
+            self._pending.extend(
+                (input_pack, i, length) for i, length in enumerate(lengths))
+
+        for instances in self._next_batches(not self.cross_pack):
+            yield self._make_batch(instances)
+            self.current_batch = {}
+            self.current_batch_sources = []
+
+    def flush(self) -> Iterator[Dict]:
+        for instances in self._next_batches(True):
+            yield self._make_batch(instances)
+            self.current_batch = {}
+            self.current_batch_sources = []
+
+    def finished_pool_end(self, batch_packed: bool) -> Optional[int]:
+        end = 0
+        for pack in self.data_pack_pool:
+            if self._num_pending[id(pack)] > 0:
+                break
+            del self._num_pending[id(pack)]
+            end += 1
+        return end
+
+    def _instance_lengths(self, data: Dict[str, Any]) -> List[int]:
+        length_type = self.length_type
+        if length_type is None:
+            length_type = next((k for k, v in data.items()
+                                if isinstance(v, dict)), None)
+        if length_type is None:
+            return [len(context) for context in data["context"]]
+        return np.diff(data[length_type]["row_splits"]).tolist()
+
+    def _split(self, instances: List[_Instance]) -> List[List[_Instance]]:
+        r"""Split the instances in order into the batches within the
+        budget."""
+        batches: List[List[_Instance]] = []
+        batch: List[_Instance] = []
+        max_length = 0
+        for instance in instances:
+            length = max(max_length, instance[2])
+            if batch and (
+                    (self.batch_size is not None and
+                     len(batch) >= self.batch_size) or
+                    (self.max_tokens is not None and
+                     (len(batch) + 1) * length > self.max_tokens)):
+                batches.append(batch)
+                batch = []
+                length = instance[2]
+            batch.append(instance)
+            max_length = length
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _make_batch(self, instances: List[_Instance]) -> Dict:
+        positions = {id(pack): i for i, pack in enumerate(self.data_pack_pool)}
+        indices: DefaultDict[int, List[int]] = defaultdict(list)
+        for pack, index, _ in instances:
+            indices[positions[id(pack)]].append(index)
+
+        batches: List[Dict] = []
+        self.current_batch_sources = []
+        for i, pack in enumerate(self.data_pack_pool):
+            pack_indices = sorted(indices.get(i, []))
+            self.current_batch_sources.append(len(pack_indices))
+            if not pack_indices:
+                continue
+            batches.append(take_columnar_data(self._data[id(pack)],
+                                              pack_indices))
+            self._num_pending[id(pack)] -= len(pack_indices)
+            if self._num_pending[id(pack)] == 0:
+                del self._data[id(pack)]
+        self.current_batch = merge_batches(batches)
+        return self.current_batch
+
+
+class TokenBudgetDataPackBatcher(_BufferedDataPackBatcher):
+    r"""A batcher that batches the instances in order, like
+    :class:`FixedSizeDataPackBatcher`, but limits the number of tokens
+    (after padding) of each batch with ``max_tokens`` instead of only the
+    number of instances, see :class:`_BufferedDataPackBatcher`.
+    """
+
+    def _next_batches(self, final: bool) -> List[List[_Instance]]:
+        batches = self._split(self._pending)
+        if (not final and batches and
+                (self.batch_size is None or
+                 len(batches[-1]) < self.batch_size)):
+            # The last batch may take the instances of the next packs.
+            self._pending = batches.pop()
+        else:
+            self._pending = []
+        return batches
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            'max_tokens': 2000,
+            'batch_size': None,
+            'length_type': None,
+        }
+
+
+class LengthBucketingDataPackBatcher(_BufferedDataPackBatcher):
+    r"""A batcher that buffers up to ``window_size`` instances, possibly
+    from several packs, and batches the buffered instances sorted by their
+    lengths, so that the instances in a batch have similar lengths and
+    little padding. The batches are limited by ``max_tokens`` and
+    ``batch_size``, see :class:`_BufferedDataPackBatcher`.
+
+    A pack is finished only when all its instances are packed, so the packs
+    are held for at most ``window_size`` instances.
+    """
+
+    def __init__(self, cross_pack: bool = True):
+        super().__init__(cross_pack)
+        self.window_size: int = 0
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        self.window_size = config.window_size
+
+    def _next_batches(self, final: bool) -> List[List[_Instance]]:
+        if not final and len(self._pending) < self.window_size:
+            return []
+        instances = sorted(self._pending, key=lambda instance: instance[2])
+        self._pending = []
+        return self._split(instances)
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            'max_tokens': 2000,
+            'batch_size': None,
+            'length_type': None,
+            'window_size': 500,
+        }
+
+
 class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
     r"""A Batcher used in ``MultiPackBatchProcessors``.
 
@@ -244,3 +480,47 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
             'batch_size': 10,
             'input_pack_name': 'source'
         }
+
+
+class FixedSizePackBatcher(ProcessingBatcher[PackType]):
+    r"""A batcher that batches the packs themselves, each pack is one
+    instance in the batches, which are dicts with the packs in ``"pack"``.
+    This is used by the processors which build their inputs from the whole
+    pack instead of the entries in a context, e.g.
+    :class:`~forte.processors.base.query_processor.BatchQueryProcessor`
+    builds one query from each multi pack.
+    """
+
+    def __init__(self, cross_pack: bool = True):
+        super().__init__(cross_pack)
+        self.batch_is_full = False
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        self.batch_size = config.batch_size
+        self.batch_is_full = False
+
+    def _should_yield(self) -> bool:
+        return self.batch_is_full
+
+    def _get_data_batch(
+            self, data_pack: PackType, context_type: Type[Annotation],
+            requests: Optional[DataRequest] = None,
+            offset: int = 0) -> Iterable[Tuple[Dict, int]]:
+        r"""Add ``data_pack`` as one instance to the current batch, the
+        ``context_type`` and ``requests`` are not used.
+
+        Returns:
+            An iterator of one tuple ``(batch, 1)``, ``batch`` is a dict
+            containing the pack in ``"pack"``.
+        """
+        self.batch_is_full = \
+            sum(self.current_batch_sources) + 1 >= self.batch_size
+        yield {'pack': [data_pack]}, 1
+        self.batch_is_full = False
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            'batch_size': 32
+        }
@@ -0,0 +1,351 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A binary serialization format for packs. Instead of encoding every entry as
+a JSON object, the entries of each type are stored as one block: the tids
+(and the spans of annotations) are packed into integer arrays, and the
+fields are stored as one column per field name. Type names and field names
+are only stored once per block, together with the schema of each type so
+that changes of the ontology can be detected when reading.
+
+The blocks are then encoded with :mod:`pickle`, so similar to the
+``jsonpickle`` format, the data should only be read from trusted sources.
+Everything in a block except the type name and the tids is pickled
+separately, so a :class:`~forte.data.data_pack.DataPack` can be loaded
+partially: the blocks of the types that are not requested are kept encoded
+until they are accessed, and are written back as they are.
+"""
+import dataclasses
+import logging
+import pickle
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+import numpy as np
+
+from forte.data.annotation_store import to_columns
+from forte.data.ontology.core import Entry
+from forte.data.ontology.top import Annotation
+from forte.utils.utils import get_full_module_name, get_class
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "BINARY_FORMAT_VERSION",
+    "SERIALIZE_METHODS",
+    "serialize_binary",
+    "deserialize_binary",
+    "is_binary",
+    "pack_suffix",
+    "decode_block",
+    "decode_entries",
+    "EncodedBlock",
+]
+
+# The version of the layout below, increase it when the layout changes.
+BINARY_FORMAT_VERSION = 2
+
+SERIALIZE_METHODS = ("jsonpickle", "binary")
+
+_MAGIC = b"FTPK"
+_PICKLE_PROTOCOL = 4
+_ENTRY_LISTS = ("annotations", "links", "groups", "generics")
+
+
+def pack_suffix(serialize_method: str) -> str:
+    r"""The file suffix used for the packs serialized with
+    ``serialize_method``."""
+    if serialize_method == "jsonpickle":
+        return ".json"
+    if serialize_method == "binary":
+        return ".bin"
+    raise ValueError(
+        f"Unknown serialize method {serialize_method}, it should be one of "
+        f"{SERIALIZE_METHODS}.")
+
+
+def is_binary(data: Union[str, bytes]) -> bool:
+    r"""Whether ``data`` is a pack serialized by :func:`serialize_binary`."""
+    return isinstance(data, (bytes, bytearray)) and data[:4] == _MAGIC
+
+
+def _encode_entries(entries: List[Entry]) -> List[Dict[str, Any]]:
+    by_type: Dict[type, List[Entry]] = {}
+    for entry in entries:
+        by_type.setdefault(type(entry), []).append(entry)
+
+    blocks = []
+    for entry_type, typed_entries in by_type.items():
+        states = [e.__getstate__() for e in typed_entries]
+        block: Dict[str, Any] = {
+            "entry_type": get_full_module_name(entry_type),
+            "tid": np.fromiter((s.pop("_tid") for s in states),
+                               np.int64, len(states)).tobytes(),
+        }
+        if issubclass(entry_type, Annotation):
+            spans = [s.pop("_span") for s in states]
+            block["begin"] = np.fromiter(
+                (span.begin for span in spans), np.int64,
+                len(spans)).tobytes()
+            block["end"] = np.fromiter(
+                (span.end for span in spans), np.int64, len(spans)).tobytes()
+        block["fields"], block["absent"] = to_columns(states)
+        blocks.append(block)
+    return blocks
+
+
+def _encode_columnar(blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    encoded = []
+    for block in blocks:
+        encoded.append({
+            "entry_type": get_full_module_name(block["entry_type"]),
+            "tid": np.asarray(block["tid"], dtype=np.int64).tobytes(),
+            "begin": np.asarray(block["begin"], dtype=np.int64).tobytes(),
+            "end": np.asarray(block["end"], dtype=np.int64).tobytes(),
+            "fields": block["fields"],
+            "absent": block["absent"],
+        })
+    return encoded
+
+
+def _seal(block: Dict[str, Any]) -> Dict[str, Any]:
+    # Only the type name and the tids are readable without unpickling the
+    # rest of the block.
+    sealed = {"entry_type": block.pop("entry_type"), "tid": block.pop("tid")}
+    sealed["data"] = pickle.dumps(block, protocol=_PICKLE_PROTOCOL)
+    return sealed
+
+
+def _locate(type_name: str, types: Dict[str, type]) -> type:
+    try:
+        return types[type_name]
+    except KeyError:
+        types[type_name] = get_class(type_name)
+        return types[type_name]
+
+
+def decode_block(block: Dict[str, Any],
+                 types: Optional[Dict[str, type]] = None) -> Dict[str, Any]:
+    r"""Decode an encoded block of entries, the tids and spans are read as
+    numpy arrays.
+
+    Args:
+        block: The encoded block.
+        types (optional): A cache from the type names to the types.
+
+    Returns:
+        The decoded block, in the same layout as
+        :meth:`~forte.data.annotation_store.AnnotationStore.dump_state`.
+    """
+    decoded = dict(block)
+    if "data" in decoded:
+        decoded.update(pickle.loads(decoded.pop("data")))
+    decoded["entry_type"] = _locate(
+        block["entry_type"], {} if types is None else types)
+    for key in ("tid", "begin", "end"):
+        if key in decoded:
+            decoded[key] = np.frombuffer(decoded[key], dtype=np.int64)
+    return decoded
+
+
+def decode_entries(block: Dict[str, Any]) -> List[Entry]:
+    r"""Create the entry objects of a block decoded by :func:`decode_block`.
+    """
+    entry_type = block["entry_type"]
+    tids = block["tid"].tolist()
+    states: List[Dict[str, Any]] = [{"_tid": tid} for tid in tids]
+    if "begin" in block:
+        for state, begin, end in zip(
+                states, block["begin"].tolist(), block["end"].tolist()):
+            state["_begin"], state["_end"] = begin, end
+    for name, column in block["fields"].items():
+        for state, value in zip(states, column):
+            state[name] = value
+        for row in block["absent"].get(name, ()):
+            states[row].pop(name)
+
+    entries = []
+    for state in states:
+        entry = entry_type.__new__(entry_type)
+        entry.__setstate__(state)
+        entries.append(entry)
+    return entries
+
+
+def _decode_annotations(blocks: List[Dict[str, Any]]) -> List[Entry]:
+    entries = [e for block in blocks for e in decode_entries(block)]
+    if len(blocks) > 1:
+        # Put the annotations in the sorted order, so the sorted list can be
+        # created without many comparisons between the annotation objects.
+        names = sorted(str(block["entry_type"]) for block in blocks)
+        ranks = np.concatenate([
+            np.full(len(block["tid"]), names.index(str(block["entry_type"])))
+            for block in blocks])
+        order = np.lexsort((
+            np.concatenate([block["tid"] for block in blocks]), ranks,
+            np.concatenate([block["end"] for block in blocks]),
+            np.concatenate([block["begin"] for block in blocks])))
+        entries = [entries[i] for i in order.tolist()]
+    return entries
+
+
+def _schema(blocks: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    return {block["entry_type"]: sorted(block["fields"]) for block in blocks}
+
+
+class EncodedBlock:
+    r"""A block of entries of one type that is kept encoded after a partial
+    deserialization by :func:`deserialize_binary`.
+
+    Args:
+        key (str): The name of the entry list of the pack that the entries
+            belong to, such as `"annotations"` or `"links"`.
+        entry_type (type): The type of the entries.
+        raw (dict): The encoded block.
+        fields (list): The field names of the entries, which is kept for the
+            schema when the block is written back.
+    """
+
+    def __init__(self, key: str, entry_type: Type[Entry],
+                 raw: Dict[str, Any], fields: List[str]):
+        self.key = key
+        self.entry_type = entry_type
+        self.raw = raw
+        self.fields = fields
+        self.tids: np.ndarray = np.frombuffer(raw["tid"], dtype=np.int64)
+
+    def decode(self) -> Dict[str, Any]:
+        r"""Decode the block with :func:`decode_block`."""
+        return decode_block(self.raw, {
+            self.raw["entry_type"]: self.entry_type})
+
+
+def _check_schema(schema: Dict[str, List[str]], types: Dict[str, type]):
+    for type_name, stored_fields in schema.items():
+        entry_type = _locate(type_name, types)
+        if not dataclasses.is_dataclass(entry_type):
+            continue
+        missing = [f.name for f in dataclasses.fields(entry_type)
+                   if f.name not in stored_fields]
+        if missing:
+            logger.warning(
+                "The ontology type %s has changed since the pack is "
+                "serialized, the fields %s are not found in the pack.",
+                type_name, missing)
+
+
+def serialize_binary(pack, drop_record: Optional[bool] = False) -> bytes:
+    r"""Serialize a pack to bytes in the binary format.
+
+    Args:
+        pack: The :class:`~forte.data.data_pack.DataPack` or
+            :class:`~forte.data.multi_pack.MultiPack` to be serialized.
+        drop_record (bool): Whether to drop the creation records and field
+            records in the serialization.
+
+    Returns:
+        The serialized bytes.
+    """
+    if drop_record:
+        pack.creation_records.clear()
+        pack.field_records.clear()
+
+    state = pack.__getstate__()
+    schema: Dict[str, List[str]] = {}
+    for key in _ENTRY_LISTS:
+        if key not in state:
+            continue
+        if key == "annotations" and state.get("_columnar", False):
+            blocks = _encode_columnar(state[key])
+        else:
+            blocks = _encode_entries(state[key])
+        schema.update(_schema(blocks))
+        state[key] = [_seal(block) for block in blocks]
+
+    # The blocks that are not decoded since the pack is read are written
+    # back as they are.
+    for encoded in state.pop("_lazy_blocks", ()):
+        state[encoded.key].append(encoded.raw)
+        schema[encoded.raw["entry_type"]] = encoded.fields
+
+    payload = {
+        "version": BINARY_FORMAT_VERSION,
+        "pack_type": get_full_module_name(pack),
+        "schema": schema,
+        "state": state,
+    }
+    return _MAGIC + pickle.dumps(payload, protocol=_PICKLE_PROTOCOL)
+
+
+def deserialize_binary(data: bytes,
+                       entry_types: Optional[Iterable[Type[Entry]]] = None):
+    r"""Deserialize a pack from the bytes produced by
+    :func:`serialize_binary`.
+
+    Args:
+        data (bytes): The serialized bytes.
+        entry_types (optional): The entry types to be decoded (including
+            their subclasses). If it is given, the entries of the other types
+            in a :class:`~forte.data.data_pack.DataPack` are kept as
+            :class:`EncodedBlock` and decoded on first access, an empty list
+            means all the entries are decoded on demand. By default all the
+            entries are decoded.
+
+    Returns:
+        The deserialized pack.
+    """
+    if not is_binary(data):
+        raise ValueError("The data is not a pack in the binary format.")
+
+    payload = pickle.loads(data[len(_MAGIC):])
+    if payload["version"] > BINARY_FORMAT_VERSION:
+        raise ValueError(
+            f"The pack is serialized with the binary format version "
+            f"{payload['version']}, which is newer than the supported "
+            f"version {BINARY_FORMAT_VERSION}.")
+    types: Dict[str, type] = {}
+    _check_schema(payload["schema"], types)
+
+    pack_type = get_class(payload["pack_type"])
+    eager_types = None
+    if entry_types is not None and hasattr(pack_type, "load_lazy_entries"):
+        eager_types = tuple(entry_types)
+
+    state = payload["state"]
+    lazy_blocks: List[EncodedBlock] = []
+    for key in _ENTRY_LISTS:
+        if key not in state:
+            continue
+        blocks = []
+        for raw in state[key]:
+            entry_type: Type[Entry] = _locate(raw["entry_type"], types)
+            if eager_types is None or issubclass(entry_type, eager_types):
+                blocks.append(decode_block(raw, types))
+            else:
+                lazy_blocks.append(EncodedBlock(
+                    key, entry_type, raw,
+                    payload["schema"].get(raw["entry_type"], [])))
+        if key == "annotations" and state.get("_columnar", False):
+            # Columnar packs load the blocks directly, the annotation
+            # objects are only created when accessed.
+            state[key] = blocks
+        elif key == "annotations":
+            state[key] = _decode_annotations(blocks)
+        else:
+            state[key] = [e for block in blocks for e in decode_entries(block)]
+    if lazy_blocks:
+        state["_lazy_blocks"] = lazy_blocks
+
+    pack = pack_type.__new__(pack_type)
+    pack.__setstate__(state)
+    return pack
@@ -19,7 +19,8 @@ Forte Container module.
 # pylint: disable=function-redefined,multiple-statements
 
 from abc import abstractmethod
-from typing import Dict, Generic, Set, Tuple, TypeVar
+from contextlib import contextmanager
+from typing import Dict, Generic, Iterator, Set, Tuple, TypeVar
 
 from forte.data.span import Span
 
@@ -59,6 +60,12 @@ class EntryIdManager:
         self.__id_counter += 1
         return i
 
+    def get_ids(self, num: int) -> range:
+        r"""Allocate a block of ``num`` consecutive ids."""
+        start = self.__id_counter
+        self.__id_counter += num
+        return range(start, start + num)
+
     def current_id_counter(self) -> int:
         return self.__id_counter
 
@@ -127,8 +134,23 @@ class EntryContainer(Generic[E, L, G]):
     def get_span_text(self, span: Span):
         raise NotImplementedError
 
+    @contextmanager
+    def moving_entry(self, entry: E) -> Iterator[None]:
+        r"""The span of ``entry`` is changed within this context. The
+        containers which order or index the entries by their spans should
+        take the entry out before the change and put it back afterwards.
+
+        Args:
+            entry: The entry to be moved.
+        """
+        # pylint: disable=unused-argument
+        yield
+
     def get_next_id(self):
         return self._id_manager.get_id()
 
+    def get_next_ids(self, num: int) -> range:
+        return self._id_manager.get_ids(num)
+
 
 ContainerType = TypeVar("ContainerType", bound=EntryContainer)
@@ -12,19 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import logging
-from typing import (Dict, Iterable, Iterator, List, Optional, Type, Union, Any,
-                    Set, Callable, Tuple)
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import (DefaultDict, Dict, Iterable, Iterator, List, Optional,
+                    Type, Union, Any, Set, Callable, Tuple, Sequence)
 
 import numpy as np
 from sortedcontainers import SortedList
 
 from forte.common.exception import ProcessExecutionException
 from forte.data import data_utils_io
+from forte.data.annotation_store import _IMMUTABLE_TYPES, AnnotationStore
 from forte.data.base_pack import BaseMeta, BasePack
-from forte.data.index import BaseIndex
-from forte.data.ontology.core import Entry
-from forte.data.ontology.core import EntryType
+from forte.data.binary_io import EncodedBlock, decode_entries
+from forte.data.index import BaseIndex, SpanIndex
+from forte.data.container import BasePointer
+from forte.data.ontology.core import (
+    Entry, EntryType, FDict, FList, check_field_values)
 from forte.data.ontology.top import (
     Annotation, Link, Group, SinglePackEntries, Generics)
 from forte.data.span import Span
@@ -37,6 +43,10 @@ __all__ = [
     "DataPack",
 ]
 
+# The default field states of the annotation types created in bulk in the
+# columnar mode, `None` if the defaults cannot be copied from a prototype.
+_default_states: Dict[Type[Annotation], Optional[Dict[str, Any]]] = {}
+
 
 class Meta(BaseMeta):
     r"""Basic Meta information associated with each instance of
@@ -66,13 +76,21 @@ class DataPack(BasePack[Entry, Link, Group]):
 
     Args:
         pack_name (str, optional): A name for this data pack.
+        columnar (bool, optional): Whether to store the annotations in the
+            columnar :class:`~forte.data.annotation_store.AnnotationStore`
+            instead of a sorted list of objects. In the columnar mode the
+            annotation objects are created only when they are accessed, which
+            saves memory and time for large packs. Default is `False`.
     """
 
-    def __init__(self, pack_name: Optional[str] = None):
+    def __init__(self, pack_name: Optional[str] = None,
+                 columnar: bool = False):
         super().__init__(pack_name)
         self._text = ""
+        self._columnar: bool = columnar
 
-        self.annotations: SortedList[Annotation] = SortedList()
+        self.annotations: Union[SortedList[Annotation], AnnotationStore] = \
+            AnnotationStore(self) if columnar else SortedList()
         self.links: SortedList[Link] = SortedList()
         self.groups: SortedList[Group] = SortedList()
         self.generics: SortedList[Generics] = SortedList()
@@ -81,16 +99,24 @@ class DataPack(BasePack[Entry, Link, Group]):
         self.processed_original_spans: List[Tuple[Span, Span]] = []
         self.orig_text_len: int = 0
 
+        # The entry blocks that are not decoded yet after a partial
+        # deserialization, see :meth:`load_lazy_entries`.
+        self._lazy_blocks: List[EncodedBlock] = []
+
         self.index: DataIndex = DataIndex()
 
     def __getstate__(self):
         r"""
         In serialization,
-            1) will serialize the annotation sorted list as a normal list;
+            1) will serialize the annotation sorted list as a normal list, or
+               as column blocks in the columnar mode;
             2) will not serialize the indices
         """
         state = super().__getstate__()
-        state['annotations'] = list(state['annotations'])
+        if self._columnar:
+            state['annotations'] = self.annotations.dump_state()
+        else:
+            state['annotations'] = list(state['annotations'])
         state['links'] = list(state['links'])
         state['groups'] = list(state['groups'])
         state['generics'] = list(state['generics'])
@@ -104,21 +130,35 @@ class DataPack(BasePack[Entry, Link, Group]):
             3) Obtain the pack ids.
         """
         super().__setstate__(state)
+        # Packs serialized before the columnar mode are not columnar.
+        self.__dict__.setdefault('_columnar', False)
+        self.__dict__.setdefault('_lazy_blocks', [])
 
-        self.annotations = SortedList(self.annotations)
         self.links = SortedList(self.links)
         self.groups = SortedList(self.groups)
         self.generics = SortedList(self.generics)
 
         self.index = DataIndex()
-        self.index.update_basic_index(list(self.annotations))
+
+        if self._columnar:
+            # The annotation objects are not created here, they are only
+            # recorded in the type index.
+            blocks = self.annotations
+            self.annotations = AnnotationStore(self)
+            self.annotations.load_state(blocks)
+            for block in blocks:
+                self.index.update_type_index(
+                    block['entry_type'], block['tid'])
+        else:
+            self.annotations = SortedList(self.annotations)
+            self.index.update_basic_index(list(self.annotations))
+            for a in self.annotations:
+                a.set_pack(self)
+
         self.index.update_basic_index(list(self.links))
         self.index.update_basic_index(list(self.groups))
         self.index.update_basic_index(list(self.generics))
 
-        for a in self.annotations:
-            a.set_pack(self)
-
         for a in self.links:
             a.set_pack(self)
 
@@ -128,18 +168,209 @@ class DataPack(BasePack[Entry, Link, Group]):
         for a in self.generics:
             a.set_pack(self)
 
+        # The encoded entries are only recorded in the type index.
+        for encoded in self._lazy_blocks:
+            self.index.update_type_index(
+                encoded.entry_type, encoded.tids.tolist())
+
     def __iter__(self):
+        self.load_lazy_entries()
         yield from self.annotations
         yield from self.links
         yield from self.groups
         yield from self.generics
 
+    def snapshot(self, entry_types: Optional[Iterable[Type[Entry]]] = None
+                 ) -> "DataPack":
+        r"""Create a copy of the pack that keeps only the entries of the
+        given types (and their sub-types), e.g. the gold copy used by an
+        evaluator. Only the kept entries are copied, so this is much cheaper
+        than :meth:`view` when the other types take most of the pack. The
+        entries referred to by the kept entries are not kept unless their
+        types are given as well. In the columnar mode, this is a
+        :meth:`fork`.
+
+        Args:
+            entry_types (iterable, optional): The entry types to keep. If
+                `None`, all the entries are kept, the same as :meth:`view`.
+
+        Returns:
+            The copy of the pack.
+        """
+        if self._columnar:
+            return self.fork(entry_types)
+        if entry_types is None:
+            return self.view()
+        types = tuple(entry_types)
+
+        # The state is filtered before the (deep) copy, in the same way as
+        # `__getstate__`.
+        state = super().__getstate__()
+        state['annotations'] = [
+            a for a in self.annotations if isinstance(a, types)]
+        kept: Set[int] = {a.tid for a in state['annotations']}
+        for key in ('links', 'groups', 'generics'):
+            state[key] = [e for e in state[key] if isinstance(e, types)]
+            kept.update(e.tid for e in state[key])
+
+        self.__filter_records(state, types, kept)
+
+        pack = type(self).__new__(type(self))
+        pack.__setstate__(copy.deepcopy(state))
+        return pack
+
+    def fork(self, entry_types: Optional[Iterable[Type[Entry]]] = None
+             ) -> "DataPack":
+        r"""Create a copy of the pack that shares the data with this pack
+        until it is modified. In the columnar mode, the text and the
+        annotation columns are shared copy-on-write, a column is only copied
+        when the annotations of its type are added or removed in either of
+        the two packs, and the annotation objects are created separately by
+        each pack when accessed. So the cost of a fork scales with the
+        annotations that are accessed or changed afterwards, rather than the
+        size of the pack. The links, groups and generics are copied.
+
+        A pack that is not columnar stores the annotations as objects, which
+        cannot be shared, the fork is then the same as :meth:`snapshot`.
+
+        Args:
+            entry_types (iterable, optional): If given, only the entries of
+                these types (and their sub-types) are kept, as
+                :meth:`snapshot`.
+
+        Returns:
+            The forked pack.
+        """
+        if not self._columnar:
+            return self.snapshot(entry_types)
+        types = None if entry_types is None else tuple(entry_types)
+
+        state = super().__getstate__()
+        store: AnnotationStore = state.pop('annotations')
+        state['annotations'] = []
+        if types is not None:
+            kept: Set[int] = set()
+            for columns in store.columns(Annotation):
+                if issubclass(columns.entry_type, types):
+                    kept.update(columns.tid.tolist())
+            for key in ('links', 'groups', 'generics'):
+                state[key] = [e for e in state[key] if isinstance(e, types)]
+                kept.update(e.tid for e in state[key])
+            self.__filter_records(state, types, kept)
+        # The encoded blocks are not modified, so they are shared.
+        lazy_blocks: List[EncodedBlock] = state.pop('_lazy_blocks')
+
+        pack = type(self).__new__(type(self))
+        pack.__setstate__(copy.deepcopy(state))
+        pack.annotations = store.fork(pack, types)
+        for columns in pack.annotations.columns(Annotation):
+            pack.index.update_type_index(
+                columns.entry_type, columns.tid.tolist())
+        pack._lazy_blocks = lazy_blocks
+        for encoded in lazy_blocks:
+            pack.index.update_type_index(
+                encoded.entry_type, encoded.tids.tolist())
+        return pack
+
+    def __filter_records(self, state: Dict[str, Any],
+                         types: Tuple[Type, ...], kept: Set[int]):
+        # Keep the encoded blocks and the records of the kept entries.
+        state['_lazy_blocks'] = [
+            encoded for encoded in self._lazy_blocks
+            if issubclass(encoded.entry_type, types)]
+        for encoded in state['_lazy_blocks']:
+            kept.update(encoded.tids.tolist())
+        state['creation_records'] = {
+            component: tids & kept
+            for component, tids in self.creation_records.items()}
+        state['field_records'] = {
+            component: {r for r in records if r[0] in kept}
+            for component, records in self.field_records.items()}
+
     def _init_meta(self, pack_name: Optional[str] = None) -> Meta:
         return Meta(pack_name)
 
     def validate(self, entry: EntryType) -> bool:
         return isinstance(entry, SinglePackEntries)
 
+    def load_lazy_entries(self, entry_type: Optional[Type[Entry]] = None):
+        r"""Decode the entries that are kept encoded after a partial
+        deserialization (see
+        :func:`~forte.data.binary_io.deserialize_binary`). This is called
+        by the methods such as :meth:`get` and :meth:`get_entry`, so there is
+        no need to call it unless the entry lists (e.g. :attr:`annotations`)
+        are accessed directly.
+
+        Args:
+            entry_type (type, optional): Only decode the entries of this type
+                (including the subclasses). If `None`, decode all entries.
+        """
+        if not self._lazy_blocks:
+            return
+
+        remaining: List[EncodedBlock] = []
+        loading: List[EncodedBlock] = []
+        for encoded in self._lazy_blocks:
+            if entry_type is None or issubclass(encoded.entry_type,
+                                                entry_type):
+                loading.append(encoded)
+            else:
+                remaining.append(encoded)
+        self._lazy_blocks = remaining
+
+        for encoded in loading:
+            block = encoded.decode()
+            if (encoded.key == 'annotations' and
+                    isinstance(self.annotations, AnnotationStore)):
+                # The tids are already in the type index.
+                self.annotations.load_state([block])
+                continue
+
+            entries: List[Any] = decode_entries(block)
+            getattr(self, encoded.key).update(entries)
+            for entry in entries:
+                entry.set_pack(self)
+            self.index.update_basic_index(entries)
+            if self.index.link_index_on and encoded.key == 'links':
+                self.index.update_link_index(entries)
+            if self.index.group_index_on and encoded.key == 'groups':
+                self.index.update_group_index(entries)
+        self.index.deactivate_coverage_index()
+
+    def serialize(self, drop_record: Optional[bool] = False) -> str:
+        # The JSON format does not keep the encoded entries.
+        self.load_lazy_entries()
+        return super().serialize(drop_record)
+
+    @property
+    def columnar(self) -> bool:
+        r"""Whether the annotations of this pack are stored in the columnar
+        :class:`~forte.data.annotation_store.AnnotationStore`."""
+        return self._columnar
+
+    def get_entry(self, tid: int) -> Entry:
+        r"""Look up the entry with ``tid``. In the columnar mode, the
+        annotation object will be created if it is not accessed before.
+
+        Args:
+            tid: The tid of the entry.
+
+        Returns:
+            The entry with the ``tid``.
+        """
+        try:
+            return super().get_entry(tid)
+        except KeyError:
+            for encoded in self._lazy_blocks:
+                if tid in encoded.tids:
+                    self.load_lazy_entries(encoded.entry_type)
+                    return self.get_entry(tid)
+            if isinstance(self.annotations, AnnotationStore):
+                entry = self.annotations.get_by_tid(tid)
+                if entry is not None:
+                    return entry
+            raise
+
     @property
     def text(self) -> str:
         r"""Return the text of the data pack"""
@@ -332,10 +563,13 @@ class DataPack(BasePack[Entry, Link, Group]):
         Returns:
             The input entry itself
         """
+        # The duplicates are checked against the decoded entries.
+        self.load_lazy_entries(type(entry))
+
         if isinstance(entry, Annotation):
             target = self.annotations
 
-            begin, end = entry.span.begin, entry.span.end
+            begin, end = entry.begin, entry.end
 
             if begin < 0:
                 raise ValueError(f'The begin {begin} is smaller than 0, this'
@@ -374,7 +608,7 @@ class DataPack(BasePack[Entry, Link, Group]):
         add_new = allow_duplicate or (entry not in target)
 
         if add_new:
-            target.add(entry)
+            target.add(entry)  # type: ignore
 
             # update the data pack index if needed
             self.index.update_basic_index([entry])
@@ -382,13 +616,160 @@ class DataPack(BasePack[Entry, Link, Group]):
                 self.index.update_link_index([entry])
             if self.index.group_index_on and isinstance(entry, Group):
                 self.index.update_group_index([entry])
-            self.index.deactivate_coverage_index()
+            extent = self.index.entry_extent(entry)
+            if extent is not None:
+                self.index.update_coverage_index(
+                    self, type(entry), [extent[0]], [extent[1]], [entry.tid])
 
             self._pending_entries.pop(entry.tid)
 
             return entry
         else:
-            return target[target.index(entry)]
+            return target[target.index(entry)]  # type: ignore
+
+    def add_annotations(
+            self, entry_type: Type[Annotation],
+            begins: Union[Sequence[int], np.ndarray],
+            ends: Union[Sequence[int], np.ndarray],
+            fields: Optional[Dict[str, Sequence[Any]]] = None,
+            component_name: Optional[str] = None) -> List[int]:
+        r"""Create and add a block of annotations of ``entry_type`` at once.
+        This is equivalent to creating the annotations one by one and adding
+        them to the pack, but the tids are allocated in a block, the
+        annotations are merged into the sorted store at once and the indexes
+        are updated in one pass.
+
+        In the columnar mode, the annotation objects are not created, the
+        defaults of the fields are taken from a prototype annotation created
+        with ``entry_type(pack, begin, end)``.
+
+        Args:
+            entry_type: The type of the annotations, which should be created
+                with ``entry_type(pack, begin, end)``.
+            begins: The begin offsets of the annotations.
+            ends: The end offsets of the annotations.
+            fields (dict, optional): The field values of the annotations, the
+                key is the field name and the value is a sequence of one value
+                per annotation.
+            component_name (str, optional): A name to record that the
+                annotations are created by this component.
+
+        Returns:
+            The tids of the annotations, in the input order.
+        """
+        begin_array = np.asarray(begins, dtype=np.int64)
+        end_array = np.asarray(ends, dtype=np.int64)
+        fields = {} if fields is None else fields
+        num = len(begin_array)
+        if len(end_array) != num or any(
+                len(values) != num for values in fields.values()):
+            raise ValueError(
+                "The begins, ends and the field values should have the same "
+                "length.")
+        if num == 0:
+            return []
+
+        if (begin_array < 0).any():
+            raise ValueError('The begins of the annotations cannot be '
+                             'negative.')
+        if (begin_array > end_array).any():
+            raise ValueError('The begin of an annotation is greater than '
+                             'its end.')
+        if end_array.max() > len(self.text):
+            raise ValueError(
+                f"The end {end_array.max()} of span is greater than the text "
+                f"length {len(self.text)}, which is invalid.")
+
+        default_state = self._get_default_state(entry_type) \
+            if self._columnar else None
+        if default_state is None or any(
+                isinstance(v, Entry) for values in fields.values()
+                for v in values):
+            return self.__add_annotation_objects(
+                entry_type, begin_array.tolist(), end_array.tolist(), fields,
+                component_name)
+
+        tids = self.get_next_ids(num)
+        columns: Dict[str, List[Any]] = {}
+        for name, values in fields.items():
+            check_field_values(entry_type, name, values)
+            columns[name] = list(values)
+        for name, value in default_state.items():
+            if name in columns:
+                continue
+            if isinstance(value, _IMMUTABLE_TYPES):
+                columns[name] = [value] * num
+            else:
+                columns[name] = [copy.deepcopy(value) for _ in range(num)]
+
+        tid_array = np.arange(tids.start, tids.stop, dtype=np.int64)
+        self.annotations.add_rows(
+            entry_type, begin_array, end_array, tid_array, columns)
+        self.index.update_type_index(entry_type, tids)
+        self.index.update_coverage_index(
+            self, entry_type, begin_array, end_array, tid_array)
+        self.record_entries(tids, component_name)
+        for name in fields:
+            for tid in tids:
+                self.record_field(tid, name)
+        return list(tids)
+
+    def __add_annotation_objects(
+            self, entry_type: Type[Annotation], begins: List[int],
+            ends: List[int], fields: Dict[str, Sequence[Any]],
+            component_name: Optional[str]) -> List[int]:
+        entries = [entry_type(self, begin, end)  # type: ignore
+                   for begin, end in zip(begins, ends)]
+        for name, values in fields.items():
+            for entry, value in zip(entries, values):
+                setattr(entry, name, value)
+
+        pending = self._pending_entries
+        for entry in entries:
+            del pending[entry.tid]
+
+        if self._columnar:
+            for entry in entries:
+                self.annotations.add(entry)
+        else:
+            self.annotations.update(entries)  # type: ignore
+        self.index.update_entries_of_type(entry_type, entries)
+
+        tids = [entry.tid for entry in entries]
+        self.index.update_coverage_index(self, entry_type, begins, ends, tids)
+        self.record_entries(tids, component_name)
+        return tids
+
+    @staticmethod
+    def _get_default_state(entry_type: Type[Annotation]
+                           ) -> Optional[Dict[str, Any]]:
+        try:
+            return _default_states[entry_type]
+        except KeyError:
+            pass
+
+        # Create a prototype in a scratch pack, the defaults of the fields
+        # are set by the constructor.
+        scratch = DataPack()
+        state: Optional[Dict[str, Any]] = None
+        try:
+            prototype = entry_type(scratch, 0, 0)  # type: ignore
+            state = prototype.__getstate__()
+        except TypeError:
+            pass
+        created = len(scratch._pending_entries)  # pylint: disable=protected-access
+        scratch._pending_entries.clear()  # pylint: disable=protected-access
+
+        if state is not None:
+            for name in ('_tid', '_span', '_embedding'):
+                state.pop(name, None)
+            if created != 1 or any(
+                    isinstance(v, (FList, FDict, BasePointer))
+                    for v in state.values()):
+                # The defaults refer to other entries.
+                state = None
+        _default_states[entry_type] = state
+        return state
 
     def delete_entry(self, entry: EntryType):
         r"""Delete an :class:`~forte.data.ontology.top.Entry` object from the
@@ -418,21 +799,13 @@ class DataPack(BasePack[Entry, Link, Group]):
                 f"should be an instance of Annotation, Link, or Group."
             )
 
-        begin: int = target.bisect_left(entry)
-
-        index_to_remove = -1
-        for i, e in enumerate(target[begin:]):
-            if e.tid == entry.tid:
-                index_to_remove = begin + i
-                break
+        found = self.__remove_from(target, entry)
 
-        if index_to_remove < 0:
+        if not found:
             logger.warning(
                 "The entry with id %d that you are trying to removed "
                 "does not exists in the data pack's index. Probably it is "
                 "created but not added in the first place.", entry.tid)
-        else:
-            target.pop(index_to_remove)
 
         # update basic index
         self.index.remove_entry(entry)
@@ -440,7 +813,44 @@ class DataPack(BasePack[Entry, Link, Group]):
         # set other index invalid
         self.index.turn_link_index_switch(on=False)
         self.index.turn_group_index_switch(on=False)
-        self.index.deactivate_coverage_index()
+        self.index.remove_from_coverage_index(entry)
+
+    @staticmethod
+    def __remove_from(target, entry: EntryType) -> bool:
+        # Remove the entry from the sorted entries, return whether it is found.
+        if isinstance(target, AnnotationStore):
+            return target.discard(entry)  # type: ignore
+
+        begin: int = target.bisect_left(entry)
+        for i, e in enumerate(target[begin:]):
+            if e.tid == entry.tid:
+                target.pop(begin + i)
+                return True
+        return False
+
+    @contextmanager
+    def moving_entry(self, entry: EntryType) -> Iterator[None]:
+        r"""The span of the annotation ``entry`` is changed within this
+        context, see :meth:`~forte.data.ontology.top.Annotation.set_span`.
+        If the annotation is added to this pack, it is taken out of the sorted
+        annotations and the indexes before the change, and added back with
+        the new span afterwards. The coverage index is rebuilt when it is
+        needed next time.
+
+        Args:
+            entry (Annotation): The annotation to be moved.
+        """
+        found = isinstance(entry, Annotation) and self.__remove_from(
+            self.annotations, entry)
+        if found:
+            self.index.remove_entry(entry)
+        try:
+            yield
+        finally:
+            if found:
+                self.annotations.add(entry)  # type: ignore
+                self.index.update_basic_index([entry])
+                self.index.deactivate_coverage_index()
 
     @classmethod
     def validate_link(cls, entry: EntryType) -> bool:
@@ -504,26 +914,80 @@ class DataPack(BasePack[Entry, Link, Group]):
             A data generator, which generates one piece of data (a dict
             containing the required entries, fields, and context).
         """
-        annotation_types: Dict[Type[Annotation], Union[Dict, List]] = dict()
-        link_types: Dict[Type[Link], Union[Dict, List]] = dict()
-        group_types: Dict[Type[Group], Union[Dict, List]] = dict()
-        generics_types: Dict[Type[Generics], Union[Dict, List]] = dict()
+        context_fields, contexts, entry_types = self.__prepare_data_request(
+            context_type, request, skip_k)
 
+        for context in contexts:
+            data: Dict[str, Any] = dict()
+            data["context"] = self.text[context.begin: context.end]
+            data["offset"] = context.begin
+
+            for field in context_fields:
+                data[field] = getattr(context, field)
+
+            context_keys = set(data.keys())
+            self.__add_entry_data(data, [context], context_type, entry_types)
+            for key, value in data.items():
+                # The row splits of the single context are not returned.
+                if key not in context_keys:
+                    del value["row_splits"]
+            yield data
+
+    def get_columnar_data(self, context_type: Type[Annotation],
+                          request: Optional[DataRequest] = None,
+                          skip_k: int = 0) -> Dict[str, Any]:
+        r"""Fetch the same data as :meth:`get_data`, but for all the contexts
+        at once and in a columnar layout: the context level values are lists
+        with one value per context, and each field of the requested entries
+        is one flat array over all the contexts, like a ragged tensor. The
+        entries of the `i`-th context are at
+        ``row_splits[i]:row_splits[i + 1]`` of the arrays, where
+        ``row_splits`` is given in the dict of each entry type.
+
+        The indices of the links (`"parent"` and `"child"`) and of the units
+        (`"unit_span"`) are relative to each context, as in
+        :meth:`get_data`. Use
+        :func:`~forte.data.data_utils_io.slice_columnar_data` to get a batch
+        of the contexts in the format of
+        :func:`~forte.data.data_utils_io.batch_instances`.
+
+        Args:
+            context_type (str): The granularity of the data context, which
+                could be any ``Annotation`` type.
+            request (dict): The entry types and fields required, see
+                :meth:`get_data`.
+            skip_k (int): Will skip the first `skip_k` instances.
+
+        Returns:
+            A dict of the data of all the contexts.
+        """
+        context_fields, contexts, entry_types = self.__prepare_data_request(
+            context_type, request, skip_k)
+
+        data: Dict[str, Any] = dict()
+        data["context"] = [self.text[c.begin: c.end] for c in contexts]
+        data["offset"] = [c.begin for c in contexts]
+        for field in context_fields:
+            data[field] = [getattr(c, field) for c in contexts]
+
+        self.__add_entry_data(data, contexts, context_type, entry_types)
+        return data
+
+    def __prepare_data_request(
+            self, context_type: Type[Annotation],
+            request: Optional[DataRequest], skip_k: int
+    ) -> Tuple[Set[str], List[Annotation],
+               Dict[Type[Entry], Union[Dict, List]]]:
+        entry_types: Dict[Type[Entry], Union[Dict, List]] = dict()
+
+        self.load_lazy_entries(context_type)
         if request is not None:
             for key, value in request.items():
-                if issubclass(key, Annotation):
-                    annotation_types[key] = value
-                elif issubclass(key, Link):
-                    link_types[key] = value
-                elif issubclass(key, Group):
-                    group_types[key] = value
-                elif issubclass(key, Generics):
-                    generics_types[key] = value
-
-        context_args = annotation_types.get(context_type)
+                self.load_lazy_entries(key)
+                entry_types[key] = value
 
         context_components, _, context_fields = self._parse_request_args(
-            context_type, context_args)
+            context_type, entry_types.get(context_type))
 
         valid_context_ids: Set[int] = self.get_ids_by_type(context_type)
         if context_components:
@@ -532,53 +996,50 @@ class DataPack(BasePack[Entry, Link, Group]):
                 valid_component_id |= self.get_ids_by_component(component)
             valid_context_ids &= valid_component_id
 
-        skipped = 0
-        # must iterate through a copy here because self.annotations is changing
-        for context in list(self.annotations):
-            if (context.tid not in valid_context_ids or
-                    not isinstance(context, context_type)):
+        all_contexts: Iterable[Annotation]
+        if isinstance(self.annotations, AnnotationStore):
+            # Only the context annotations are created from the columns.
+            all_contexts = list(self.annotations.iter_type(
+                context_type, tids=valid_context_ids))
+        else:
+            # must iterate through a copy here because self.annotations is
+            # changing
+            all_contexts = list(self.annotations)
+
+        contexts = [context for context in all_contexts
+                    if context.tid in valid_context_ids and
+                    isinstance(context, context_type)]
+        return context_fields, contexts[skip_k:], entry_types
+
+    def __add_entry_data(self, data: Dict[str, Any],
+                         contexts: List[Annotation],
+                         context_type: Type[Annotation],
+                         entry_types: Dict[Type[Entry], Union[Dict, List]]):
+        # The annotations are added before the links, which refer to them.
+        for e_type, e_args in entry_types.items():
+            if (not issubclass(e_type, Annotation) or
+                    issubclass(e_type, context_type)):
                 continue
-            if skipped < skip_k:
-                skipped += 1
+            if e_type.__name__ in data.keys():
+                raise KeyError(
+                    f"Requesting two types of entries with the "
+                    f"same class name {e_type.__name__} at the "
+                    f"same time is not allowed")
+            data[e_type.__name__] = self._generate_annotation_entry_data(
+                e_type, e_args, data, contexts)
+
+        for e_type, e_args in entry_types.items():
+            if not issubclass(e_type, Link):
                 continue
+            if e_type.__name__ in data.keys():
+                raise KeyError(
+                    f"Requesting two types of entries with the "
+                    f"same class name {e_type.__name__} at the "
+                    f"same time is not allowed")
+            data[e_type.__name__] = self._generate_link_entry_data(
+                e_type, e_args, data, contexts)
 
-            data: Dict[str, Any] = dict()
-            data["context"] = self.text[context.span.begin: context.span.end]
-            data["offset"] = context.span.begin
-
-            for field in context_fields:
-                data[field] = getattr(context, field)
-
-            if annotation_types:
-                for a_type, a_args in annotation_types.items():
-                    if issubclass(a_type, context_type):
-                        continue
-                    if a_type.__name__ in data.keys():
-                        raise KeyError(
-                            f"Requesting two types of entries with the "
-                            f"same class name {a_type.__name__} at the "
-                            f"same time is not allowed")
-                    data[a_type.__name__] = \
-                        self._generate_annotation_entry_data(
-                            a_type, a_args, data, context)
-
-            if link_types:
-                for l_type, l_args in link_types.items():
-                    if l_type.__name__ in data.keys():
-                        raise KeyError(
-                            f"Requesting two types of entries with the "
-                            f"same class name {l_type.__name__} at the "
-                            f"same time is not allowed")
-                    data[l_type.__name__] = self._generate_link_entry_data(
-                        l_type, l_args, data, context)
-
-            # TODO: Group and Generics not finished.
-            if group_types:
-                # pylint: disable=unused-variable
-                for g_type, g_args in group_types.items():
-                    pass
-
-            yield data
+        # TODO: Group and Generics not finished.
 
     def _parse_request_args(self, a_type, a_args):
         # request which fields generated by which component
@@ -620,7 +1081,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             a_type: Type[Annotation],
             a_args: Union[Dict, Iterable],
             data: Dict,
-            cont: Optional[Annotation]) -> Dict:
+            contexts: List[Annotation]) -> Dict:
 
         components, unit, fields = self._parse_request_args(a_type, a_args)
 
@@ -631,48 +1092,56 @@ class DataPack(BasePack[Entry, Link, Group]):
         for field in fields:
             a_dict[field] = []
 
-        unit_begin = 0
         if unit is not None:
             if unit not in data.keys():
                 raise KeyError(f"{unit} is missing in data. You need to "
                                f"request {unit} before {a_type}.")
             a_dict["unit_span"] = []
 
-        cont_begin = cont.span.begin if cont else 0
+        found = self.get_in_ranges(a_type, contexts, components=components)
+        row_splits = np.zeros(len(contexts) + 1, dtype=np.int64)
+        np.cumsum([len(annotations) for annotations in found],
+                  out=row_splits[1:])
 
         annotation: Annotation
-        for annotation in self.get(a_type, cont, components):
-            # we provide span, text (and also tid) by default
-            a_dict["span"].append((annotation.span.begin,
-                                   annotation.span.end))
-            a_dict["text"].append(annotation.text)
-
-            for field in fields:
-                if field in ("span", "text"):
-                    continue
-                if field == "context_span":
-                    a_dict[field].append((annotation.span.begin - cont_begin,
-                                          annotation.span.end - cont_begin))
-                    continue
-
-                a_dict[field].append(getattr(annotation, field))
-
-            if unit is not None:
-                while not self.index.in_span(data[unit]["tid"][unit_begin],
-                                             annotation.span):
-                    unit_begin += 1
-
-                unit_span_begin = unit_begin
-                unit_span_end = unit_span_begin + 1
+        for cont, annotations in zip(contexts, found):
+            for annotation in annotations:
+                # we provide span, text (and also tid) by default
+                a_dict["span"].append((annotation.begin, annotation.end))
+                a_dict["text"].append(annotation.text)
+
+                for field in fields:
+                    if field in ("span", "text"):
+                        continue
+                    if field == "context_span":
+                        a_dict[field].append((annotation.begin - cont.begin,
+                                              annotation.end - cont.begin))
+                        continue
 
-                while self.index.in_span(data[unit]["tid"][unit_span_end],
-                                         annotation.span):
-                    unit_span_end += 1
+                    a_dict[field].append(getattr(annotation, field))
 
-                a_dict["unit_span"].append((unit_span_begin, unit_span_end))
+        if unit is not None:
+            # The units of each annotation are searched in the sorted spans
+            # of the units of its context.
+            unit_splits = data[unit]["row_splits"]
+            unit_spans = np.asarray(data[unit]["span"]).reshape(-1, 2)
+            for i, annotations in enumerate(found):
+                if not annotations:
+                    continue
+                spans = unit_spans[unit_splits[i]:unit_splits[i + 1]]
+                begins = np.fromiter((a.begin for a in annotations), np.int64,
+                                     len(annotations))
+                ends = np.fromiter((a.end for a in annotations), np.int64,
+                                   len(annotations))
+                unit_begins = np.searchsorted(spans[:, 0], begins, 'left')
+                unit_ends = np.maximum(
+                    np.searchsorted(spans[:, 1], ends, 'right'), unit_begins)
+                a_dict["unit_span"].extend(
+                    zip(unit_begins.tolist(), unit_ends.tolist()))
 
         for key, value in a_dict.items():
             a_dict[key] = np.array(value)
+        a_dict["row_splits"] = row_splits
 
         return a_dict
 
@@ -681,7 +1150,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             a_type: Type[Link],
             a_args: Union[Dict, Iterable],
             data: Dict,
-            cont: Optional[Annotation]) -> Dict:
+            contexts: List[Annotation]) -> Dict:
 
         components, unit, fields = self._parse_request_args(a_type, a_args)
 
@@ -694,35 +1163,113 @@ class DataPack(BasePack[Entry, Link, Group]):
         a_dict["parent"] = []
         a_dict["child"] = []
 
+        parent_type = a_type.ParentType.__name__
+        child_type = a_type.ChildType.__name__
+        if parent_type not in data.keys():
+            raise KeyError(f"The Parent entry of {a_type} is not requested."
+                           f" You should also request {parent_type} with "
+                           f"{a_type}")
+        if child_type not in data.keys():
+            raise KeyError(f"The child entry of {a_type} is not requested."
+                           f" You should also request {child_type} with "
+                           f"{a_type}")
+
+        # The links in the contexts are looked up in the coverage index.
+        context_types = {type(cont) for cont in contexts}
+        for context_type in context_types:
+            if self.index.coverage_index(context_type, a_type) is None:
+                self.index.build_coverage_index(self, context_type, a_type)
+
+        row_splits = np.zeros(len(contexts) + 1, dtype=np.int64)
         link: Link
-        for link in self.get(a_type, cont, components):
-            parent_type = link.ParentType.__name__
-            child_type = link.ChildType.__name__
-
-            if parent_type not in data.keys():
-                raise KeyError(f"The Parent entry of {a_type} is not requested."
-                               f" You should also request {parent_type} with "
-                               f"{a_type}")
-            if child_type not in data.keys():
-                raise KeyError(f"The child entry of {a_type} is not requested."
-                               f" You should also request {child_type} with "
-                               f"{a_type}")
-
-            a_dict["parent"].append(
-                np.where(data[parent_type]["tid"] == link.parent)[0][0])
-            a_dict["child"].append(
-                np.where(data[child_type]["tid"] == link.child)[0][0])
-
-            for field in fields:
-                if field in ("parent", "child"):
-                    continue
+        for i, cont in enumerate(contexts):
+            # The positions of the parents and children in the context.
+            positions: Dict[str, Dict[int, int]] = {}
+            for type_name in (parent_type, child_type):
+                entry_data = data[type_name]
+                tids = entry_data["tid"][entry_data["row_splits"][i]:
+                                         entry_data["row_splits"][i + 1]]
+                positions[type_name] = {
+                    tid: position for position, tid in enumerate(
+                        tids.tolist())}
+
+            num_links = 0
+            for link in self.get(a_type, cont, components):
+                a_dict["parent"].append(positions[parent_type][link.parent])
+                a_dict["child"].append(positions[child_type][link.child])
+                num_links += 1
+
+                for field in fields:
+                    if field in ("parent", "child"):
+                        continue
 
-                a_dict[field].append(getattr(link, field))
+                    a_dict[field].append(getattr(link, field))
+            row_splits[i + 1] = row_splits[i] + num_links
 
         for key, value in a_dict.items():
             a_dict[key] = np.array(value)
+        a_dict["row_splits"] = row_splits
         return a_dict
 
+    def get_in_ranges(
+            self, entry_type: Type[EntryType],
+            ranges: Sequence[Union[Annotation, Span]],
+            overlap: bool = False,
+            components: Optional[Union[str, List[str]]] = None
+    ) -> List[List[EntryType]]:
+        r"""Get the annotations of ``entry_type`` in each of the ``ranges``.
+        This is the batched form of :meth:`get` for annotations, all the
+        ranges are looked up in the span index of ``entry_type`` at once.
+
+        Example:
+
+            .. code-block:: python
+
+                sentences = list(input_pack.get(Sentence))
+                for sentence, tokens in zip(
+                        sentences, input_pack.get_in_ranges(Token, sentences)):
+                    ...
+
+        Args:
+            entry_type (type): The type of annotations requested.
+            ranges (list): A list of :class:`Annotation` or :class:`Span`
+                objects as the ranges.
+            overlap (bool): If `False`, return the annotations that lie inside
+                each range. If `True`, return the annotations that overlap with
+                each range.
+            components (str or list, optional): The component generating the
+                entries requested. If `None`, will return valid entries
+                generated by any component.
+
+        Returns:
+            A list with the annotations of each range, the annotations are
+            sorted in the same order as in :meth:`get`.
+        """
+        if not issubclass(entry_type, Annotation):
+            raise ValueError(
+                f"Only annotation types can be looked up by ranges, but get "
+                f"{entry_type}.")
+
+        self.load_lazy_entries(entry_type)
+        spans: List[Span] = [
+            r.span if isinstance(r, Annotation) else r for r in ranges]
+        found = self.index.span_index(self, entry_type).batch_query(
+            [span.begin for span in spans], [span.end for span in spans],
+            overlap)
+
+        valid_id: Optional[Set[int]] = None
+        if components is not None:
+            if isinstance(components, str):
+                components = [components]
+            valid_id = self.get_ids_by_components(components)
+
+        results: List[List[EntryType]] = []
+        for tids in found:
+            results.append([
+                self.get_entry(tid) for tid in tids.tolist()  # type: ignore
+                if valid_id is None or tid in valid_id])
+        return results
+
     def get(self, entry_type: Type[EntryType],  # type: ignore
             range_annotation: Optional[Annotation] = None,
             components: Optional[Union[str, List[str]]] = None
@@ -751,37 +1298,68 @@ class DataPack(BasePack[Entry, Link, Group]):
                 entries requested. If `None`, will return valid entries
                 generated by any component.
         """
+        self.load_lazy_entries(entry_type)
+
         # If we don't have any annotations, then we yield an empty list.
         # Note that generics do not work with annotations.
         if len(self.annotations) == 0 and not issubclass(entry_type, Generics):
             yield from []
             return
 
-        # valid type
-        valid_id = self.get_ids_by_type(entry_type)
+        # The entries in a range are looked up in the coverage index if it is
+        # built for the range type, otherwise the annotations are looked up
+        # in the span index.
+        if range_annotation is not None and not issubclass(entry_type,
+                                                           Generics):
+            coverage_index = self.index.coverage_index(
+                type(range_annotation), entry_type)
+            if (coverage_index is not None and
+                    range_annotation.tid in coverage_index):
+                yield from self.__get_covered(
+                    entry_type, coverage_index[range_annotation.tid],
+                    components)
+                return
+
+        if (range_annotation is not None and
+                issubclass(entry_type, Annotation) and
+                not isinstance(self.annotations, AnnotationStore)):
+            yield from self.get_in_ranges(
+                entry_type, [range_annotation], components=components)[0]
+            return
+
+        # valid type, the tid set in the type index is used without copying
+        # if there is only one, so it must not be modified in place below.
+        type_ids = self.index.type_ids(entry_type)
+        valid_id: Set[int] = (type_ids[0] if len(type_ids) == 1
+                              else set().union(*type_ids))
         # valid component
         if components is not None:
             if isinstance(components, str):
                 components = [components]
-            valid_id &= self.get_ids_by_components(components)
+            valid_id = valid_id & self.get_ids_by_components(components)
 
         # Generics do not work with range_annotation.
         if issubclass(entry_type, Generics):
-            for entry_id in valid_id:
+            # Iterate a snapshot since the caller may add entries.
+            for entry_id in list(valid_id):
                 entry: EntryType = self.get_entry(entry_id)  # type: ignore
                 yield entry
             return
 
-        # valid span
-        if range_annotation is not None:
-            coverage_index = self.index.coverage_index(type(range_annotation),
-                                                       entry_type)
-            if coverage_index is not None:
-                valid_id &= coverage_index[range_annotation.tid]
+        if (issubclass(entry_type, Annotation) and
+                isinstance(self.annotations, AnnotationStore)):
+            if range_annotation is None:
+                yield from self.annotations.iter_type(  # type: ignore
+                    entry_type, tids=valid_id)
+            else:
+                yield from self.annotations.iter_type(  # type: ignore
+                    entry_type, range_annotation.begin,
+                    range_annotation.end, tids=valid_id)
+            return
 
-        range_begin = range_annotation.span.begin if range_annotation else 0
-        range_end = (range_annotation.span.end if range_annotation else
-                     self.annotations[-1].span.end)
+        range_begin = range_annotation.begin if range_annotation else 0
+        range_end = (range_annotation.end if range_annotation else
+                     self.annotations[-1].end)
 
         if issubclass(entry_type, Annotation):
             temp_begin = Annotation(self, range_begin, range_begin)
@@ -800,15 +1378,30 @@ class DataPack(BasePack[Entry, Link, Group]):
                     continue
                 if (range_annotation is None or
                         self.index.in_span(annotation, range_annotation.span)):
-                    yield annotation
+                    yield annotation  # type: ignore
 
         elif issubclass(entry_type, (Link, Group)):
-            for entry_id in valid_id:
+            for entry_id in list(valid_id):
                 entry: EntryType = self.get_entry(entry_id)  # type: ignore
                 if (range_annotation is None or
                         self.index.in_span(entry, range_annotation.span)):
                     yield entry
 
+    def __get_covered(self, entry_type: Type[EntryType],
+                      covered: np.ndarray,
+                      components: Optional[Union[str, List[str]]]
+                      ) -> List[EntryType]:
+        tids: List[int] = covered.tolist()
+        if components is not None:
+            if isinstance(components, str):
+                components = [components]
+            valid_id = self.get_ids_by_components(components)
+            tids = [tid for tid in tids if tid in valid_id]
+        entries: List[Any] = [self.get_entry(tid) for tid in tids]
+        if issubclass(entry_type, Annotation):
+            entries.sort()
+        return entries
+
 
 class DataIndex(BaseIndex):
     r"""A set of indexes used in :class:`DataPack`:
@@ -826,16 +1419,115 @@ class DataIndex(BaseIndex):
        the entries it covers. :attr:`_coverage_index` is a dict of dict, where
        the key is a tuple of the outer entry type and the inner entry type.
        The outer entry type should be an annotation type. The value is a dict,
-       where the key is the tid of the outer entry, and the value is a set of
-       tids that are covered by the outer entry.
+       where the key is the tid of the outer entry, and the value is a sorted
+       array of the tids that are covered by the outer entry. The coverage
+       indexes are updated when entries are added or removed.
+    #. :attr:`_span_index`, the index from an annotation type to a
+       :class:`~forte.data.index.SpanIndex` over the spans of the annotations
+       of this type (including the subclasses). The span indexes are built
+       when first looked up, and dropped when annotations of the type are
+       added or removed.
 
     """
 
     def __init__(self):
         super().__init__()
         self._coverage_index: Dict[Tuple[Type[Annotation], Type[EntryType]],
-                                   Dict[int, Set[int]]] = dict()
+                                   Dict[int, np.ndarray]] = dict()
         self._coverage_index_valid = True
+        self._span_index: Dict[Type[Annotation], SpanIndex] = dict()
+
+    def update_basic_index(self, entries: List[EntryType]):
+        super().update_basic_index(entries)
+        if self._span_index:
+            for entry in entries:
+                self._invalidate_span_index(type(entry))
+
+    def update_type_index(self, entry_type: Type, tids: Iterable[int]):
+        super().update_type_index(entry_type, tids)
+        self._invalidate_span_index(entry_type)
+
+    def remove_entry(self, entry: EntryType):
+        super().remove_entry(entry)
+        self._invalidate_span_index(type(entry))
+
+    def _invalidate_span_index(self, entry_type: Type):
+        for indexed_type in [t for t in self._span_index
+                             if issubclass(entry_type, t)]:
+            del self._span_index[indexed_type]
+
+    def span_index(self, data_pack: DataPack,
+                   entry_type: Type[Annotation]) -> SpanIndex:
+        r"""Get the span index of ``entry_type``, the index is built if it
+        does not exist.
+
+        Args:
+            data_pack (DataPack): The data pack to build the index for.
+            entry_type (type): an annotation type.
+
+        Returns:
+            A :class:`~forte.data.index.SpanIndex` over the annotations of
+            ``entry_type`` and its subclasses.
+        """
+        span_index = self._span_index.get(entry_type)
+        if span_index is None:
+            span_index = self.build_span_index(data_pack, entry_type)
+        return span_index
+
+    def build_span_index(self, data_pack: DataPack,
+                         entry_type: Type[Annotation]) -> SpanIndex:
+        r"""Build the span index of ``entry_type``.
+
+        Args:
+            data_pack (DataPack): The data pack to build the index for.
+            entry_type (type): an annotation type.
+
+        Returns:
+            The built :class:`~forte.data.index.SpanIndex`.
+        """
+        if not issubclass(entry_type, Annotation):
+            raise ValueError(f"Do not support span index for {entry_type}.")
+
+        types: List[Type] = []
+        begins: List[np.ndarray] = []
+        ends: List[np.ndarray] = []
+        tids: List[np.ndarray] = []
+        if isinstance(data_pack.annotations, AnnotationStore):
+            # The spans are read from the columns without creating the
+            # annotation objects.
+            for columns in data_pack.annotations.columns(entry_type):
+                types.append(columns.entry_type)
+                begins.append(columns.begin)
+                ends.append(columns.end)
+                tids.append(columns.tid)
+        else:
+            for t in self.subtypes(entry_type):
+                ids = self._type_index[t]
+                if not ids:
+                    continue
+                spans = [self._entry_index[tid].span for tid in ids]
+                types.append(t)
+                begins.append(np.fromiter(
+                    (span.begin for span in spans), np.int64, len(spans)))
+                ends.append(np.fromiter(
+                    (span.end for span in spans), np.int64, len(spans)))
+                tids.append(np.fromiter(ids, np.int64, len(ids)))
+
+        ranks = None
+        if len(types) > 1:
+            # Annotations with the same span are ordered by the type name.
+            names = sorted(str(t) for t in types)
+            ranks = np.concatenate([
+                np.full(len(b), names.index(str(t)), dtype=np.int64)
+                for t, b in zip(types, begins)])
+
+        span_index = SpanIndex(
+            np.concatenate(begins) if begins else [],
+            np.concatenate(ends) if ends else [],
+            np.concatenate(tids) if tids else [],
+            ranks)
+        self._span_index[entry_type] = span_index
+        return span_index
 
     @property
     def coverage_index_is_valid(self):
@@ -850,7 +1542,7 @@ class DataIndex(BaseIndex):
     def coverage_index(
             self,
             outer_type: Type[Annotation],
-            inner_type: Type[EntryType]) -> Optional[Dict[int, Set[int]]]:
+            inner_type: Type[EntryType]) -> Optional[Dict[int, np.ndarray]]:
         r"""Get the coverage index from ``outer_type`` to ``inner_type``.
 
         Args:
@@ -859,7 +1551,8 @@ class DataIndex(BaseIndex):
 
         Returns:
             If the coverage index does not exist, return `None`. Otherwise,
-            return a dict.
+            return a dict from the tid of each outer annotation to the sorted
+            array of the tids it covers.
         """
         if not self.coverage_index_is_valid:
             return None
@@ -871,13 +1564,18 @@ class DataIndex(BaseIndex):
             outer_type: Type[Annotation],
             inner_type: Type[EntryType]):
         r"""Build the coverage index from ``outer_type`` to ``inner_type``.
+        The index is built with one sweep over the spans of the outer
+        annotations and the spans of the inner entries, both sorted by the
+        begin offsets.
 
         Args:
             data_pack (DataPack): The data pack to build coverage for.
             outer_type (type): an annotation type.
             inner_type (type): an entry type, can be Annotation, Link, Group.
         """
-        if not isinstance(inner_type, (Annotation, Link, Group)):
+        if not issubclass(outer_type, Annotation):
+            raise ValueError(f"Do not support coverage index for {outer_type}.")
+        if not issubclass(inner_type, (Annotation, Link, Group)):
             raise ValueError(f"Do not support coverage index for {inner_type}.")
 
         if not self.coverage_index_is_valid:
@@ -886,16 +1584,126 @@ class DataIndex(BaseIndex):
         # prevent the index from being used during construction
         self.deactivate_coverage_index()
 
-        self._coverage_index[(outer_type, inner_type)] = dict()
-        for range_annotation in data_pack.get_entries_by_type(outer_type):
-            if isinstance(range_annotation, Annotation):
-                entries = data_pack.get(inner_type, range_annotation)
-                entry_ids = {e.tid for e in entries}
-                self._coverage_index[
-                    (outer_type, inner_type)][range_annotation.tid] = entry_ids
+        data_pack.load_lazy_entries(outer_type)
+        data_pack.load_lazy_entries(inner_type)
+        outer_index = self.span_index(data_pack, outer_type)
+        found = self._extent_index(data_pack, inner_type).batch_query(
+            outer_index.begins, outer_index.ends)
+        self._coverage_index[(outer_type, inner_type)] = {
+            tid: np.sort(tids)
+            for tid, tids in zip(outer_index.tids.tolist(), found)}
 
         self.activate_coverage_index()
 
+    def update_coverage_index(
+            self,
+            data_pack: DataPack,
+            entry_type: Type[EntryType],
+            begins: Union[Sequence[int], np.ndarray],
+            ends: Union[Sequence[int], np.ndarray],
+            tids: Union[Sequence[int], np.ndarray]):
+        r"""Update the built coverage indexes with the new entries of
+        ``entry_type``, which should be already added to the other indexes.
+
+        Args:
+            data_pack (DataPack): The data pack of the entries.
+            entry_type (type): The type of the new entries.
+            begins: The begins of the extents of the new entries, see
+                :meth:`entry_extent`.
+            ends: The ends of the extents of the new entries.
+            tids: The tids of the new entries.
+        """
+        if not self.coverage_index_is_valid or len(tids) == 0:
+            return
+
+        for (outer_type, inner_type), coverage in \
+                self._coverage_index.items():
+            if issubclass(entry_type, inner_type):
+                outer_index = self.span_index(data_pack, outer_type)
+                added: DefaultDict[int, List[int]] = defaultdict(list)
+                for begin, end, tid in zip(
+                        np.asarray(begins).tolist(),
+                        np.asarray(ends).tolist(),
+                        np.asarray(tids).tolist()):
+                    for outer_tid in outer_index.covering(
+                            begin, end).tolist():
+                        added[outer_tid].append(tid)
+                for outer_tid, covered in added.items():
+                    # The rows of the new outer annotations are built below.
+                    if outer_tid in coverage:
+                        coverage[outer_tid] = np.union1d(
+                            coverage[outer_tid], covered)
+
+            if issubclass(entry_type, outer_type):
+                inner_index = self._extent_index(data_pack, inner_type)
+                for begin, end, tid in zip(
+                        np.asarray(begins).tolist(),
+                        np.asarray(ends).tolist(),
+                        np.asarray(tids).tolist()):
+                    coverage[tid] = np.sort(inner_index.query(begin, end))
+
+    def remove_from_coverage_index(self, entry: EntryType):
+        r"""Remove an entry from the built coverage indexes.
+
+        Args:
+            entry (Entry): The removed entry.
+        """
+        if not self.coverage_index_is_valid:
+            return
+
+        extent = self.entry_extent(entry)
+        for (outer_type, inner_type), coverage in \
+                self._coverage_index.items():
+            if isinstance(entry, outer_type):
+                coverage.pop(entry.tid, None)
+            if isinstance(entry, inner_type) and extent is not None:
+                for outer_tid, covered in coverage.items():
+                    index = int(np.searchsorted(covered, entry.tid))
+                    if index < len(covered) and covered[index] == entry.tid:
+                        coverage[outer_tid] = np.delete(covered, index)
+
+    @staticmethod
+    def entry_extent(entry: EntryType) -> Optional[Tuple[int, int]]:
+        r"""The smallest span that an entry lies in, see :meth:`in_span`.
+
+        Args:
+            entry (Entry): An annotation, link or group.
+
+        Returns:
+            The begin and end of the span, or `None` if the entry does not
+            lie in any span, e.g. a link between non-annotations.
+        """
+        if isinstance(entry, Annotation):
+            return entry.begin, entry.end
+        if isinstance(entry, Link):
+            members = [entry.get_parent(), entry.get_child()]
+        elif isinstance(entry, Group):
+            members = list(entry.get_members())
+        else:
+            return None
+        if not members or not all(
+                isinstance(m, Annotation) for m in members):
+            return None
+        return (min(m.begin for m in members),  # type: ignore
+                max(m.end for m in members))  # type: ignore
+
+    def _extent_index(self, data_pack: DataPack,
+                      entry_type: Type[EntryType]) -> SpanIndex:
+        if issubclass(entry_type, Annotation):
+            return self.span_index(data_pack, entry_type)
+
+        begins: List[int] = []
+        ends: List[int] = []
+        tids: List[int] = []
+        for ids in self.type_ids(entry_type):
+            for tid in ids:
+                extent = self.entry_extent(self._entry_index[tid])
+                if extent is not None:
+                    begins.append(extent[0])
+                    ends.append(extent[1])
+                    tids.append(tid)
+        return SpanIndex(begins, ends, tids)
+
     def have_overlap(self,
                      entry1: Union[Annotation, int],
                      entry2: Union[Annotation, int]) -> bool:
@@ -920,8 +1728,8 @@ class DataIndex(BaseIndex):
             raise TypeError(f"'entry2' should be an instance of Annotation,"
                             f" but get {type(entry2)}")
 
-        return not (entry1_.span.begin >= entry2_.span.end or
-                    entry1_.span.end <= entry2_.span.begin)
+        return not (entry1_.begin >= entry2_.end or
+                    entry1_.end <= entry2_.begin)
 
     def in_span(self, inner_entry: Union[int, Entry], span: Span) -> bool:
         r"""Check whether the ``inner entry`` is within the given ``span``. Link
@@ -943,8 +1751,8 @@ class DataIndex(BaseIndex):
             inner_entry = self._entry_index[inner_entry]
 
         if isinstance(inner_entry, Annotation):
-            inner_begin = inner_entry.span.begin
-            inner_end = inner_entry.span.end
+            inner_begin = inner_entry.begin
+            inner_end = inner_entry.end
         elif isinstance(inner_entry, Link):
             child = inner_entry.get_child()
             parent = inner_entry.get_parent()
@@ -957,8 +1765,8 @@ class DataIndex(BaseIndex):
             child_: Annotation = child
             parent_: Annotation = parent
 
-            inner_begin = min(child_.span.begin, parent_.span.begin)
-            inner_end = max(child_.span.end, parent_.span.end)
+            inner_begin = min(child_.begin, parent_.begin)
+            inner_end = max(child_.end, parent_.end)
         elif isinstance(inner_entry, Group):
             inner_begin = -1
             inner_end = -1
@@ -969,9 +1777,9 @@ class DataIndex(BaseIndex):
 
                 mem_: Annotation = mem
                 if inner_begin == -1:
-                    inner_begin = mem_.span.begin
-                inner_begin = min(inner_begin, mem_.span.begin)
-                inner_end = max(inner_end, mem_.span.end)
+                    inner_begin = mem_.begin
+                inner_begin = min(inner_begin, mem_.begin)
+                inner_end = max(inner_end, mem_.end)
         else:
             raise ValueError(
                 f"Invalid entry type {type(inner_entry)}. A valid entry "
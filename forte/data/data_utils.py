@@ -20,15 +20,19 @@ import sys
 import tarfile
 import urllib.request
 import zipfile
-from typing import List, Optional, overload
+from typing import Iterable, List, Optional, Type, Union, overload
 
 import jsonpickle
 
+from forte.data.binary_io import (
+    SERIALIZE_METHODS, deserialize_binary, is_binary, serialize_binary)
+from forte.data.ontology.core import Entry
 from forte.utils.types import PathLike
 from forte.utils.utils_io import maybe_create_dir
 
 __all__ = [
     "maybe_download",
+    "serialize",
     "deserialize"
 ]
 
@@ -182,9 +186,49 @@ def _download_from_google_drive(url: str, filename: str, path: str) -> str:
     return filepath
 
 
-def deserialize(string: str):
-    r"""Deserialize a pack from a string.
+def serialize(pack, drop_record: Optional[bool] = False,
+              serialize_method: str = "jsonpickle") -> Union[str, bytes]:
+    r"""Serialize a pack with the selected method.
+
+    Args:
+        pack: The pack to be serialized.
+        drop_record: Whether to drop the creation records in the
+            serialization.
+        serialize_method: The serialization method, `"jsonpickle"` produces
+            a JSON string, and `"binary"` produces bytes in the format of
+            :mod:`forte.data.binary_io`.
+
+    Returns:
+        The serialized string or bytes.
+    """
+    if serialize_method == "jsonpickle":
+        return pack.serialize(drop_record)
+    if serialize_method == "binary":
+        return serialize_binary(pack, drop_record)
+    raise ValueError(
+        f"Unknown serialize method {serialize_method}, it should be one of "
+        f"{SERIALIZE_METHODS}.")
+
+
+def deserialize(string: Union[str, bytes],
+                entry_types: Optional[Iterable[Type[Entry]]] = None):
+    r"""Deserialize a pack from a string, or from the bytes of the binary
+    format. The format is detected from the data.
+
+    Args:
+        string: The serialized pack.
+        entry_types (optional): Only used by the binary format, the entry
+            types to be decoded eagerly, the other entries are decoded on
+            first access. See
+            :func:`~forte.data.binary_io.deserialize_binary`.
+
+    Returns:
+        The deserialized pack.
     """
+    if isinstance(string, bytes):
+        if is_binary(string):
+            return deserialize_binary(string, entry_types)
+        string = string.decode("utf-8")
     pack = jsonpickle.decode(string)
     # Need to assign the pack manager to the pack to control it after reading
     #  the raw data.
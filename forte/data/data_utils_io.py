@@ -15,7 +15,7 @@
 Utility functions related to data processing input/output.
 """
 import os
-from typing import Dict, List, Iterator, Any, Tuple
+from typing import Dict, List, Iterator, Any, Tuple, Sequence
 
 from forte.data.types import ReplaceOperationsType
 from forte.data.span import Span
@@ -24,6 +24,8 @@ __all__ = [
     "batch_instances",
     "merge_batches",
     "slice_batch",
+    "slice_columnar_data",
+    "take_columnar_data",
     "dataset_path_iterator",
 ]
 
@@ -82,6 +84,34 @@ def slice_batch(batch, start, length):
     return sliced_batch
 
 
+def slice_columnar_data(data: Dict[str, Any], start: int,
+                        end: int) -> Dict[str, Any]:
+    r"""Return the batch of the instances from ``start`` to ``end`` in the
+    columnar ``data`` given by
+    :meth:`~forte.data.data_pack.DataPack.get_columnar_data`. The batch is
+    in the same format as :func:`batch_instances`, where the arrays of each
+    instance are views of the columnar arrays instead of copies.
+    """
+    return take_columnar_data(data, range(start, end))
+
+
+def take_columnar_data(data: Dict[str, Any],
+                       indices: Sequence[int]) -> Dict[str, Any]:
+    r"""Return the batch of the instances at ``indices`` in the columnar
+    ``data``, see :func:`slice_columnar_data`.
+    """
+    batch: Dict[str, Any] = {}
+    for entry, fields in data.items():
+        if isinstance(fields, dict):
+            row_splits = fields["row_splits"].tolist()
+            batch[entry] = {
+                k: [value[row_splits[i]: row_splits[i + 1]] for i in indices]
+                for k, value in fields.items() if k != "row_splits"}
+        else:  # context level feature
+            batch[entry] = [fields[i] for i in indices]
+    return batch
+
+
 def dataset_path_iterator_with_base(
         dir_path: str, file_extension: str) -> Iterator[Tuple[str, str]]:
     r"""An iterator returning file_paths in a directory containing files of the
@@ -14,18 +14,23 @@
 """
 A set of utilities to support reading DBpedia datasets.
 """
-import bz2
+import functools
 import logging
 import os
 import re
+import sqlite3
 import sys
+import threading
 from collections import OrderedDict
 from random import choice
-from typing import List, Dict, Tuple, Union, Any, Iterator
+from typing import List, Dict, Tuple, Union, Any, Iterator, Optional
 from urllib.parse import urlparse, parse_qs
 
 import rdflib
 
+from forte.data.datasets.wikipedia.nquads import (
+    DEFAULT_BUFFER_SIZE, open_nquads, parse_nquads, statement_graph)
+
 dbpedia_prefix = "http://dbpedia.org/resource/"
 state_type = Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]
 
@@ -53,8 +58,10 @@ def get_resource_attribute(url, param_name) -> str:
     return parse_qs(parsed.query)[param_name][0]
 
 
-def context_base(c: rdflib.Graph) -> str:
-    return strip_url_params(c.identifier)
+def context_base(c: Union[rdflib.Graph, rdflib.term.Node]) -> str:
+    if isinstance(c, rdflib.Graph):
+        c = c.identifier
+    return strip_url_params(c)
 
 
 def get_resource_fragment(url) -> str:
@@ -98,12 +105,30 @@ def print_notice(msg: str):
     print(f'\n -- {msg}')
 
 
+def to_rdf_literal(value: str, language: Optional[str],
+                   datatype: Optional[rdflib.URIRef]) -> rdflib.Literal:
+    return rdflib.Literal(value, lang=language, datatype=datatype)
+
+
 class NIFParser:
-    def __init__(self, nif_path, tuple_format='nquads'):
-        if nif_path.endswith(".bz2"):
-            self.__nif = bz2.BZ2File(nif_path)
-        else:
-            self.__nif = open(nif_path)
+    r"""Read the statements of a NIF dump in the N-Quads (or N-Triples)
+    format, the file can be compressed by bz2. Each iteration returns the
+    list of the statements on the next line, the terms are :mod:`rdflib`
+    terms, and the context of a quad is the IRI of its graph.
+
+    Args:
+        nif_path: The path of the NIF file.
+        tuple_format: `"nquads"` to read the ``(s, v, o, c)`` quads, or
+            `"nt"` to read the ``(s, v, o)`` triples.
+        buffer_size: The size of the read buffer in bytes.
+    """
+
+    def __init__(self, nif_path: str, tuple_format: str = 'nquads',
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.__nif = open_nquads(nif_path, buffer_size)
+        self.__statements = parse_nquads(
+            self.__nif, uri=rdflib.URIRef, literal=to_rdf_literal,
+            bnode=rdflib.BNode)
 
         self.format = tuple_format
 
@@ -120,6 +145,9 @@ class NIFParser:
         return self.read()
 
     def parse_graph(self, data: str, tuple_format: str) -> List:
+        r"""Parse the statements in ``data`` by building a :mod:`rdflib`
+        graph, which is much slower than the streaming parsing of
+        :meth:`read`."""
         if self.format == 'nquads':
             g_ = rdflib.ConjunctiveGraph()
         else:
@@ -132,16 +160,11 @@ class NIFParser:
         else:
             return list(g_)
 
-    def read(self):
-        while True:
-            line = next(self.__nif)
-            statements = list(self.parse_graph(
-                line.decode('utf-8'),
-                tuple_format=self.format
-            ))
-
-            if len(statements) > 0:
-                return list(statements)
+    def read(self) -> List[Tuple]:
+        statement = next(self.__statements)
+        if self.format == 'nquads':
+            return [statement]
+        return [statement[:3]]
 
     def close(self):
         self.__nif.close()
@@ -168,44 +191,69 @@ class ContextGroupedNIFReader:
         res_c: str = ''
         res_states: List = []
 
-        while True:
-            try:
-                for statements in self.__parser:
-                    for s, v, o, c in statements:
-                        c_ = context_base(c)
+        for statements in self.__parser:
+            for s, v, o, c in statements:
+                c_ = context_base(c)
 
-                        if c_ != self.__last_c and self.__last_c != '':
-                            res_c = self.__last_c
-                            res_states.extend(self.__statements)
-                            self.__statements.clear()
+                if c_ != self.__last_c and self.__last_c != '':
+                    res_c = self.__last_c
+                    res_states.extend(self.__statements)
+                    self.__statements.clear()
 
-                        self.__statements.append((s, v, o))
-                        self.__last_c = c_
+                self.__statements.append((s, v, o))
+                self.__last_c = c_
 
-                        if not res_c == '':
-                            return res_c, res_states
-            except StopIteration:
-                break
+                if not res_c == '':
+                    return res_c, res_states
 
+        # The end of the file, return the last context once.
         if len(self.__statements) > 0:
-            return self.__last_c, self.__statements
+            res_states.extend(self.__statements)
+            self.__statements.clear()
+            return self.__last_c, res_states
+        raise StopIteration
 
 
 class NIFBufferedContextReader:
-    def __init__(self, nif_path: str, window_size: int = 2000):
+    r"""Look up the statements of a context in a NIF file.
+
+    By default, the file is read in order with a window of contexts, see
+    :meth:`get`. If ``index_dir`` is given, the file is first indexed by the
+    contexts into a SQLite database (see :class:`NIFContextIndex`) in this
+    directory, so that any context can be found regardless of the order.
+
+    Args:
+        nif_path: The path of the NIF file.
+        window_size: The number of contexts kept in the reading window.
+        index_dir (str, optional): The directory of the context indices.
+        cache_size: The number of contexts to cache when reading from the
+            index.
+    """
+
+    def __init__(self, nif_path: str, window_size: int = 2000,
+                 index_dir: Optional[str] = None, cache_size: int = 1024):
         self.data_name = os.path.basename(nif_path)
-        self.buf = AutoPopBuffer(
-            data_iter=ContextGroupedNIFReader(nif_path),
-            default_value=[],
-            window_size=window_size
-        )
+        self.index: Optional[NIFContextIndex] = None
+        if index_dir is None:
+            self.buf = AutoPopBuffer(
+                data_iter=ContextGroupedNIFReader(nif_path),
+                default_value=[],
+                window_size=window_size
+            )
+        else:
+            self.index = NIFContextIndex(
+                nif_path,
+                os.path.join(index_dir, self.data_name + '.sqlite'),
+                cache_size)
 
-    def get(self, context: Union[rdflib.Graph, str]) -> List[state_type]:
+    def get(self, context: Union[rdflib.Graph, rdflib.URIRef, str]
+            ) -> List[state_type]:
         """
         We assume the order of querying keys is roughly the same as the order
         of keys in this data, that means we can find the key (context) within
         the current reading window. This is asymptotically similar to a full
-        dataset search by increasing the window size.
+        dataset search by increasing the window size. The assumption is not
+        needed when the context index is used.
 
         Args:
             context: The context to find in this window.
@@ -216,10 +264,114 @@ class NIFBufferedContextReader:
 
         """
         context_ = context_base(context) if isinstance(
-            context, rdflib.Graph) else str(context)
+            context, (rdflib.Graph, rdflib.URIRef)) else str(context)
+        if self.index is not None:
+            return self.index.get(context_)
         return self.buf.get_key(context_)
 
 
+class NIFContextIndex:
+    r"""An on-disk index from the contexts (without the URL parameters, see
+    :func:`context_base`) to the statements of a NIF file, stored in a
+    SQLite database. The index is built by a pass over the file if the
+    database does not exist, afterwards each lookup is a B-tree search, and
+    the recently used contexts are cached. The lookups can be made from any
+    thread (e.g. the prefetching thread of a reader), the queries to the
+    database are serialized.
+
+    Args:
+        nif_path: The path of the NIF file, can be bz2 compressed.
+        index_path: The path of the database.
+        cache_size: The number of contexts to cache.
+    """
+
+    def __init__(self, nif_path: str, index_path: str,
+                 cache_size: int = 1024):
+        if not os.path.exists(index_path):
+            self.build(nif_path, index_path)
+        # The connection is shared by the threads, guarded by the lock.
+        self.__connection = sqlite3.connect(
+            index_path, check_same_thread=False)
+        self.__lock = threading.Lock()
+        self.__cached_get = functools.lru_cache(maxsize=cache_size)(
+            self.__get)
+
+    @staticmethod
+    def build(nif_path: str, index_path: str, batch_size: int = 10000):
+        r"""Index the statements of ``nif_path`` into the database at
+        ``index_path``. The raw lines of each run of statements in the same
+        context are stored as one row, they are parsed when looked up.
+
+        Args:
+            nif_path: The path of the NIF file, can be bz2 compressed.
+            index_path: The path of the database.
+            batch_size: The number of rows inserted at once.
+        """
+        logging.info("Indexing the contexts of %s into %s.", nif_path,
+                     index_path)
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)),
+                    exist_ok=True)
+        # The database is moved in place once complete.
+        tmp_path = index_path + '.tmp'
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        connection = sqlite3.connect(tmp_path)
+        connection.execute('PRAGMA journal_mode = OFF')
+        connection.execute('PRAGMA synchronous = OFF')
+        connection.execute('CREATE TABLE contexts (key TEXT, lines TEXT)')
+
+        rows: List[Tuple[str, str]] = []
+        last_graph: Optional[str] = None
+        key: str = ''
+        lines: List[str] = []
+        with open_nquads(nif_path) as nif:
+            for line in nif:
+                graph = statement_graph(line)
+                if graph is None:
+                    continue
+                if graph != last_graph:
+                    new_key = strip_url_params(graph)
+                    if new_key != key and lines:
+                        rows.append((key, ''.join(lines)))
+                        lines = []
+                        if len(rows) >= batch_size:
+                            connection.executemany(
+                                'INSERT INTO contexts VALUES (?, ?)', rows)
+                            rows.clear()
+                    key = new_key
+                    last_graph = graph
+                lines.append(line)
+        if lines:
+            rows.append((key, ''.join(lines)))
+        connection.executemany('INSERT INTO contexts VALUES (?, ?)', rows)
+        connection.execute('CREATE INDEX context_keys ON contexts (key)')
+        connection.commit()
+        connection.close()
+        os.replace(tmp_path, index_path)
+
+    def __get(self, context: str) -> List[state_type]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT lines FROM contexts WHERE key = ? ORDER BY rowid',
+                (context,)).fetchall()
+        statements: List[state_type] = []
+        for (lines,) in rows:
+            statements.extend(
+                (s, v, o) for s, v, o, _ in parse_nquads(
+                    lines.split('\n'), uri=rdflib.URIRef,
+                    literal=to_rdf_literal, bnode=rdflib.BNode))
+        return statements
+
+    def get(self, context: str) -> List[state_type]:
+        r"""Get the statements of ``context``, return an empty list if the
+        context is not found."""
+        return self.__cached_get(context)
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+
 class AutoPopBuffer:
     def __init__(self, data_iter: Iterator, default_value,
                  window_size: int = 100):
@@ -244,11 +396,11 @@ class AutoPopBuffer:
                 self.__data_idx += 1
                 if k_ == key:
                     value = data
-                else:
-                    self.buf_data[k_] = (data, self.__data_idx)
-                    if self.__data_idx - self.__lookup_idx > self.__window_size:
-                        # Give up on this search.
-                        break
+                    break
+                self.buf_data[k_] = (data, self.__data_idx)
+                if self.__data_idx - self.__lookup_idx > self.__window_size:
+                    # Give up on this search.
+                    break
 
         if len(self.buf_data) > 0:
             # Find the oldest index.
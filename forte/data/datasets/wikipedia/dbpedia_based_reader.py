@@ -130,9 +130,12 @@ class DBpediaWikiReader(PackReader):
         # These NIF readers organize the statements in the specific RDF context,
         # in this case each context correspond to one wiki page, this allows
         # us to read the information more systematically.
+        # If the context index directory is set, the contexts are looked up
+        # in an on-disk index instead of the reading window.
         self.struct_reader = NIFBufferedContextReader(
-            configs.nif_page_structure)
-        self.link_reader = NIFBufferedContextReader(configs.nif_text_links)
+            configs.nif_page_structure, index_dir=configs.context_index_dir)
+        self.link_reader = NIFBufferedContextReader(
+            configs.nif_text_links, index_dir=configs.context_index_dir)
 
     def _collect(self, nif_context: str  # type: ignore
                  ) -> Iterator[Tuple[Dict[str, str],
@@ -143,14 +146,13 @@ class DBpediaWikiReader(PackReader):
         for context_statements in NIFParser(nif_context):
             for s, v, o, c in context_statements:
                 nif_type = get_resource_attribute(s, "nif")
-                print_progress(f'Collecting DBpedia context: [{c.identifier}]')
+                print_progress(f'Collecting DBpedia context: [{c}]')
 
                 if nif_type and nif_type == "context" and get_resource_fragment(
                         v) == 'isString':
                     str_data['text'] = o.toPython()
                     str_data['doc_name'] = get_resource_name(s)
-                    str_data['oldid'] = get_resource_attribute(
-                        c.identifier, 'oldid')
+                    str_data['oldid'] = get_resource_attribute(c, 'oldid')
 
                     node_data['struct'] = self.struct_reader.get(c)
                     node_data['links'] = self.link_reader.get(c)
@@ -199,4 +201,5 @@ class DBpediaWikiReader(PackReader):
             'redirect_path': None,
             'nif_page_structure': None,
             'nif_text_links': None,
+            'context_index_dir': None,
         }
@@ -85,9 +85,9 @@ class DBpediaInfoBoxReader(PackReader):
         self.redirects = resources.get('redirects')
 
         self.literal_info_reader = NIFBufferedContextReader(
-            configs.mapping_literals)
+            configs.mapping_literals, index_dir=configs.context_index_dir)
         self.object_info_reader = NIFBufferedContextReader(
-            configs.mapping_objects)
+            configs.mapping_objects, index_dir=configs.context_index_dir)
 
         # Set up logging.
         f_handler = logging.FileHandler(configs.reading_log)
@@ -145,5 +145,6 @@ class DBpediaInfoBoxReader(PackReader):
             'pack_dir': '.',
             'mapping_literals': None,
             'mapping_objects': None,
+            'context_index_dir': None,
             'reading_log': 'infobox.log',
         }
@@ -0,0 +1,221 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A streaming tokenizer of the N-Quads and N-Triples formats, used to read the
+large DBpedia NIF dumps without building an RDF graph for each statement.
+"""
+import bz2
+import io
+import re
+import shutil
+import subprocess
+from typing import (
+    Any, BinaryIO, Callable, Iterable, Iterator, Optional, TextIO, Tuple,
+    cast)
+
+__all__ = [
+    "parse_nquads",
+    "statement_graph",
+    "open_nquads",
+]
+
+# The size of the read buffer of the (decompressed) input.
+DEFAULT_BUFFER_SIZE = 16 * 1024 * 1024
+
+# The parallel bzip2 decompressors to use when they are installed.
+_PARALLEL_BZIP2 = ('lbzip2', 'pbzip2')
+
+# A blank node label cannot end with a dot.
+_BNODE = r'_:([^\s<>".]+(?:\.[^\s<>".]+)*)'
+
+_STATEMENT = re.compile(r'''
+    \s*(?:<([^>]*)>|''' + _BNODE + r''')            # subject
+    \s*<([^>]*)>                                    # predicate
+    \s*(?:<([^>]*)>|''' + _BNODE + r'''|            # object
+        "([^"\\]*(?:\\.[^"\\]*)*)"
+        (?:@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*)|\^\^<([^>]*)>)?)
+    \s*(?:<([^>]*)>|''' + _BNODE + r''')?           # graph
+    \s*\.\s*$''', re.VERBOSE)
+
+_ESCAPE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+
+_ESCAPED_CHARS = {
+    't': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f', '"': '"',
+    "'": "'", '\\': '\\',
+}
+
+
+def _replace_escape(match) -> str:
+    code = match.group(1) or match.group(2)
+    if code is not None:
+        return chr(int(code, 16))
+    try:
+        return _ESCAPED_CHARS[match.group(3)]
+    except KeyError:
+        raise ValueError(  # pylint: disable=raise-missing-from
+            f"Invalid escape sequence {match.group(0)}.")
+
+
+def _unescape(text: str) -> str:
+    if '\\' not in text:
+        return text
+    if '\\\\' not in text and '\\u' not in text and '\\U' not in text:
+        # Each backslash starts a single character escape, which can be
+        # replaced one by one without the (slower) regular expression.
+        for escape, char in _ESCAPED_CHARS.items():
+            if escape != '\\':
+                text = text.replace('\\' + escape, char)
+        if '\\' not in text:
+            return text
+    return _ESCAPE.sub(_replace_escape, text)
+
+
+def _plain_literal(value: str, language: Optional[str],
+                   datatype: Optional[str]) -> str:
+    # pylint: disable=unused-argument
+    return value
+
+
+def _plain_bnode(label: str) -> str:
+    return '_:' + label
+
+
+def parse_nquads(
+        lines: Iterable[str],
+        uri: Callable[[str], Any] = str,
+        literal: Callable[[str, Optional[str], Optional[Any]],
+                          Any] = _plain_literal,
+        bnode: Callable[[str], Any] = _plain_bnode,
+) -> Iterator[Tuple[Any, Any, Any, Any]]:
+    r"""Parse the N-Quads (or N-Triples) statements, one statement per line.
+    Each line is matched by a single regular expression, so the throughput is
+    much higher than parsing each line with a RDF library. The terms are
+    created by the given factories, by default the IRIs and the literal
+    values are returned as strings.
+
+    Args:
+        lines: The lines of the N-Quads input, the empty lines and the
+            comment lines are skipped.
+        uri: The factory of the IRI terms, called with the IRI.
+        literal: The factory of the literal terms, called with the value,
+            the language tag and the datatype (as created by ``uri``), the
+            latter two may be `None`.
+        bnode: The factory of the blank node terms, called with the label.
+
+    Returns:
+        An iterator of the ``(subject, predicate, object, graph)`` tuples,
+        the graph is `None` for the statements without one (the N-Triples
+        statements).
+    """
+    match = _STATEMENT.match
+    for line_no, line in enumerate(lines, 1):
+        m = match(line)
+        if m is None:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            raise ValueError(
+                f"Invalid N-Quads statement at line {line_no}: {stripped}")
+
+        (s_iri, s_bnode, p_iri, o_iri, o_bnode, o_value, o_lang, o_type,
+         g_iri, g_bnode) = m.groups()
+
+        s = uri(_unescape(s_iri)) if s_bnode is None else bnode(s_bnode)
+        if o_iri is not None:
+            o = uri(_unescape(o_iri))
+        elif o_bnode is not None:
+            o = bnode(o_bnode)
+        else:
+            o = literal(
+                _unescape(o_value), o_lang,
+                None if o_type is None else uri(_unescape(o_type)))
+        if g_iri is not None:
+            g = uri(_unescape(g_iri))
+        elif g_bnode is not None:
+            g = bnode(g_bnode)
+        else:
+            g = None
+        yield s, uri(_unescape(p_iri)), o, g
+
+
+def statement_graph(line: str) -> Optional[str]:
+    r"""Get the graph of the N-Quads statement on ``line`` without creating
+    the other terms.
+
+    Args:
+        line: A line of the N-Quads input.
+
+    Returns:
+        The graph IRI (or the blank node as `"_:label"`), `None` if the
+        statement does not have a graph, or the line is empty or a comment.
+    """
+    m = _STATEMENT.match(line)
+    if m is None:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            return None
+        raise ValueError(f"Invalid N-Quads statement: {stripped}")
+    g_iri, g_bnode = m.group(9, 10)
+    if g_iri is not None:
+        return _unescape(g_iri)
+    if g_bnode is not None:
+        return _plain_bnode(g_bnode)
+    return None
+
+
+class _ProcessOutput(io.TextIOWrapper):
+    r"""The decoded output of a decompression process, which is terminated
+    when the stream is closed."""
+
+    def __init__(self, process: subprocess.Popen):
+        super().__init__(
+            cast(BinaryIO, process.stdout), encoding='utf-8')
+        self.__process = process
+
+    def close(self):
+        if self.__process.poll() is None:
+            self.__process.terminate()
+        super().close()
+        self.__process.wait()
+
+
+def open_nquads(path: str,
+                buffer_size: int = DEFAULT_BUFFER_SIZE) -> TextIO:
+    r"""Open a (possibly bz2 compressed) N-Quads file for reading as text.
+    The ``.bz2`` files are decompressed by a parallel bzip2 decompressor
+    (``lbzip2`` or ``pbzip2``) in a separate process if one is installed,
+    otherwise by :mod:`bz2` through a large read buffer.
+
+    Args:
+        path: The path of the file.
+        buffer_size: The size of the read buffer in bytes.
+
+    Returns:
+        The text stream of the file.
+    """
+    if not path.endswith('.bz2'):
+        return open(path, encoding='utf-8', buffering=buffer_size)
+
+    for decompressor in _PARALLEL_BZIP2:
+        executable = shutil.which(decompressor)
+        if executable is not None:
+            # pylint: disable=consider-using-with
+            process = subprocess.Popen(
+                [executable, '-d', '-c', path], stdout=subprocess.PIPE,
+                bufsize=buffer_size)
+            return _ProcessOutput(process)
+
+    return io.TextIOWrapper(
+        io.BufferedReader(bz2.BZ2File(path), buffer_size=buffer_size),
+        encoding='utf-8')
@@ -0,0 +1,140 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Utilities to split the DBpedia NIF dumps into shards that can be processed
+independently. The statements are assigned to the shards by the hash of their
+context, so the statements of the same page in different dumps (e.g. the
+context, the page structure and the text links) are in the shards of the same
+index, and in the same relative order as in the dumps.
+"""
+import csv
+import logging
+import os
+import zlib
+from contextlib import ExitStack
+from typing import List, Optional, Sequence
+
+from forte.data.datasets.wikipedia.db_utils import strip_url_params
+from forte.data.datasets.wikipedia.nquads import (
+    DEFAULT_BUFFER_SIZE, open_nquads, statement_graph)
+
+__all__ = [
+    "shard_of",
+    "shard_paths",
+    "shard_nif_file",
+    "merge_pack_indices",
+]
+
+
+def shard_of(context: Optional[str], num_shards: int) -> int:
+    r"""The shard of the statements in ``context``, the contexts are compared
+    without the URL parameters, same as
+    :func:`~forte.data.datasets.wikipedia.db_utils.context_base`.
+
+    Args:
+        context: The context (graph) IRI of the statements, the statements
+            without a context are all assigned to the first shard.
+        num_shards: The number of shards.
+
+    Returns:
+        The shard index.
+    """
+    if context is None:
+        return 0
+    return zlib.crc32(strip_url_params(context).encode('utf-8')) % num_shards
+
+
+def shard_paths(nif_path: str, output_dir: str, num_shards: int
+                ) -> List[str]:
+    r"""The paths of the shards of ``nif_path`` created by
+    :func:`shard_nif_file`."""
+    name = os.path.basename(nif_path)
+    if name.endswith('.bz2'):
+        name = name[:-len('.bz2')]
+    return [os.path.join(output_dir, f'{name}-{i:05d}-of-{num_shards:05d}')
+            for i in range(num_shards)]
+
+
+def shard_nif_file(nif_path: str, output_dir: str, num_shards: int,
+                   buffer_size: int = DEFAULT_BUFFER_SIZE) -> List[str]:
+    r"""Split a NIF dump into ``num_shards`` uncompressed N-Quads files by
+    :func:`shard_of` the context of each statement. The shards are written
+    to temporary files first, and the existing shards are reused, so an
+    interrupted run can be resumed.
+
+    Args:
+        nif_path: The path of the NIF dump, can be bz2 compressed.
+        output_dir: The directory to write the shards.
+        num_shards: The number of shards.
+        buffer_size: The size of the read and write buffers in bytes.
+
+    Returns:
+        The paths of the shards, ordered by the shard index.
+    """
+    paths = shard_paths(nif_path, output_dir, num_shards)
+    if all(os.path.exists(p) for p in paths):
+        logging.info("Reusing the shards of %s.", nif_path)
+        return paths
+
+    os.makedirs(output_dir, exist_ok=True)
+    logging.info("Splitting %s into %d shards.", nif_path, num_shards)
+    with ExitStack() as stack:
+        lines = stack.enter_context(open_nquads(nif_path, buffer_size))
+        shard_files = [
+            stack.enter_context(open(
+                p + '.tmp', 'w', encoding='utf-8',
+                buffering=buffer_size // num_shards or 1))
+            for p in paths]
+
+        # The statements of one context are usually consecutive.
+        last_graph: Optional[str] = None
+        shard_file = shard_files[0]
+        for line in lines:
+            graph = statement_graph(line)
+            if graph != last_graph:
+                shard_file = shard_files[shard_of(graph, num_shards)]
+                last_graph = graph
+            shard_file.write(line)
+
+    for p in paths:
+        os.replace(p + '.tmp', p)
+    return paths
+
+
+def merge_pack_indices(shard_dirs: Sequence[str], output_dir: str,
+                       index_name: str = 'article.idx') -> str:
+    r"""Merge the pack indices written in the shard directories (e.g. by the
+    ``WikiArticleWriter`` of the Wikipedia example) into one index in
+    ``output_dir``, which can be read by
+    :func:`~forte.data.datasets.wikipedia.dbpedia_infobox_reader.read_index`.
+    The pack paths of the merged index are relative to ``output_dir``.
+
+    Args:
+        shard_dirs: The output directories of the shards.
+        output_dir: The directory to write the merged index.
+        index_name: The file name of the indices.
+
+    Returns:
+        The path of the merged index.
+    """
+    merged_path = os.path.join(output_dir, index_name)
+    with open(merged_path, 'w') as merged:
+        writer = csv.writer(merged, delimiter='\t')
+        for shard_dir in shard_dirs:
+            relative_dir = os.path.relpath(shard_dir, output_dir)
+            with open(os.path.join(shard_dir, index_name)) as index:
+                for page_name, page_path in csv.reader(index, delimiter='\t'):
+                    writer.writerow(
+                        [page_name, os.path.join(relative_dir, page_path)])
+    return merged_path
@@ -15,7 +15,9 @@
 import logging
 from collections import defaultdict
 from typing import DefaultDict, Dict, List, Set, Type, Hashable, Generic, \
-    Iterable, Tuple
+    Iterable, Tuple, Sequence, Optional, Union
+
+import numpy as np
 
 from forte.common.exception import PackIndexError
 from forte.data.ontology.core import GroupType, LinkType, EntryType
@@ -45,6 +47,11 @@ class BaseIndex(Generic[EntryType]):
         # Mapping from entry's type to entries' id.
         self._type_index: DefaultDict[Type, Set[int]] = defaultdict(set)
 
+        # Mapping from a queried type to the types in the type index that are
+        # the type itself or its subclasses. This is reset when a new type is
+        # added to the type index.
+        self._subtype_cache: Dict[Type, List[Type]] = dict()
+
         # List of other indexes (built when first looked up).
         self._group_index: DefaultDict[Hashable, Set[int, int]] = defaultdict(
             set)
@@ -71,7 +78,46 @@ class BaseIndex(Generic[EntryType]):
         """
         for entry in entries:
             self._entry_index[entry.tid] = entry
-            self._type_index[type(entry)].add(entry.tid)
+            entry_type = type(entry)
+            if entry_type not in self._type_index:
+                self._subtype_cache.clear()
+            self._type_index[entry_type].add(entry.tid)
+
+    def update_entries_of_type(self, entry_type: Type,
+                               entries: List[EntryType]):
+        r"""Register ``entries``, which are all of ``entry_type``, in the
+        basic indexes in one pass. This is equivalent to
+        :meth:`update_basic_index` on the entries.
+
+        Args:
+            entry_type: The type of the entries.
+            entries: The entries to be added into the basic index.
+        """
+        tids = [entry.tid for entry in entries]
+        self._entry_index.update(zip(tids, entries))
+        self.update_type_index(entry_type, tids)
+
+    def update_entry_index(self, entry: EntryType):
+        r"""Register ``entry`` in :attr:`entry_index` only, this is used when
+        the entry is already recorded in the :attr:`type_index`.
+
+        Args:
+            entry: The entry to be registered.
+        """
+        self._entry_index[entry.tid] = entry
+
+    def update_type_index(self, entry_type: Type, tids: Iterable[int]):
+        r"""Record ``tids`` in :attr:`type_index` without registering the
+        entries in :attr:`entry_index`. This is used for the entries that are
+        not created as objects yet.
+
+        Args:
+            entry_type: The type of the entries.
+            tids: The tids of the entries.
+        """
+        if entry_type not in self._type_index:
+            self._subtype_cache.clear()
+        self._type_index[entry_type].update(tids)
 
     def get_entry(self, tid: int) -> EntryType:
         return self._entry_index[tid]
@@ -80,6 +126,38 @@ class BaseIndex(Generic[EntryType]):
         for t, ids in self._type_index.items():
             yield t, ids
 
+    def subtypes(self, entry_type: Type) -> List[Type]:
+        r"""Look up the types in :attr:`type_index` that are ``entry_type`` or
+        its subclasses. The result is cached until a new type is added to
+        :attr:`type_index`.
+
+        Args:
+            entry_type: The type being looked up.
+
+        Returns:
+            A list of the indexed types.
+        """
+        try:
+            return self._subtype_cache[entry_type]
+        except KeyError:
+            subtypes = [t for t in self._type_index
+                        if issubclass(t, entry_type)]
+            self._subtype_cache[entry_type] = subtypes
+            return subtypes
+
+    def type_ids(self, entry_type: Type) -> List[Set[int]]:
+        r"""Look up the tid sets in :attr:`type_index` of ``entry_type`` and
+        its subclasses. The sets are the ones in the index, not copies, so
+        they should not be modified.
+
+        Args:
+            entry_type: The type being looked up.
+
+        Returns:
+            A list of tid sets, one for each of the :meth:`subtypes`.
+        """
+        return [self._type_index[t] for t in self.subtypes(entry_type)]
+
     def remove_entry(self, entry: EntryType):
         self._entry_index.pop(entry.tid)
         self._type_index[type(entry)].remove(entry.tid)
@@ -193,8 +271,8 @@ class BaseIndex(Generic[EntryType]):
             raise PackIndexError("Group index has not been built.")
 
         for group in groups:
-            for member in group.members:
-                self._group_index[member].add(group.tid)
+            for member in group.get_members():
+                self._group_index[member.index_key].add(group.tid)
 
     def add_link_parent(self, parent: EntryType, link: LinkType):
         self._link_index["parent_index"][parent.index_key].add(link.tid)
@@ -204,3 +282,117 @@ class BaseIndex(Generic[EntryType]):
 
     def add_group_member(self, member: EntryType, group: GroupType):
         self._group_index[member.index_key].add(group.tid)
+
+
+class SpanIndex:
+    r"""An interval index over the spans of a set of annotations. The spans
+    are kept in numpy arrays sorted by the natural order of the annotations
+    (``begin``, ``end``, type name and ``tid``), so range queries are
+    answered with a few ``searchsorted`` calls instead of a scan over the
+    annotations.
+
+    Args:
+        begins: The begin offsets of the annotations.
+        ends: The end offsets of the annotations.
+        tids: The tids of the annotations.
+        ranks (optional): The rank of the type name of each annotation, used
+            to break ties between annotations with the same span.
+    """
+
+    def __init__(self, begins: Union[Sequence[int], np.ndarray],
+                 ends: Union[Sequence[int], np.ndarray],
+                 tids: Union[Sequence[int], np.ndarray],
+                 ranks: Optional[Union[Sequence[int], np.ndarray]] = None):
+        begins = np.asarray(begins, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        tids = np.asarray(tids, dtype=np.int64)
+        if ranks is None:
+            order = np.lexsort((tids, ends, begins))
+        else:
+            order = np.lexsort(
+                (tids, np.asarray(ranks, dtype=np.int64), ends, begins))
+
+        self.begins: np.ndarray = begins[order]
+        self.ends: np.ndarray = ends[order]
+        self.tids: np.ndarray = tids[order]
+        # The longest span bounds how far before a range an overlapping
+        # annotation can begin.
+        self._max_length: int = int(
+            (self.ends - self.begins).max()) if len(order) else 0
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    def _bounds(self, begins: np.ndarray, ends: np.ndarray,
+                overlap: bool) -> Tuple[np.ndarray, np.ndarray]:
+        if overlap:
+            lo = np.searchsorted(
+                self.begins, begins - self._max_length, side='right')
+            hi = np.searchsorted(self.begins, ends, side='left')
+        else:
+            lo = np.searchsorted(self.begins, begins, side='left')
+            hi = np.searchsorted(self.begins, ends, side='right')
+        return lo, hi
+
+    def _select(self, lo: int, hi: int, begin: int, end: int,
+                overlap: bool) -> np.ndarray:
+        ends = self.ends[lo:hi]
+        if overlap:
+            return self.tids[lo:hi][ends > begin]
+        return self.tids[lo:hi][ends <= end]
+
+    def query(self, begin: int, end: int, overlap: bool = False
+              ) -> np.ndarray:
+        r"""Find the annotations inside, or overlapping with, the range
+        ``[begin, end]``.
+
+        Args:
+            begin (int): The begin of the range.
+            end (int): The end of the range.
+            overlap (bool): If `False`, return the annotations that lie
+                entirely inside the range. If `True`, return the annotations
+                that overlap with the range.
+
+        Returns:
+            The tids of the annotations, in the order of the annotations.
+        """
+        lo, hi = self._bounds(
+            np.asarray(begin), np.asarray(end), overlap)
+        return self._select(int(lo), int(hi), begin, end, overlap)
+
+    def batch_query(self, begins: Union[Sequence[int], np.ndarray],
+                    ends: Union[Sequence[int], np.ndarray],
+                    overlap: bool = False) -> List[np.ndarray]:
+        r"""The batched form of :meth:`query`, the bounds of all the ranges
+        are searched at once.
+
+        Args:
+            begins: The begins of the ranges.
+            ends: The ends of the ranges.
+            overlap (bool): Whether to find the overlapping annotations
+                instead of the ones inside the ranges.
+
+        Returns:
+            A list with the tids found for each range.
+        """
+        begins = np.asarray(begins, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        lo, hi = self._bounds(begins, ends, overlap)
+        return [self._select(l, h, b, e, overlap) for l, h, b, e in zip(
+            lo.tolist(), hi.tolist(), begins.tolist(), ends.tolist())]
+
+    def covering(self, begin: int, end: int) -> np.ndarray:
+        r"""Find the annotations that cover the range ``[begin, end]``, i.e.
+        the range lies entirely inside them.
+
+        Args:
+            begin (int): The begin of the range.
+            end (int): The end of the range.
+
+        Returns:
+            The tids of the annotations, in the order of the annotations.
+        """
+        lo = int(np.searchsorted(
+            self.begins, end - self._max_length, side='left'))
+        hi = int(np.searchsorted(self.begins, begin, side='right'))
+        return self.tids[lo:hi][self.ends[lo:hi] >= end]
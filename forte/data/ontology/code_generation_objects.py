@@ -431,7 +431,8 @@ class EntryDefinition(Item):
                  init_args: Optional[str] = None,
                  properties: Optional[List[Property]] = None,
                  class_attributes: Optional[List[ClassTypeDefinition]] = None,
-                 description: Optional[str] = None):
+                 description: Optional[str] = None,
+                 use_slots: bool = False):
         super().__init__(name, description)
         self.class_type = class_type
         self.properties: List[Property] = \
@@ -441,6 +442,7 @@ class EntryDefinition(Item):
         self.description = description if description else None
         self.init_args = init_args if init_args is not None else ''
         self.init_args = self.init_args.replace('=', ' = ')
+        self.use_slots = use_slots
 
     def to_init_code(self, level: int) -> str:
         return indent_line(f"def __init__(self, {self.init_args}):", level)
@@ -452,6 +454,10 @@ class EntryDefinition(Item):
         return indent_code([indent_line(line, 0) for line in lines], level,
                            False)
 
+    def to_slots_code(self, level: int) -> str:
+        names = ''.join(f"'{p.field_name}', " for p in self.properties)
+        return indent_line(f"__slots__ = ({names.rstrip()})", level)
+
     def to_class_attribute_code(self, level: int):
         lines = [item.to_code(0) for item in self.class_attributes]
         return indent_code([indent_line(line, 0) for line in lines], level,
@@ -473,6 +479,10 @@ class EntryDefinition(Item):
 
         lines.append('')
 
+        if self.use_slots:
+            lines.append(self.to_slots_code(1))
+            lines.append('')
+
         property_code = self.to_property_code(1)
         if property_code:
             lines.append(property_code)
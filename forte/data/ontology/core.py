@@ -19,11 +19,14 @@ representation system.
 from abc import abstractmethod, ABC
 from collections.abc import MutableSequence, MutableMapping
 from dataclasses import dataclass
+from types import MemberDescriptorType
 from typing import (
     Iterable, Optional, Type, Hashable, TypeVar, Generic,
-    Union, Dict, Iterator, get_type_hints, overload, List)
+    Union, Dict, Iterator, get_type_hints, overload, List, Any,
+    Callable, ClassVar)
 
 import numpy as np
+from typing_inspect import is_union_type, get_origin
 
 from forte.common import PackDataException
 from forte.data.container import ContainerType, BasePointer
@@ -39,7 +42,10 @@ __all__ = [
     "MpPointer",
     "FDict",
     "FList",
-    "MultiEntry"
+    "MultiEntry",
+    "set_type_check",
+    "is_type_check_enabled",
+    "check_field_values",
 ]
 
 from forte.utils.utils import check_type
@@ -49,6 +55,183 @@ default_entry_fields = [
     '_members', '_Entry__field_modified', 'field_records', 'creation_records',
     '_id_manager']
 
+# Whether the values assigned to the entry fields are validated against the
+# type hints of the fields.
+_type_check: bool = True
+
+
+def set_type_check(enabled: bool):
+    r"""Turn on or off the runtime validation of the values assigned to the
+    entry fields. The validation is on by default, it can be turned off in
+    production to speed up the creation of the entries.
+
+    Args:
+        enabled (bool): Whether to validate the field values.
+    """
+    global _type_check
+    _type_check = enabled
+
+
+def is_type_check_enabled() -> bool:
+    r"""Whether the values assigned to the entry fields are validated."""
+    return _type_check
+
+
+def _compile_type_check(tp: Any) -> Callable[[Any], bool]:
+    r"""Compile the type hint ``tp`` into a function that validates a value,
+    which gives the same result as :func:`~forte.utils.utils.check_type`.
+    The common hints (classes, generic containers and their unions) are
+    reduced to a single :func:`isinstance` call.
+    """
+    classes: List[type] = []
+    hints = [tp]
+    while hints:
+        hint = hints.pop()
+        if is_union_type(hint):
+            hints.extend(hint.__args__)
+            continue
+        origin = get_origin(hint)
+        if origin is not None and origin != hint:
+            hint = origin
+        if not isinstance(hint, type):
+            return lambda value: check_type(value, tp)
+        classes.append(hint)
+    class_tuple = tuple(classes)
+    return lambda value: isinstance(value, class_tuple)
+
+
+def _is_class_var(hint: Any) -> bool:
+    if isinstance(hint, str):
+        return hint.startswith(("ClassVar", "typing.ClassVar"))
+    return get_origin(hint) is ClassVar
+
+
+# Marks the fields without a default value.
+_MISSING = object()
+
+
+class _EntryField:
+    r"""The data descriptor of a field declared in an entry class. The value
+    is kept in the ``__dict__`` of the entry under the field name, entries are
+    stored as pointers and resolved when read. The type hint of the field is
+    resolved and compiled once, at the first validation.
+    """
+
+    def __init__(self, owner: type, name: str, default: Any = _MISSING):
+        self.owner = owner
+        self.name = name
+        self.default = default
+        self._check: Optional[Callable[[Any], bool]] = None
+        self._type: Any = None
+
+    def __get__(self, obj, owner=None):
+        try:
+            value = obj.__dict__[self.name]
+        except (AttributeError, KeyError):
+            # The class access, or the value is not set.
+            if self.default is _MISSING:
+                # In particular, this is not taken as a dataclass default.
+                raise AttributeError(self.name) from None
+            return self.default
+        if isinstance(value, BasePointer):
+            return obj.resolve_pointer(value)
+        return value
+
+    def __set__(self, obj, value):
+        if _type_check:
+            self.validate(type(obj), value)
+        if isinstance(value, Entry):
+            value = obj.pointer_to(value)
+        obj.__dict__[self.name] = value
+        obj.pack.record_field(obj.tid, self.name)
+
+    def __delete__(self, obj):
+        try:
+            del obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def validate(self, entry_type: type, value):
+        if self._check is None:
+            self._type = get_type_hints(self.owner)[self.name]
+            self._check = _compile_type_check(self._type)
+        if not self._check(value):
+            raise TypeError(
+                f"The [{self.name}] attribute of [{entry_type}] "
+                f"should be [{self._type}], but got [{type(value)}].")
+
+
+class _SlotEntryField(_EntryField):
+    r"""The descriptor of a field declared in the ``__slots__`` of an entry
+    class, the value is kept in the slot instead of the ``__dict__``.
+    """
+
+    def __init__(self, owner: type, name: str, slot: MemberDescriptorType):
+        super().__init__(owner, name)
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            raise AttributeError(self.name)
+        value = self.slot.__get__(obj, owner)
+        if isinstance(value, BasePointer):
+            return obj.resolve_pointer(value)
+        return value
+
+    def __set__(self, obj, value):
+        if _type_check:
+            self.validate(type(obj), value)
+        if isinstance(value, Entry):
+            value = obj.pointer_to(value)
+        self.slot.__set__(obj, value)
+        obj.pack.record_field(obj.tid, self.name)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+def check_field_values(entry_type: type, name: str, values: Iterable[Any]):
+    r"""Validate the values to be assigned to the field ``name`` of the
+    entries of ``entry_type``, without creating the entries. The values are
+    not checked against the type of the field if the validation is turned off
+    (see :func:`set_type_check`).
+
+    Args:
+        entry_type: The entry class.
+        name: The name of the field.
+        values: The values to be assigned.
+    """
+    field = None
+    for c in entry_type.__mro__:
+        if name in c.__dict__:
+            field = c.__dict__[name]
+            break
+    if not isinstance(field, _EntryField):
+        raise AttributeError(
+            f"[{name}] is not a field of [{entry_type}].")
+    if _type_check:
+        for value in values:
+            field.validate(entry_type, value)
+
+
+# The slots of each entry class, from the name to the member descriptor.
+_slot_members: Dict[type, Dict[str, MemberDescriptorType]] = {}
+
+
+def _get_slot_members(cls: type) -> Dict[str, MemberDescriptorType]:
+    members = _slot_members.get(cls)
+    if members is None:
+        members = {}
+        for c in reversed(cls.__mro__):
+            for name, attr in c.__dict__.items():
+                if isinstance(attr, _SlotEntryField):
+                    members[name] = attr.slot
+                elif (isinstance(attr, MemberDescriptorType)
+                      and name != '__weakref__'):
+                    members[name] = attr
+        _slot_members[cls] = members
+    return members
+
 
 @dataclass
 class Entry(Generic[ContainerType]):
@@ -69,9 +252,42 @@ class Entry(Generic[ContainerType]):
         self.embedding: The embedding vectors (numpy array of floats) of this
             entry.
 
+    The fields declared (by annotations) in the entry classes are managed by
+    data descriptors, which validate the assigned values (see
+    :func:`set_type_check`), store entries as pointers and record the
+    modified fields in the pack. The fields can also be listed in the
+    ``__slots__`` of the class (see the ``use_slots`` option of the
+    :mod:`~forte.data.ontology.ontology_code_generator`), the entries of such
+    classes do not have a ``__dict__``.
+
     Args:
         pack: Each entry should be associated with one pack upon creation.
     """
+    __slots__ = ('__pack', '_tid', '_embedding')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, hint in cls.__dict__.get('__annotations__', {}).items():
+            if name in default_entry_fields or _is_class_var(hint):
+                continue
+            default = _MISSING
+            for c in cls.__mro__:
+                if name in c.__dict__:
+                    default = c.__dict__[name]
+                    break
+            if isinstance(default, _EntryField):
+                default = _MISSING
+            elif (isinstance(default, MemberDescriptorType)
+                  and name in cls.__dict__):
+                setattr(cls, name, _SlotEntryField(cls, name, default))
+                continue
+            elif hasattr(type(default), '__get__'):
+                # Skip the methods and the properties.
+                continue
+            if name not in cls.__dict__ and default is not _MISSING:
+                # The name is not annotated here but is defined in a parent.
+                continue
+            setattr(cls, name, _EntryField(cls, name, default))
 
     def __init__(self, pack: ContainerType):
         # The Entry should have a reference to the data pack, and the data pack
@@ -82,7 +298,8 @@ class Entry(Generic[ContainerType]):
         super().__init__()
         self.__pack: ContainerType = pack
         self._tid: int = self.pack.get_next_id()
-        self._embedding: np.ndarray = np.empty(0)
+        # The embedding is not allocated until it is set.
+        self._embedding: np.ndarray
         self.pack.validate(self)
         self.pack.on_entry_creation(self)
 
@@ -97,14 +314,17 @@ class Entry(Generic[ContainerType]):
         own, without the ``Container`` as the context, there is little semantics
         remained in an entry.
         """
-        state = self.__dict__.copy()
+        state = dict(getattr(self, '__dict__', ()))
+        for name, member in _get_slot_members(type(self)).items():
+            try:
+                state[name] = member.__get__(self)
+            except AttributeError:
+                pass
         # During serialization, convert the numpy array as a list.
-        emb = list(self._embedding.tolist())
-        if len(emb) == 0:
-            state.pop("_embedding")
-        else:
+        emb = list(state.pop("_embedding", np.empty(0)).tolist())
+        if len(emb) > 0:
             state["_embedding"] = emb
-        state.pop('_Entry__pack')
+        state.pop('_Entry__pack', None)
         return state
 
     def __setstate__(self, state):
@@ -115,9 +335,13 @@ class Entry(Generic[ContainerType]):
         # During de-serialization, convert the list back to numpy array.
         if "_embedding" in state:
             state["_embedding"] = np.array(state["_embedding"])
-        else:
-            state["_embedding"] = np.empty(0)
-        self.__dict__.update(state)
+        members = _get_slot_members(type(self))
+        for name, value in state.items():
+            member = members.get(name)
+            if member is None:
+                self.__dict__[name] = value
+            else:
+                member.__set__(self, value)
 
     # using property decorator
     # a getter function for self._embedding
@@ -125,7 +349,10 @@ class Entry(Generic[ContainerType]):
     def embedding(self):
         r"""Get the embedding vectors (numpy array of floats) of the entry.
         """
-        return self._embedding
+        try:
+            return self._embedding
+        except AttributeError:
+            return np.empty(0)
 
     # a setter function for self._embedding
     @embedding.setter
@@ -200,49 +427,20 @@ class Entry(Generic[ContainerType]):
             raise TypeError(
                 f"Unsupported pointer type {ptr.__class__} for entry")
 
-    def _check_attr_type(self, key, value):
+    def pointer_to(self, entry: "Entry") -> BasePointer:
         """
-        Use the type hint to validate whether the provided value is as expected.
+        Get the pointer to store the ``entry`` in a field of this entry.
 
         Args:
-            key:  The field name.
-            value: The field value.
+            entry: The entry to be referred to.
 
         Returns:
-
+             A pointer to the ``entry`` from this entry.
         """
-        if key not in default_entry_fields:
-            hints = get_type_hints(self.__class__)
-            is_valid = check_type(value, hints[key])
-            if not is_valid:
-                raise TypeError(
-                    f"The [{key}] attribute of [{type(self)}] "
-                    f"should be [{hints[key]}], but got [{type(value)}].")
-
-    def __setattr__(self, key, value):
-        self._check_attr_type(key, value)
-
-        if isinstance(value, Entry):
-            if value.pack == self.pack:
-                # Save a pointer to the value from this entry.
-                self.__dict__[key] = Pointer(value.tid)
-            else:
-                raise PackDataException(
-                    "An entry cannot refer to entries in another data pack.")
-        else:
-            super().__setattr__(key, value)
-
-        # We add the record to the system.
-        if key not in default_entry_fields:
-            self.__pack.record_field(self.tid, key)
-
-    def __getattribute__(self, item):
-        v = super().__getattribute__(item)
-        if isinstance(v, BasePointer):
-            # Using the pointer to get the entry.
-            return self.resolve_pointer(v)
-        else:
-            return v
+        if entry.pack != self.pack:
+            raise PackDataException(
+                "An entry cannot refer to entries in another data pack.")
+        return Pointer(entry.tid)
 
     def __eq__(self, other):
         r"""The eq function for :class:`Entry` objects.
@@ -271,24 +469,19 @@ class Entry(Generic[ContainerType]):
 
 
 class MultiEntry(Entry, ABC):
-    def __setattr__(self, key, value):
+    __slots__ = ()
+
+    def pointer_to(self, entry: Entry) -> BasePointer:
         """
         Handle the special sub-entry case in the multi pack case.
 
         Args:
-            key:
-            value:
+            entry: The entry to be referred to.
 
         Returns:
-
+             A pointer to the ``entry`` from this entry.
         """
-        self._check_attr_type(key, value)
-
-        if isinstance(value, Entry):
-            # Save a pointer of the value.
-            self.__dict__[key] = value.as_pointer(self)
-        else:
-            super().__setattr__(key, value)
+        return entry.as_pointer(self)
 
     def as_pointer(self, from_entry: "Entry") -> "Pointer":
         """
@@ -465,6 +658,8 @@ class MpPointer(BasePointer):
 
 
 class BaseLink(Entry, ABC):
+    __slots__ = ()
+
     def __init__(
             self,
             pack: ContainerType,
@@ -540,6 +735,7 @@ class BaseGroup(Entry, Generic[EntryType]):
     This is the :class:`BaseGroup` interface. Specific member constraints are
     defined in the inherited classes.
     """
+    __slots__ = ()
     MemberType: Type[EntryType]
 
     def __init__(
@@ -163,7 +163,7 @@ class OntologyCodeGenerator:
     """
 
     def __init__(self, import_dirs: Optional[List[str]] = None,
-                 generate_all=False):
+                 generate_all=False, use_slots: bool = False):
         """
         Args:
             import_dirs: Additional user provided paths to search the
@@ -172,7 +172,13 @@ class OntologyCodeGenerator:
                 the path where forte is installed (if it is) would be searched.
             generate_all: whether to generate all the packages even if some are
                 already generated.
+            use_slots: whether to declare the attributes of the generated
+                classes in `__slots__`. The instances of such classes do not
+                have a `__dict__`, which saves memory when there are many
+                entries, but new attributes cannot be added to them.
         """
+        self.use_slots = use_slots
+
         # The entries of the `self.top_ontology_module` serve as ancestors of
         # the user-defined entries.
         top_ontology_module: ModuleType = top
@@ -866,7 +872,8 @@ class OntologyCodeGenerator:
             init_args=custom_init_arg_str,
             properties=property_items,
             class_attributes=class_att_items,
-            description=schema.get(SchemaKeywords.description, None))
+            description=schema.get(SchemaKeywords.description, None),
+            use_slots=self.use_slots)
 
         return entry_item, property_names
 
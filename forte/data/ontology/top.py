@@ -39,6 +39,8 @@ QueryType = Union[Dict[str, Any], np.ndarray]
 
 
 class Generics(Entry):
+    __slots__ = ()
+
     def __init__(self, pack: PackType):
         super().__init__(pack=pack)
 
@@ -56,27 +58,53 @@ class Annotation(Entry):
         end (int): The offset of the last character in the annotation + 1.
     """
 
+    # The span is kept as the two offsets, the Span object is created when
+    # requested.
+    __slots__ = ('_begin', '_end')
+
     def __init__(self, pack: PackType, begin: int, end: int):
-        self._span: Optional[Span]
+        self._begin: int
+        self._end: int
         self.set_span(begin, end)
         super().__init__(pack)
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_span'] = Span(state.pop('_begin'), state.pop('_end'))
+        return state
+
+    def __setstate__(self, state):
+        span = state.pop('_span', None)
+        if span is not None:
+            state['_begin'], state['_end'] = span.begin, span.end
+        super().__setstate__(state)
+
     @property
     def span(self):
-        return self._span
+        return Span(self._begin, self._end)
 
     @property
     def begin(self):
-        return self._span.begin
+        return self._begin
 
     @property
     def end(self):
-        return self._span.end
+        return self._end
 
     def set_span(self, begin: int, end: int):
-        r"""Set the span of the annotation.
+        r"""Set the span of the annotation. If the annotation is already in
+        a pack, the pack is kept in order.
         """
-        self._span = Span(begin, end)
+        span = Span(begin, end)
+        # The pack is not set yet when the annotation is being created.
+        pack = getattr(self, '_Entry__pack', None)
+        if pack is None:
+            self._begin = span.begin
+            self._end = span.end
+            return
+        with pack.moving_entry(self):
+            self._begin = span.begin
+            self._end = span.end
 
     def __eq__(self, other):
         r"""The eq function of :class:`Annotation`.
@@ -88,15 +116,15 @@ class Annotation(Entry):
         """
         if other is None:
             return False
-        return (type(self), self.span.begin, self.span.end) == \
-               (type(other), other.span.begin, other.span.end)
+        return (type(self), self._begin, self._end) == \
+               (type(other), other.begin, other.end)
 
     def __lt__(self, other):
         r"""To support total_ordering, :class:`Annotations` must provide
         :meth:`__lt__`.
         """
-        if self.span != other.span:
-            return self.span < other.span
+        if (self._begin, self._end) != (other.begin, other.end):
+            return (self._begin, self._end) < (other.begin, other.end)
         return (str(type(self)), self._tid) < (str(type(other)), other.tid)
 
     @property
@@ -121,6 +149,8 @@ class Link(BaseLink):
         parent (Entry, optional): the parent entry of the link.
         child (Entry, optional): the child entry of the link.
     """
+    __slots__ = ('_parent', '_child')
+
     # this type Any is needed since subclasses of this class will have new types
     ParentType: Any = Entry
     ChildType: Any = Entry
@@ -209,6 +239,8 @@ class Group(BaseGroup[Entry]):
     a "coreference group" is a group of coreferential entities. Each group will
     store a set of members, no duplications allowed.
     """
+    __slots__ = ('_members',)
+
     MemberType: Type[Entry] = Entry
 
     def __init__(
@@ -248,6 +280,8 @@ class Group(BaseGroup[Entry]):
 
 
 class MultiPackGeneric(MultiEntry, Entry):
+    __slots__ = ()
+
     def __init__(self, pack: PackType):
         super().__init__(pack=pack)
 
@@ -259,6 +293,7 @@ class MultiPackLink(MultiEntry, BaseLink):
     a parent node and a child node. Note that the nodes are indexed by two
     integers, one additional index on which pack it comes from.
     """
+    __slots__ = ('_parent', '_child')
 
     ParentType = Entry
     ChildType = Entry
@@ -354,6 +389,8 @@ class MultiPackGroup(MultiEntry, BaseGroup[Entry]):
     r"""Group type entries, such as "coreference group". Each group has a set
     of members.
     """
+    __slots__ = ('_members',)
+
     MemberType: Type[Entry] = Entry
 
     def __init__(
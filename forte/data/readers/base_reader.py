@@ -16,20 +16,25 @@ Base reader type to be inherited by all readers.
 """
 import logging
 import os
+import struct
 from abc import abstractmethod, ABC
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterator, Optional, Union, List
+from typing import Any, Deque, Iterator, Optional, Union, List, Tuple, Type
 
 from forte.common.configuration import Config
 from forte.common.exception import ProcessExecutionException
 from forte.common.resources import Resources
 from forte.data import data_utils
 from forte.data.base_pack import PackType
+from forte.data.binary_io import SERIALIZE_METHODS, serialize_binary
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
+from forte.data.ontology.core import Entry
 from forte.data.types import ReplaceOperationsType
 from forte.pipeline_component import PipelineComponent
-from forte.utils.utils import get_full_module_name
+from forte.utils.utils import get_class, get_full_module_name
 
 __all__ = [
     "BaseReader",
@@ -59,14 +64,33 @@ class BaseReader(PipelineComponent[PackType], ABC):
             if cache file already exists.  By default (``False``), we
             will overwrite the existing caching file. If ``True``, we will
             cache the datapack append to end of the caching file.
+        cache_serialize_method (str, optional): The serialization method of
+            the cache files, either ``"jsonpickle"`` (default), where each
+            pack is stored as one line of JSON, or ``"binary"``, where each
+            pack is stored in the binary format of
+            :mod:`forte.data.binary_io`, prefixed by its length.
+        prefetch_workers (int, optional): The number of threads that read
+            the collections ahead of the consumption, see
+            :meth:`set_prefetch`. By default (``0``), the collections are
+            read one at a time when the packs are requested.
+        prefetch_depth (int, optional): The maximum number of collections
+            read ahead. By default it is twice the ``prefetch_workers``.
     """
 
     def __init__(self,
                  from_cache: bool = False,
                  cache_directory: Optional[str] = None,
                  append_to_cache: bool = False,
-                 cache_in_memory: bool = False):
+                 cache_in_memory: bool = False,
+                 cache_serialize_method: str = "jsonpickle",
+                 prefetch_workers: int = 0,
+                 prefetch_depth: Optional[int] = None):
         super().__init__()
+        if cache_serialize_method not in SERIALIZE_METHODS:
+            raise ValueError(
+                f"Unknown serialize method {cache_serialize_method}, it "
+                f"should be one of {SERIALIZE_METHODS}.")
+        self._cache_serialize_method = cache_serialize_method
         self.from_cache = from_cache
         self._cache_directory = cache_directory
         self.component_name = get_full_module_name(self)
@@ -74,6 +98,38 @@ class BaseReader(PipelineComponent[PackType], ABC):
         self._cache_in_memory = cache_in_memory
         self._cache_ready: bool = False
         self._data_packs: List[PackType] = []
+        # The entry types decoded eagerly from the binary format.
+        self._entry_types: Optional[List[Type[Entry]]] = None
+
+        self._prefetch_workers: int = 0
+        self._prefetch_depth: int = 0
+        self.set_prefetch(prefetch_workers, prefetch_depth)
+
+    def set_prefetch(self, num_workers: int, depth: Optional[int] = None):
+        r"""Read the collections (returned by :meth:`_collect`) ahead of the
+        consumption with a pool of threads, so that the pipeline does not
+        wait on the I/O. The packs of a collection are parsed by the same
+        thread, and are returned in the same order as without prefetching.
+
+        With more than one worker, :meth:`_parse_pack` is called from
+        several threads at the same time, so it should not modify the states
+        of the reader. All the packs of a prefetched collection are kept in
+        memory until they are consumed, the cache files (see
+        ``cache_directory``) are written when the packs are consumed.
+
+        Args:
+            num_workers (int): The number of threads, ``0`` turns off the
+                prefetching.
+            depth (int, optional): The maximum number of collections read
+                ahead. By default it is twice the ``num_workers``.
+        """
+        if num_workers < 0:
+            raise ValueError("The number of prefetch workers can not be "
+                             "negative.")
+        if depth is not None and depth < 1:
+            raise ValueError("The prefetch depth must be positive.")
+        self._prefetch_workers = num_workers
+        self._prefetch_depth = depth or 2 * num_workers
 
     def initialize(self, resources: Resources, configs: Config):
         super().initialize(resources, configs)
@@ -82,6 +138,10 @@ class BaseReader(PipelineComponent[PackType], ABC):
         self._cache_ready = False
         del self._data_packs[:]
 
+        entry_types = configs.get('entry_types') if configs else None
+        self._entry_types = None if entry_types is None else [
+            get_class(entry_type) for entry_type in entry_types]
+
     @classmethod
     def default_configs(cls):
         r"""Returns a `dict` of configurations of the reader with default
@@ -91,11 +151,22 @@ class BaseReader(PipelineComponent[PackType], ABC):
         .. code-block:: python
 
             {
-                "name": "reader"
+                "name": "reader",
+                "entry_types": None
             }
+
+        Here:
+
+        `"entry_types"`: list of str, optional
+            The full names of the entry types to be decoded when the packs
+            are read from the binary format (e.g. from a binary cache), the
+            other entries are decoded on first access, see
+            :func:`~forte.data.binary_io.deserialize_binary`. By default
+            (`None`), all the entries are decoded.
         """
         return {
-            'name': 'reader'
+            'name': 'reader',
+            'entry_types': None,
         }
 
     @property
@@ -185,29 +256,65 @@ class BaseReader(PipelineComponent[PackType], ABC):
 
         return os.path.join(str(self._cache_directory), file_path)
 
+    def _read_collection(self, collection: Any,
+                         write_cache: bool = True) -> Iterator[PackType]:
+        if self.from_cache:
+            for pack in self.read_from_cache(
+                    self._get_cache_location(collection)):
+                pack.add_all_remaining_entries()
+                yield pack
+        else:
+            not_first = False
+            for pack in self.parse_pack(collection):
+                # write to the cache if _cache_directory specified
+                if write_cache and self._cache_directory is not None:
+                    self.cache_data(collection, pack, not_first)
+
+                if not isinstance(pack, self.pack_type):
+                    raise ValueError(
+                        f"No Pack object read from the given "
+                        f"collection {collection}, returned {type(pack)}."
+                    )
+
+                not_first = True
+                pack.add_all_remaining_entries()
+                yield pack
+
+    def _prefetch_iter(self, collections: Iterator[Any]) -> Iterator[PackType]:
+        def read_all(collection: Any) -> Tuple[Any, List[PackType]]:
+            # The cache files may be shared by the collections, so they are
+            # written by the consuming thread in the order of the collections.
+            return collection, list(
+                self._read_collection(collection, write_cache=False))
+
+        def consume(future: Future) -> Iterator[PackType]:
+            collection, packs = future.result()
+            if not self.from_cache and self._cache_directory is not None:
+                for i, pack in enumerate(packs):
+                    self.cache_data(collection, pack, i > 0)
+            yield from packs
+
+        futures: Deque[Future] = deque()
+        with ThreadPoolExecutor(self._prefetch_workers) as executor:
+            try:
+                for collection in collections:
+                    futures.append(executor.submit(read_all, collection))
+                    if len(futures) >= self._prefetch_depth:
+                        yield from consume(futures.popleft())
+                while futures:
+                    yield from consume(futures.popleft())
+            finally:
+                # The caller may stop iterating early.
+                for future in futures:
+                    future.cancel()
+
     def _lazy_iter(self, *args, **kwargs):
-        for collection in self._collect(*args, **kwargs):
-            if self.from_cache:
-                for pack in self.read_from_cache(
-                        self._get_cache_location(collection)):
-                    pack.add_all_remaining_entries()
-                    yield pack
-            else:
-                not_first = False
-                for pack in self.parse_pack(collection):
-                    # write to the cache if _cache_directory specified
-                    if self._cache_directory is not None:
-                        self.cache_data(collection, pack, not_first)
-
-                    if not isinstance(pack, self.pack_type):
-                        raise ValueError(
-                            f"No Pack object read from the given "
-                            f"collection {collection}, returned {type(pack)}."
-                        )
-
-                    not_first = True
-                    pack.add_all_remaining_entries()
-                    yield pack
+        collections = self._collect(*args, **kwargs)
+        if self._prefetch_workers > 0:
+            yield from self._prefetch_iter(collections)
+        else:
+            for collection in collections:
+                yield from self._read_collection(collection)
 
     def iter(self, *args, **kwargs) -> Iterator[PackType]:
         r"""An iterator over the entire dataset, giving all Packs processed
@@ -263,13 +370,33 @@ class BaseReader(PipelineComponent[PackType], ABC):
         )
 
         logger.info("Caching pack to %s", cache_filename)
-        if append:
+        if self._cache_serialize_method == "binary":
+            data = serialize_binary(pack)
+            with open(cache_filename, 'ab' if append else 'wb') as cache:
+                cache.write(struct.pack('<Q', len(data)))
+                cache.write(data)
+        elif append:
             with open(cache_filename, 'a') as cache:
                 cache.write(pack.serialize() + "\n")
         else:
             with open(cache_filename, 'w') as cache:
                 cache.write(pack.serialize() + "\n")
 
+    def _iter_cache_content(
+            self, cache_filename: Union[Path, str]) -> Iterator[Any]:
+        if self._cache_serialize_method == "binary":
+            with open(cache_filename, "rb") as cache_file:
+                while True:
+                    header = cache_file.read(8)
+                    if not header:
+                        break
+                    size, = struct.unpack('<Q', header)
+                    yield cache_file.read(size)
+        else:
+            with open(cache_filename, "r") as cache_file:
+                for line in cache_file:
+                    yield line.strip()
+
     def read_from_cache(
             self, cache_filename: Union[Path, str]) -> Iterator[PackType]:
         r"""Reads one or more Packs from ``cache_filename``, and yields Pack(s)
@@ -281,14 +408,13 @@ class BaseReader(PipelineComponent[PackType], ABC):
         Returns: List of cached data packs.
         """
         logger.info("reading from cache file %s", cache_filename)
-        with open(cache_filename, "r") as cache_file:
-            for line in cache_file:
-                pack = data_utils.deserialize(line.strip())
-                if not isinstance(pack, self.pack_type):
-                    raise TypeError(
-                        f"Pack deserialized from {cache_filename} "
-                        f"is {type(pack)}, but expect {self.pack_type}")
-                yield pack
+        for content in self._iter_cache_content(cache_filename):
+            pack = data_utils.deserialize(content, self._entry_types)
+            if not isinstance(pack, self.pack_type):
+                raise TypeError(
+                    f"Pack deserialized from {cache_filename} "
+                    f"is {type(pack)}, but expect {self.pack_type}")
+            yield pack
 
     def finish(self, resources: Resources):
         pass
@@ -14,9 +14,10 @@
 import os
 from abc import ABC, abstractmethod
 
-from typing import Iterator, List, Any
+from typing import Iterator, List, Any, Union
 
 from forte.common.exception import ProcessExecutionException
+from forte.data.binary_io import pack_suffix
 from forte.data.data_pack import DataPack
 from forte.data.data_utils import deserialize
 from forte.data.multi_pack import MultiPack
@@ -35,13 +36,14 @@ class BaseDeserializeReader(PackReader, ABC):
     def _cache_key_function(self, collection) -> str:
         return "cached_string_file"
 
-    def _parse_pack(self, data_source: str) -> Iterator[DataPack]:
+    def _parse_pack(self, data_source: Union[str, bytes]
+                    ) -> Iterator[DataPack]:
         if data_source is None:
             raise ProcessExecutionException(
                 "Data source is None, cannot deserialize.")
 
         # pack: DataPack = DataPack.deserialize(data_source)
-        pack: DataPack = deserialize(data_source)
+        pack: DataPack = deserialize(data_source, self._entry_types)
 
         if pack is None:
             raise ProcessExecutionException(
@@ -53,10 +55,13 @@ class BaseDeserializeReader(PackReader, ABC):
 
 class RawDataDeserializeReader(BaseDeserializeReader):
     """
-    This reader assumes the data passed in are raw DataPack strings.
+    This reader assumes the data passed in are raw DataPack strings, or bytes
+    of the binary format.
     """
 
-    def _collect(self, data_list: List[str]) -> Iterator[str]:  # type: ignore
+    def _collect(self,  # type: ignore
+                 data_list: List[Union[str, bytes]]
+                 ) -> Iterator[Union[str, bytes]]:
         yield from data_list
 
 
@@ -66,12 +71,17 @@ class RecursiveDirectoryDeserializeReader(BaseDeserializeReader):
     a DataPack.
     """
 
-    def _collect(self, data_dir: str) -> Iterator[str]:  # type: ignore
+    def _collect(self,  # type: ignore
+                 data_dir: str) -> Iterator[Union[str, bytes]]:
         """
         This function will collect the files of the given directory. If the
          'suffix' field in the config is set, it will only take files matching
-         that suffix. See :func:`~forte.data.readers.RecursiveDirectory
-         DeserializeReader.default_configs` for the default configs.
+         that suffix, by default (`None`) it is the suffix of the packs
+         written with the 'serialize_method' (see
+         :func:`~forte.data.binary_io.pack_suffix`), an empty suffix takes
+         all the files. If the 'serialize_method' field is `binary`, the
+         files are read as bytes. See :func:`~forte.data.readers.RecursiveDir
+         ectoryDeserializeReader.default_configs` for the default configs.
 
         Args:
             data_dir: The root directory to search for the data packs.
@@ -79,18 +89,25 @@ class RecursiveDirectoryDeserializeReader(BaseDeserializeReader):
         Returns:
 
         """
+        mode = 'rb' if self.configs.serialize_method == 'binary' else 'r'
+        suffix = self.configs.suffix
+        if suffix is None:
+            suffix = pack_suffix(self.configs.serialize_method)
         for root, _, files in os.walk(data_dir):
             for file in files:
-                if not self.configs.suffix or file.endswith(
-                        self.configs.suffix):
-                    with open(os.path.join(root, file)) as f:
+                if not suffix or file.endswith(suffix):
+                    with open(os.path.join(root, file), mode) as f:
                         yield f.read()
 
     @classmethod
     def default_configs(cls):
-        return {
-            "suffix": ".json"
-        }
+        config = super().default_configs()
+        config.update({
+            # Defaults to the suffix of the `serialize_method`.
+            "suffix": None,
+            "serialize_method": "jsonpickle",
+        })
+        return config
 
 
 class MultiPackDeserializerBase(MultiPackReader):
@@ -121,17 +138,19 @@ class MultiPackDeserializerBase(MultiPackReader):
         for s in self._get_multipack_content():
             yield s
 
-    def _parse_pack(self, multi_pack_str: str) -> Iterator[MultiPack]:
+    def _parse_pack(self, multi_pack_str: Union[str, bytes]
+                    ) -> Iterator[MultiPack]:
         # pylint: disable=protected-access
-        m_pack: MultiPack = deserialize(multi_pack_str)
+        m_pack: MultiPack = deserialize(multi_pack_str, self._entry_types)
 
         for pid in m_pack._pack_ref:
-            pack: DataPack = deserialize(self._get_pack_content(pid))
+            pack: DataPack = deserialize(
+                self._get_pack_content(pid), self._entry_types)
             m_pack._packs.append(pack)
         yield m_pack
 
     @abstractmethod
-    def _get_multipack_content(self) -> Iterator[str]:
+    def _get_multipack_content(self) -> Iterator[Union[str, bytes]]:
         """
         Implementation of this method should be responsible for yielding
          the raw content of the multi packs.
@@ -142,7 +161,7 @@ class MultiPackDeserializerBase(MultiPackReader):
         raise NotImplementedError
 
     @abstractmethod
-    def _get_pack_content(self, pack_id: int) -> str:
+    def _get_pack_content(self, pack_id: int) -> Union[str, bytes]:
         """
         Implementation of this method should be responsible for returning the
           raw string of the data pack from the pack id.
@@ -165,26 +184,38 @@ class MultiPackDirectoryReader(MultiPackDeserializerBase):
     a directory too (they can be the same directory).
     """
 
-    def _get_multipack_content(self) -> Iterator[str]:
+    def _read_mode(self) -> str:
+        return 'rb' if self.configs.serialize_method == 'binary' else 'r'
+
+    def _get_multipack_content(self) -> Iterator[Union[str, bytes]]:
         # pylint: disable=protected-access
+        suffix = self.configs.pack_suffix
+        if suffix is None:
+            suffix = pack_suffix(self.configs.serialize_method)
         for f in os.listdir(self.configs.multi_pack_dir):
-            if f.endswith(self.configs.pack_suffix):
-                with open(os.path.join(
-                        self.configs.multi_pack_dir, f)) as m_data:
+            if f.endswith(suffix):
+                with open(os.path.join(self.configs.multi_pack_dir, f),
+                          self._read_mode()) as m_data:
                     yield m_data.read()
 
-    def _get_pack_content(self, pack_id: int) -> str:
-        with open(os.path.join(
-                self.configs.data_pack_dir, f'{pack_id}.json')) as pack_data:
+    def _get_pack_content(self, pack_id: int) -> Union[str, bytes]:
+        suffix = pack_suffix(self.configs.serialize_method)
+        with open(os.path.join(self.configs.data_pack_dir,
+                               f'{pack_id}{suffix}'),
+                  self._read_mode()) as pack_data:
             return pack_data.read()
 
     @classmethod
     def default_configs(cls):
-        return {
+        config = super().default_configs()
+        config.update({
             "multi_pack_dir": None,
             "data_pack_dir": None,
-            "pack_suffix": '.json'
-        }
+            # Defaults to the suffix of the `serialize_method`.
+            "pack_suffix": None,
+            "serialize_method": 'jsonpickle',
+        })
+        return config
 
 
 # A short name for this class.
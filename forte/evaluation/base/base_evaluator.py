@@ -15,9 +15,10 @@
 Defines the Evaluator interface and related functions.
 """
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Optional, Set, Type
 
 from forte.data.base_pack import PackType
+from forte.data.ontology.core import Entry
 from forte.pipeline_component import PipelineComponent
 
 __all__ = [
@@ -47,3 +48,17 @@ class Evaluator(PipelineComponent[PackType]):
         r"""The evaluator gather the results and the score can be obtained here.
         """
         raise NotImplementedError
+
+    def gold_entry_types(self) -> Optional[Set[Type[Entry]]]:
+        r"""The entry types of the reference packs used by
+        :meth:`consume_next`. The pipeline keeps only the entries of these
+        types (and their sub-types) in the gold copies of the packs, see
+        :meth:`~forte.data.base_pack.BasePack.snapshot`. By default this is
+        `None`, which keeps all the entries.
+        """
+        return None
+
+    def reset(self):
+        r"""Clear the results gathered so far, so that the evaluator can be
+        used on another dataset. By default this does nothing.
+        """
@@ -12,70 +12,197 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Set, Tuple, Type
+
+import numpy as np
 
 from forte.data.data_pack import DataPack
-from forte.data.datasets.conll import conll_utils
+from forte.data.ontology.core import Entry
+from forte.data.types import DataRequest
 from forte.evaluation.base import Evaluator
 from forte.processors.ner_predictor import CoNLLNERPredictor
 from ft.onto.base_ontology import Sentence, Token
 
+__all__ = [
+    "count_conll_chunks",
+    "CoNLLNEREvaluator",
+]
+
+# The codes of the tag prefixes known by the conll03eval script, any other
+# prefix is coded as `_OTHER`.
+_PREFIX_CODES = {p: i for i, p in enumerate("OBIES[].")}
+_O, _B, _I, _E, _S, _OPEN, _CLOSE, _DOT = range(8)
+_OTHER = len(_PREFIX_CODES)
+
+
+def _transition_table(pairs: str) -> np.ndarray:
+    table = np.zeros((_OTHER + 1, _OTHER + 1), dtype=bool)
+    for pair in pairs.split():
+        table[_PREFIX_CODES[pair[0]], _PREFIX_CODES[pair[1]]] = True
+    return table
+
+
+# Whether a chunk ends (starts) between a previous and a current prefix, as
+# `endOfChunk` (`startOfChunk`) of the conll03eval script.
+_CHUNK_END = _transition_table(
+    "BB BO BS IB IS IO EE EI EO ES EB SE SI SO SS SB")
+_CHUNK_START = _transition_table(
+    "BB IB OB SB EB BS IS OS SS ES OI SI EI SE EE OE")
+
+
+def _split_tags(tags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Split the tags like `B-PER` into the prefixes and the types."""
+    parts = np.char.partition(tags, "-")
+    has_type = parts[:, 1] == "-"
+    prefixes = np.where(has_type, parts[:, 0], tags)
+    types = np.where(has_type, parts[:, 2], "")
+    return prefixes, types
+
+
+def _chunk_flags(codes: np.ndarray, types: np.ndarray
+                 ) -> Tuple[np.ndarray, np.ndarray]:
+    # The tags before the first one are `O`, of the empty type (coded as 0).
+    prev_codes = np.concatenate([[_O], codes[:-1]])
+    prev_types = np.concatenate([[0], types[:-1]])
+    type_changed = prev_types != types
+
+    ends = (_CHUNK_END[prev_codes, codes]
+            | ((prev_codes != _O) & (prev_codes != _DOT) & type_changed)
+            | (prev_codes == _OPEN) | (prev_codes == _CLOSE))
+    starts = (_CHUNK_START[prev_codes, codes]
+              | ((codes != _O) & (codes != _DOT) & type_changed)
+              | (codes == _OPEN) | (codes == _CLOSE))
+    return starts, ends
+
+
+def count_conll_chunks(gold_tags: np.ndarray, pred_tags: np.ndarray,
+                       row_splits: np.ndarray) -> Dict[str, int]:
+    r"""Count the chunks of the tags in the same way as the conll03eval
+    script, for the IOB and IOBES tagging schemes.
+
+    Args:
+        gold_tags: The flat array of the gold tags, such as `B-PER`.
+        pred_tags: The flat array of the predicted tags.
+        row_splits: The offsets of the sentences in the tag arrays, of length
+            the number of sentences plus one.
+
+    Returns:
+        A dictionary of the counts: `tokens`, the number of tokens;
+        `correct_tags`, the number of correctly predicted tags; `gold_chunks`
+        and `pred_chunks`, the number of the chunks in the gold and the
+        predicted tags; `correct_chunks`, the number of the predicted chunks
+        that match a gold chunk.
+    """
+    gold_tags = np.asarray(gold_tags).astype(str)
+    pred_tags = np.asarray(pred_tags).astype(str)
+    if len(gold_tags) != len(pred_tags):
+        raise ValueError(
+            f"The number of the gold tags ({len(gold_tags)}) and the "
+            f"predicted tags ({len(pred_tags)}) are different.")
+    if len(gold_tags) == 0:
+        return dict.fromkeys(
+            ["tokens", "correct_tags", "gold_chunks", "pred_chunks",
+             "correct_chunks"], 0)
+
+    gold_prefixes, gold_types = _split_tags(gold_tags)
+    pred_prefixes, pred_types = _split_tags(pred_tags)
+    counts = {
+        "tokens": len(gold_tags),
+        "correct_tags": int(np.sum((gold_prefixes == pred_prefixes)
+                                   & (gold_types == pred_types))),
+    }
+
+    # Code the prefixes and the types, and put an `O` tag at the end of each
+    # sentence, like the boundaries between the sentences in the script.
+    prefixes = np.concatenate([gold_prefixes, pred_prefixes])
+    unique_prefixes, prefix_codes = np.unique(prefixes, return_inverse=True)
+    prefix_codes = np.array([_PREFIX_CODES.get(p, _OTHER)
+                             for p in unique_prefixes])[prefix_codes]
+    # The empty type is the smallest, so it is coded as 0.
+    _, type_codes = np.unique(
+        np.concatenate([[""], gold_types, pred_types]), return_inverse=True)
+    type_codes = type_codes[1:]
+
+    n = len(gold_tags)
+    boundaries = np.asarray(row_splits)[1:]
+    gold_codes = np.insert(prefix_codes[:n], boundaries, _O)
+    pred_codes = np.insert(prefix_codes[n:], boundaries, _O)
+    gold_type_codes = np.insert(type_codes[:n], boundaries, 0)
+    pred_type_codes = np.insert(type_codes[n:], boundaries, 0)
+
+    gold_starts, gold_ends = _chunk_flags(gold_codes, gold_type_codes)
+    pred_starts, pred_ends = _chunk_flags(pred_codes, pred_type_codes)
+    counts["gold_chunks"] = int(np.sum(gold_starts))
+    counts["pred_chunks"] = int(np.sum(pred_starts))
+
+    # A chunk is correct if it starts and ends at the same positions in both,
+    # and the types of the tags are the same within it.
+    same_type = gold_type_codes == pred_type_codes
+    starts = np.flatnonzero(gold_starts & pred_starts & same_type)
+    length = len(gold_codes)
+    gold_end_indices = np.append(np.flatnonzero(gold_ends), length)
+    pred_end_indices = np.append(np.flatnonzero(pred_ends), length)
+    gold_chunk_ends = gold_end_indices[
+        np.searchsorted(gold_end_indices, starts, side="right")]
+    pred_chunk_ends = pred_end_indices[
+        np.searchsorted(pred_end_indices, starts, side="right")]
+    type_diffs = np.concatenate([[0], np.cumsum(~same_type)])
+    correct = ((gold_chunk_ends == pred_chunk_ends)
+               & (type_diffs[gold_chunk_ends] == type_diffs[starts]))
+    counts["correct_chunks"] = int(np.sum(correct))
+    return counts
+
 
 class CoNLLNEREvaluator(Evaluator):
+    r"""Evaluate the `ner` tags of the tokens, in the same way as the
+    conll03eval script. The counts are accumulated over the packs consumed
+    since the last :meth:`reset`, and the scores are computed from the
+    accumulated counts in :meth:`get_result`.
+    """
+
     def __init__(self):
         super().__init__()
         self.test_component = CoNLLNERPredictor().name
-        self.output_file = "tmp_eval.txt"
-        self.score_file = "tmp_eval.score"
-        self.scores: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.reset()
 
-    def consume_next(self, pred_pack: DataPack, refer_pack: DataPack):
-        pred_getdata_args = {
-            "context_type": Sentence,
-            "request": {
-                Token: {
-                    "fields": ["ner"],
-                },
-                Sentence: [],  # span by default
-            },
-        }
+    def gold_entry_types(self) -> Optional[Set[Type[Entry]]]:
+        return {Sentence, Token}
 
-        refer_getdata_args = {
-            "context_type": Sentence,
-            "request": {
-                Token: {
-                    "fields": ["chunk", "pos", "ner"]},
-                Sentence: [],  # span by default
-            }
+    def reset(self):
+        self.counts = {
+            "tokens": 0,
+            "correct_tags": 0,
+            "gold_chunks": 0,
+            "pred_chunks": 0,
+            "correct_chunks": 0,
         }
 
-        conll_utils.write_tokens_to_file(pred_pack=pred_pack,
-                                         pred_request=pred_getdata_args,
-                                         refer_pack=refer_pack,
-                                         refer_request=refer_getdata_args,
-                                         output_filename=self.output_file)
-        eval_script = \
-            Path(os.path.abspath(__file__)).parents[1] / \
-            "utils/eval_scripts/conll03eval.v2"
-        os.system(f"perl {eval_script} < {self.output_file} > "
-                  f"{self.score_file}")
-        with open(self.score_file, "r") as fin:
-            fin.readline()
-            line = fin.readline()
-            fields = line.split(";")
-            acc = float(fields[0].split(":")[1].strip()[:-1])
-            precision = float(fields[1].split(":")[1].strip()[:-1])
-            recall = float(fields[2].split(":")[1].strip()[:-1])
-            f1 = float(fields[3].split(":")[1].strip())
-
-        self.scores = {
-            "accuracy": acc,
+    def consume_next(self, pred_pack: DataPack, refer_pack: DataPack):
+        request: DataRequest = {Token: {"fields": ["ner"]}}
+        pred_data = pred_pack.get_columnar_data(Sentence, request)
+        refer_data = refer_pack.get_columnar_data(Sentence, request)
+
+        counts = count_conll_chunks(
+            refer_data["Token"]["ner"], pred_data["Token"]["ner"],
+            refer_data["Token"]["row_splits"])
+        for key, value in counts.items():
+            self.counts[key] += value
+
+    def get_result(self) -> Dict[str, float]:
+        counts = self.counts
+        accuracy = precision = recall = f1 = 0.0
+        if counts["tokens"] > 0:
+            accuracy = 100 * counts["correct_tags"] / counts["tokens"]
+        if counts["pred_chunks"] > 0:
+            precision = 100 * counts["correct_chunks"] / counts["pred_chunks"]
+        if counts["gold_chunks"] > 0:
+            recall = 100 * counts["correct_chunks"] / counts["gold_chunks"]
+        if precision + recall > 0:
+            f1 = 2 * precision * recall / (precision + recall)
+        return {
+            "accuracy": accuracy,
             "precision": precision,
             "recall": recall,
             "f1": f1,
         }
-
-    def get_result(self):
-        return self.scores
@@ -14,7 +14,7 @@
 import os
 import logging
 import pickle
-from typing import Optional, List, Tuple, Dict, Union, Any
+from typing import Optional, List, Tuple, Dict, Union, Any, Iterable
 import numpy as np
 
 import faiss
@@ -160,10 +160,49 @@ class EmbeddingBasedIndexer:
                 # [[(id1, txt1)], [(id2, txt2)]]
         """
 
-        _, indices = self._index.search(query, k)
-        return [[(idx, self._meta_data[idx]) for idx in index]
+        indices, _ = self.search_ids(query, k)
+        return [list(zip(index, self.get_meta_data(index)))
                 for index in indices]
 
+    def search_ids(self, query: Union[np.ndarray, torch.Tensor], k: int
+                   ) -> Tuple[np.ndarray, np.ndarray]:
+        r"""Search ``k`` nearest vectors for each row of ``query`` in the
+        index with a single index lookup. Unlike :meth:`search`, only the ids
+        and the scores of the vectors are returned, the meta data of the
+        needed ids can be looked up by :meth:`get_meta_data`.
+
+        Args:
+            query (np.ndarray or torch.Tensor): A 2-dimensional array of shape
+                ``[batch_size, dim]`` where each row corresponds to a query.
+            k (int): The number of nearest vectors to return for each query.
+
+        Returns:
+            A tuple of two arrays of shape ``[batch_size, k]``, the ids of the
+            nearest vectors and their scores (distances or inner products
+            depending on the index type). If fewer than ``k`` vectors are
+            found, the remaining ids are -1.
+        """
+
+        if isinstance(query, torch.Tensor):
+            query = query.cpu().numpy()
+
+        scores, indices = self._index.search(
+            np.ascontiguousarray(query, dtype=np.float32), k)
+        return indices, scores
+
+    def get_meta_data(self, ids: Iterable[int]) -> List[str]:
+        r"""Get the meta data of the vectors with ``ids``.
+
+        Args:
+            ids: The ids of the vectors, e.g. a row of the ids returned by
+                :meth:`search_ids`.
+
+        Returns:
+            A list of the meta data of the vectors.
+        """
+
+        return [self._meta_data[int(idx)] for idx in ids]
+
     def save(self, path: str) -> None:
         r"""Save the index and meta data in ``path`` directory. The index
         will be saved as ``index.faiss`` and ``index.meta_data`` respectively
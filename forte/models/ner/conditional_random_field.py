@@ -387,81 +387,92 @@ class ConditionalRandomField(torch.nn.Module):
 
         return torch.sum(log_numerator - log_denominator)
 
-    def viterbi_tags(self, logits: torch.Tensor,
-                     mask: torch.Tensor) -> List[Tuple[List[int], float]]:
+    def _constrained_transitions(
+            self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """
-        Uses viterbi algorithm to find most likely tags for the given inputs.
-        If constraints are applied, disallows all other transitions.
+        Returns the transition scores between the tags, from the start to
+        the tags and from the tags to the end, where the disallowed
+        transitions are set to -10000.
         """
-        _, max_seq_length, num_tags = logits.size()
-
-        # Get the tensors out of the variables
-        logits, mask = logits.data, mask.data
-
-        # Augment transitions matrix with start and end transitions
+        num_tags = self.num_tags
         start_tag = num_tags
         end_tag = num_tags + 1
-        transitions = torch.Tensor(num_tags + 2, num_tags + 2).fill_(-10000.0)
+        constraint_mask = self._constraint_mask.detach()
 
-        # Apply transition constraints
-        constrained_transitions = self.transitions * self._constraint_mask[
-                                                     :num_tags, :num_tags
-                                                     ] + -10000.0 * (
-                                          1 - self._constraint_mask[
-                                              :num_tags, :num_tags])
-        transitions[:num_tags, :num_tags] = constrained_transitions.data
+        transitions = self.transitions.detach() * constraint_mask[
+            :num_tags, :num_tags] + -10000.0 * (
+                1 - constraint_mask[:num_tags, :num_tags])
 
+        start_mask = constraint_mask[start_tag, :num_tags]
+        end_mask = constraint_mask[:num_tags, end_tag]
         if self.include_start_end_transitions:
-            transitions[
-            start_tag, :num_tags
-            ] = self.start_transitions.detach() * self._constraint_mask[
-                                                  start_tag, :num_tags
-                                                  ].data + -10000.0 * (
-                        1 - self._constraint_mask[start_tag, :num_tags].detach()
-                )
-            transitions[
-            :num_tags, end_tag
-            ] = self.end_transitions.detach() * self._constraint_mask[
-                                                :num_tags, end_tag
-                                                ].data + -10000.0 * (
-                        1 - self._constraint_mask[:num_tags, end_tag].detach()
-                )
+            start_transitions = self.start_transitions.detach() * \
+                start_mask + -10000.0 * (1 - start_mask)
+            end_transitions = self.end_transitions.detach() * \
+                end_mask + -10000.0 * (1 - end_mask)
         else:
-            transitions[start_tag, :num_tags] = -10000.0 * (
-                    1 - self._constraint_mask[start_tag, :num_tags].detach()
-            )
-            transitions[:num_tags, end_tag] = -10000.0 * (
-                    1 - self._constraint_mask[:num_tags, end_tag].detach()
-            )
+            start_transitions = -10000.0 * (1 - start_mask)
+            end_transitions = -10000.0 * (1 - end_mask)
+        return transitions, start_transitions, end_transitions
 
-        best_paths = []
-        # Pad the max sequence length by 2 to account for start_tag + end_tag.
-        tag_sequence = torch.Tensor(max_seq_length + 2, num_tags + 2)
-
-        for prediction, prediction_mask in zip(logits, mask):
-            sequence_length = torch.sum(prediction_mask)
-
-            # Start with everything totally unlikely
-            tag_sequence.fill_(-10000.0)
-            # At timestep 0 we must have the START_TAG
-            tag_sequence[0, start_tag] = 0.0
-            # At steps 1, ..., sequence_length we just use the
-            # incoming prediction
-            tag_sequence[1:(sequence_length + 1), :num_tags] = prediction[
-                                                               :sequence_length
-                                                               ]
-            # And at the last timestep we must have the END_TAG
-            tag_sequence[sequence_length + 1, end_tag] = 0.0
-
-            # We pass the tags and the transitions to ``viterbi_decode``.
-            viterbi_path, viterbi_score = viterbi_decode(
-                tag_sequence[: (sequence_length + 2)], transitions
-            )
-            # Get rid of START and END sentinels and append.
-            viterbi_path = viterbi_path[1:-1]
-            best_paths.append((viterbi_path, viterbi_score.item()))
+    def viterbi_tags(self, logits: torch.Tensor,
+                     mask: torch.Tensor) -> List[Tuple[List[int], float]]:
+        """
+        Uses viterbi algorithm to find most likely tags for the given inputs.
+        If constraints are applied, disallows all other transitions.
+
+        The whole batch is decoded at once, the masked positions (which should
+        be at the end of each sequence) keep the scores and the tags of the
+        previous position.
 
-        return best_paths
+        Args:
+            logits: The tag scores of shape `[batch, time, num_tags]`.
+            mask: The mask of shape `[batch, time]`.
+
+        Returns:
+            A list of the best tag sequence and its score, for each sequence
+            in the batch.
+        """
+        batch_size, max_seq_length, num_tags = logits.size()
+        if batch_size == 0 or max_seq_length == 0:
+            return [([], 0.0) for _ in range(batch_size)]
+
+        logits = logits.detach()
+        mask = mask.detach().bool()
+        transitions, start_transitions, end_transitions = \
+            self._constrained_transitions()
+        transitions = transitions.to(logits.device)
+        tag_ids = torch.arange(num_tags, device=logits.device).expand(
+            batch_size, num_tags)
+
+        # The best scores of the paths ending with each tag, [batch, tags].
+        scores = start_transitions.to(logits.device).view(1, num_tags) + \
+            logits[:, 0]
+        backpointers = []
+        for i in range(1, max_seq_length):
+            # [batch, previous_tag, tag]
+            summed_potentials = scores.unsqueeze(-1) + transitions
+            best_scores, best_previous = torch.max(summed_potentials, 1)
+            step_mask = mask[:, i].unsqueeze(-1)
+            scores = torch.where(
+                step_mask, best_scores + logits[:, i], scores)
+            backpointers.append(
+                torch.where(step_mask, best_previous, tag_ids))
+
+        best_scores, best_last = torch.max(
+            scores + end_transitions.to(logits.device).view(1, num_tags), 1)
+
+        # Trace the best tags backward, [batch, time].
+        best_tags = [best_last]
+        for pointers in reversed(backpointers):
+            best_tags.append(
+                pointers.gather(1, best_tags[-1].unsqueeze(-1)).squeeze(-1))
+        best_tags.reverse()
+        tags = torch.stack(best_tags, 1).tolist()
+
+        lengths = mask.long().sum(1).tolist()
+        return [(path[:length], score) for path, length, score in
+                zip(tags, lengths, best_scores.tolist())]
 
 
 def viterbi_decode(tag_sequence: torch.Tensor, transition_matrix: torch.Tensor,
@@ -17,7 +17,11 @@ Base class for Pipeline module.
 
 import itertools
 import logging
-from typing import Any, Dict, Generic, Iterator, List, Optional, Union, Tuple
+import time
+from collections import deque
+from typing import (
+    Any, Callable, Deque, Dict, Generic, Iterator, List, Optional, Set,
+    Tuple, Type, Union)
 
 import yaml
 
@@ -28,12 +32,17 @@ from forte.common.exception import ProcessExecutionException, \
 from forte.common.resources import Resources
 from forte.data.base_pack import PackType
 from forte.data.caster import Caster
+from forte.data.ontology.core import Entry
 from forte.data.readers.base_reader import BaseReader
 from forte.data.selector import Selector, DummySelector
 from forte.evaluation.base.base_evaluator import Evaluator
 from forte.pipeline_component import PipelineComponent
 from forte.process_job import ProcessJob
 from forte.process_manager import ProcessManager, ProcessJobStatus
+from forte.process_pool import PackProcessPool
+from forte.profiler import PipelineProfiler
+from forte.serving import PipelineServer
+from forte.stage_scheduler import StageScheduler, StageStats
 from forte.processors.base.base_processor import BaseProcessor
 from forte.processors.base.batch_processor import BaseBatchProcessor
 from forte.utils import create_class_with_kwargs
@@ -49,11 +58,15 @@ class ProcessBuffer:
     def __init__(self,
                  pipeline: "Pipeline",
                  data_iter: Iterator[PackType],
+                 gold_packs: Optional[Deque[PackType]] = None,
                  ):
         self.__data_iter: Iterator[PackType] = data_iter
         self.__data_exhausted = False
         self.__pipeline = pipeline
         self.__process_manager: ProcessManager = pipeline._proc_mgr
+        # The gold copies of the packs taken before they are processed by
+        # the parallel workers, in the same order as the packs.
+        self.__gold_packs: Optional[Deque[PackType]] = gold_packs
 
     def __iter__(self):
         return self
@@ -68,7 +81,10 @@ class ProcessBuffer:
                 job = ProcessJob(job_pack, False)
 
                 if len(self.__pipeline.evaluator_indices) > 0:
-                    gold_copy = job_pack.view()
+                    if self.__gold_packs is None:
+                        gold_copy = self.__pipeline.copy_gold(job_pack)
+                    else:
+                        gold_copy = self.__gold_packs.popleft()
                     self.__pipeline.add_gold_packs({job.id: gold_copy})
 
                 self.__process_manager.add_to_queue(queue_index=0, job=job)
@@ -93,9 +109,30 @@ class Pipeline(Generic[PackType]):
     consisted of a set of Components (readers and processors). The data flows
     in the pipeline as data packs, and each component will use or add
     information to the data packs.
+
+    Args:
+        resource (Resources, optional): The resources shared by the
+            components.
+        num_workers (int): The number of worker processes. If it is positive,
+            the leading processors of the pipeline that are ``parallel_safe``
+            (see :class:`~forte.processors.base.base_processor.BaseProcessor`)
+            are run in parallel by the workers, each of which holds its own
+            initialized copies of these processors. The packs are returned in
+            the input order, as new objects deserialized from the workers
+            (see :class:`~forte.process_pool.PackProcessPool`). Default is 0,
+            which runs all the components in the current process.
+        stage_parallel (bool): Whether to run the reader and each stage of
+            the pipeline in its own thread, see
+            :class:`~forte.stage_scheduler.StageScheduler`. The stages are
+            defined by the `stage` argument of :meth:`add`. Default is
+            `False`, which runs the components one after another.
+        queue_size (int): The maximum number of packs waiting before each
+            stage when `stage_parallel` is `True`.
     """
 
-    def __init__(self, resource: Optional[Resources] = None):
+    def __init__(self, resource: Optional[Resources] = None,
+                 num_workers: int = 0, stage_parallel: bool = False,
+                 queue_size: int = 8):
         self._reader: BaseReader
         self._reader_config: Optional[Config]
 
@@ -111,6 +148,19 @@ class Pipeline(Generic[PackType]):
 
         self.evaluator_indices: List[int] = []
 
+        self._num_workers: int = num_workers
+        # The number of the leading components that are run by the workers.
+        self._num_parallel: int = 0
+        self._pool: Optional[PackProcessPool] = None
+
+        self._stage_parallel: bool = stage_parallel
+        self._queue_size: int = queue_size
+        self._stage_names: List[Optional[str]] = []
+        self._scheduler: Optional[StageScheduler] = None
+
+        self._profile_configs: Optional[Dict[str, Any]] = None
+        self._profiler: Optional[PipelineProfiler] = None
+
         # needed for evaluator
         self._predict_to_gold: Dict[int, PackType] = {}
 
@@ -159,26 +209,169 @@ class Pipeline(Generic[PackType]):
                 self.add(component, component_config.get('configs', {}))
 
     def initialize(self):
+        if self._num_workers > 0:
+            self._num_parallel = 0
+            for component in self._components:
+                if not (isinstance(component, BaseProcessor) and
+                        not isinstance(component, BaseBatchProcessor) and
+                        component.parallel_safe):
+                    break
+                self._num_parallel += 1
+
         # The process manager need to be assigned first.
-        self._proc_mgr = ProcessManager(len(self._components))
+        self._proc_mgr = ProcessManager(
+            len(self._components) - self._num_parallel)
 
         self._reader.assign_manager(self._proc_mgr)
 
         self._reader.initialize(self.resource, self._reader_config)
+
+        self._profiler = None
+        if self._profile_configs is not None:
+            self._profiler = PipelineProfiler(
+                self._reader.name, [c.name for c in self._components],
+                **self._profile_configs)
+
         self.initialize_processors()
 
         self.initialized = True
 
     def initialize_processors(self):
-        for processor, config in zip(self.components, self.processor_configs):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        if self._num_parallel > 0:
+            # The parallel components are only initialized in the workers.
+            self._pool = PackProcessPool(
+                self._components[:self._num_parallel],
+                self._configs[:self._num_parallel],
+                self._selectors[:self._num_parallel],
+                self.resource, self._num_workers)
+
+        self._scheduler = None
+        if self._stage_parallel:
+            self._scheduler = self._create_scheduler()
+
+        for i, (processor, config) in itertools.islice(
+                enumerate(zip(self.components, self.processor_configs)),
+                self._num_parallel, None):
+            if isinstance(processor, BaseBatchProcessor):
+                processor.profile_stats = (
+                    None if self._profiler is None
+                    else self._profiler.component_stats[i])
             try:
-                processor.assign_manager(self._proc_mgr)
+                # The stage scheduler does not use the job queues.
+                processor.assign_manager(
+                    None if self._stage_parallel else self._proc_mgr)
                 processor.initialize(self.resource, config)
             except ProcessorConfigError as e:
                 logging.error("Exception occur when initializing "
                               "processor %s", processor.name)
                 raise e
 
+    def _create_scheduler(self) -> StageScheduler:
+        stages: List[Tuple[str, List]] = []
+        last_name: Optional[str] = None
+        for i in range(self._num_parallel, len(self._components)):
+            component = self._components[i]
+            name = self._stage_names[i]
+            if name is None or name != last_name:
+                stages.append((name or component.name, []))
+            stages[-1][1].append((component, self._selectors[i]))
+            last_name = name
+        return StageScheduler(
+            stages, self._queue_size,
+            copy_gold=self.copy_gold if self.evaluator_indices else None,
+            profiler=self._profiler, first_index=self._num_parallel)
+
+    def enable_profiling(
+            self, log_interval: Optional[float] = None,
+            callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None):
+        r"""Record the time and the throughput of the reader and each
+        component, see :meth:`profile_report`. This should be called before
+        :meth:`initialize`. The components run by the worker processes (see
+        `num_workers`) are not recorded.
+
+        Args:
+            log_interval (float, optional): If given, the report is logged
+                every `log_interval` seconds while the pipeline is running.
+            callback (callable, optional): A function to receive the periodic
+                reports instead of logging them.
+        """
+        self._profile_configs = {
+            "log_interval": log_interval,
+            "callback": callback,
+        }
+
+    def profile_report(self) -> List[Dict[str, Any]]:
+        r"""The statistics recorded since :meth:`initialize`, if
+        :meth:`enable_profiling` is called. For each component, this includes
+        the wall time, the number of calls, the number of packs in and out
+        and the number of entries created. For the batch processors, this
+        also includes the batch sizes and the time spent in getting the
+        batches, `predict` and `pack_all`.
+
+        Returns:
+            A list of dictionaries, the first one is for the reader and the
+            others are for the components in the pipeline order. Empty if
+            the profiling is not enabled.
+        """
+        if self._profiler is None:
+            return []
+        return self._profiler.report()
+
+    def stage_stats(self) -> List[StageStats]:
+        r"""The statistics of the stages, such as the throughput and the
+        queue depth, when the pipeline is created with `stage_parallel`.
+
+        Returns:
+            A list of :class:`~forte.stage_scheduler.StageStats`, one for
+            each stage. Empty if the pipeline is not stage parallel.
+        """
+        if self._scheduler is None:
+            return []
+        return self._scheduler.stats()
+
+    def serve(self,
+              max_wait: float = 0.01) -> PipelineServer[PackType]:
+        r"""Start a :class:`~forte.serving.PipelineServer` that runs the
+        components over the packs submitted by concurrent callers, e.g. the
+        request handlers of a web service. The batch processors batch the
+        packs of different callers, and a batch is processed when it is full
+        or when its oldest pack has waited for `max_wait` seconds. The
+        pipeline should not be run in other ways until the server is closed.
+
+        Args:
+            max_wait (float): The maximum seconds a pack waits for the batches
+                to be filled.
+
+        Returns:
+            The started server, which should be closed after use.
+        """
+        if not self.initialized:
+            raise ProcessFlowException(
+                "Please call initialize before running the pipeline")
+        if self._num_parallel > 0:
+            raise ProcessFlowException(
+                "The pipeline with worker processes cannot be served.")
+        if len(self.evaluator_indices) > 0:
+            raise ProcessFlowException(
+                "The pipeline with evaluators cannot be served.")
+
+        # The server does not use the job queues, like the stage scheduler.
+        for component in self._components:
+            component.assign_manager(None)  # type: ignore
+
+        def restore_manager():
+            if not self._stage_parallel:
+                for component in self._components:
+                    component.assign_manager(self._proc_mgr)
+
+        return PipelineServer(
+            list(zip(self._components, self._selectors)), max_wait,
+            reader=self._reader, profiler=self._profiler,
+            on_close=restore_manager)
+
     def set_reader(self, reader: BaseReader,
                    config: Optional[Union[Config, Dict[str, Any]]] = None):
         self._reader = reader
@@ -198,7 +391,20 @@ class Pipeline(Generic[PackType]):
 
     def add(self, component: PipelineComponent,
             config: Optional[Union[Config, Dict[str, Any]]] = None,
-            selector: Optional[Selector] = None):
+            selector: Optional[Selector] = None,
+            stage: Optional[str] = None):
+        r"""Add a component to the pipeline.
+
+        Args:
+            component: The processor, caster or evaluator to be added.
+            config (optional): The configuration of the component.
+            selector (optional): The selector of the packs that the component
+                works on.
+            stage (str, optional): The name of the stage to run the component
+                in, when the pipeline is stage parallel. Consecutive
+                components with the same stage name share one thread. By
+                default each component is run in its own stage.
+        """
         self._processors_index[component.name] = len(self.components)
 
         if isinstance(component, BaseReader):
@@ -210,6 +416,7 @@ class Pipeline(Generic[PackType]):
 
         component.assign_manager(self._proc_mgr)
         self._components.append(component)
+        self._stage_names.append(stage)
         self.processor_configs.append(component.make_configs(config))
 
         if selector is None:
@@ -227,6 +434,28 @@ class Pipeline(Generic[PackType]):
         """
         self._predict_to_gold.update(pack)
 
+    def copy_gold(self, pack: PackType) -> PackType:
+        r"""Copy the pack for the evaluators before it is processed. Only the
+        entry types declared by the
+        :meth:`~forte.evaluation.base.base_evaluator.Evaluator.gold_entry_types`
+        of the evaluators are kept.
+
+        Args:
+            pack: The pack to be copied.
+
+        Returns:
+            The gold copy of the pack.
+        """
+        entry_types: Set[Type[Entry]] = set()
+        for i in self.evaluator_indices:
+            evaluator = self._components[i]
+            assert isinstance(evaluator, Evaluator)
+            types = evaluator.gold_entry_types()
+            if types is None:
+                return pack.snapshot()
+            entry_types.update(types)
+        return pack.snapshot(entry_types)
+
     def process(self, *args, **kwargs) -> PackType:
         r"""Alias for :meth:`process_one`.
 
@@ -303,8 +532,13 @@ class Pipeline(Generic[PackType]):
         Returns:
 
         """
+        if self._profiler is not None:
+            self._profiler.log_report()
         self.reader.finish(self.resource)
-        for p in self.components:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        for p in self.components[self._num_parallel:]:
             p.finish(self.resource)
 
     def _process_packs(
@@ -426,9 +660,24 @@ class Pipeline(Generic[PackType]):
             raise ProcessFlowException(
                 "Please call initialize before running the pipeline")
 
-        buffer = ProcessBuffer(self, data_iter)
+        if self._profiler is not None:
+            data_iter = self._profiler.timed_reader(data_iter)
 
-        if len(self.components) == 0:
+        gold_packs: Optional[Deque[PackType]] = None
+        if self._pool is not None:
+            if len(self.evaluator_indices) > 0:
+                # The gold packs are copied before they are processed.
+                gold_packs = deque()
+                data_iter = self._copy_gold_packs(data_iter, gold_packs)
+            data_iter = self._pool.process(data_iter)
+
+        if self._scheduler is not None:
+            yield from self._scheduler.run(data_iter, gold_packs)
+            return
+
+        buffer = ProcessBuffer(self, data_iter, gold_packs)
+
+        if self._proc_mgr.pipeline_length == 0:
             yield from data_iter
             # Write return here instead of using if..else to reduce indent.
             return
@@ -438,7 +687,8 @@ class Pipeline(Generic[PackType]):
             # the status of the job now is UNPROCESSED
             unprocessed_job: ProcessJob = next(buffer)
 
-            processor_index = self._proc_mgr.current_processor_index
+            processor_index = (self._num_parallel +
+                               self._proc_mgr.current_processor_index)
             processor = self.components[processor_index]
             selector = self._selectors[processor_index]
             current_queue_index = self._proc_mgr.current_queue_index
@@ -454,16 +704,21 @@ class Pipeline(Generic[PackType]):
             if not unprocessed_job.is_poison:
                 for pack in selector.select(unprocessed_job.pack):
                     # First, perform the component action on the pack
+                    start = time.perf_counter()
                     try:
                         if isinstance(processor, Caster):
                             # Replacing the job pack with the casted version.
                             unprocessed_job.alter_pack(processor.cast(pack))
+                            unprocessed_job.set_status(
+                                ProcessJobStatus.PROCESSED)
                         elif isinstance(processor, BaseProcessor):
                             processor.process(pack)
                         elif isinstance(processor, Evaluator):
                             processor.consume_next(
                                 pack, self._predict_to_gold[unprocessed_job.id]
                             )
+                            unprocessed_job.set_status(
+                                ProcessJobStatus.PROCESSED)
 
                         # After the component action, make sure the entry is
                         # added into the index.
@@ -472,6 +727,9 @@ class Pipeline(Generic[PackType]):
                         raise ProcessExecutionException(
                             f'Exception occurred when running '
                             f'{processor.name}') from e
+                    if self._profiler is not None:
+                        self._profiler.record_call(
+                            processor_index, 1, time.perf_counter() - start)
 
                     # Then, based on component type, handle the queue.
                     if isinstance(processor, BaseBatchProcessor):
@@ -511,6 +769,7 @@ class Pipeline(Generic[PackType]):
                             c_queue = list(current_queue)
                             for job_i in \
                                     c_queue[:processed_queue_index + 1]:
+                                self._record_out(processor_index, job_i)
 
                                 if should_yield:
                                     if job_i.id in self._predict_to_gold:
@@ -552,6 +811,7 @@ class Pipeline(Generic[PackType]):
                         else:
                             # current_queue is modified in this array
                             for job_i in list(current_queue):
+                                self._record_out(processor_index, job_i)
                                 if should_yield:
                                     if job_i.id in self._predict_to_gold:
                                         self._predict_to_gold.pop(job_i.id)
@@ -582,7 +842,11 @@ class Pipeline(Generic[PackType]):
                                 self._proc_mgr.current_queue_index \
                                     = next_queue_index
             else:
+                start = time.perf_counter()
                 processor.flush()
+                if self._profiler is not None:
+                    self._profiler.record_call(
+                        processor_index, 0, time.perf_counter() - start)
 
                 # current queue is modified in the loop
                 for job in list(current_queue):
@@ -591,6 +855,7 @@ class Pipeline(Generic[PackType]):
                         raise ValueError("Job is neither PROCESSED nor is "
                                          "a poison. Something went wrong "
                                          "during execution.")
+                    self._record_out(processor_index, job)
 
                     if not job.is_poison and should_yield:
                         if job.id in self._predict_to_gold:
@@ -611,6 +876,16 @@ class Pipeline(Generic[PackType]):
 
         self._proc_mgr.reset()
 
+    def _record_out(self, processor_index: int, job: ProcessJob):
+        if self._profiler is not None and not job.is_poison:
+            self._profiler.record_out(processor_index, job.pack)
+
+    def _copy_gold_packs(self, data_iter: Iterator[PackType],
+                         gold_packs: Deque[PackType]) -> Iterator[PackType]:
+        for pack in data_iter:
+            gold_packs.append(self.copy_gold(pack))
+            yield pack
+
     def evaluate(self) -> Iterator[Tuple[str, Any]]:
         for i in self.evaluator_indices:
             p = self.components[i]
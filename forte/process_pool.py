@@ -0,0 +1,250 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Run pack processors over the packs in a pool of worker processes.
+"""
+import logging
+import multiprocessing as mp
+import queue
+import traceback
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from forte.common.configuration import Config
+from forte.common.exception import ProcessExecutionException
+from forte.common.resources import Resources
+from forte.data.base_pack import BasePack, PackType
+from forte.data.binary_io import deserialize_binary, serialize_binary
+from forte.data.multi_pack import MultiPack
+from forte.data.selector import Selector
+from forte.processors.base.base_processor import BaseProcessor
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "PackProcessPool"
+]
+
+# The message types between the pool and the workers.
+_PACK = 0
+_FLUSH = 1
+_STOP = 2
+
+# The seconds to wait for a worker message before checking that the workers
+# are still alive.
+_POLL_INTERVAL = 1.0
+
+
+def _encode(pack: BasePack) -> List[bytes]:
+    # The data packs of a multi pack are not serialized with it, so they are
+    # sent after it.
+    data = [serialize_binary(pack)]
+    if isinstance(pack, MultiPack):
+        data.extend(serialize_binary(p) for p in pack.packs)
+    return data
+
+
+def _decode(data: List[bytes]) -> BasePack:
+    pack = deserialize_binary(data[0])
+    if isinstance(pack, MultiPack):
+        # pylint: disable=protected-access
+        pack._packs.extend(deserialize_binary(d) for d in data[1:])
+    return pack
+
+
+def _run_components(components: List[BaseProcessor],
+                    selectors: List[Selector],
+                    data: List[bytes]) -> List[bytes]:
+    pack = _decode(data)
+    for component, selector in zip(components, selectors):
+        for selected in selector.select(pack):
+            component.process(selected)
+            selected.add_all_remaining_entries()
+    return _encode(pack)
+
+
+def _worker_loop(components: List[BaseProcessor],
+                 configs: List[Optional[Config]],
+                 selectors: List[Selector],
+                 resource: Resources,
+                 in_queue: mp.Queue, out_queue: mp.Queue):
+    # pylint: disable=broad-except
+    try:
+        for component, config in zip(components, configs):
+            # The components in the workers do not work with the job queues
+            # of the pipeline.
+            component.assign_manager(None)  # type: ignore
+            component.initialize(resource, config)
+    except Exception:
+        out_queue.put((-1, None, traceback.format_exc()))
+        return
+
+    while True:
+        kind, seq, data = in_queue.get()
+        if kind == _PACK:
+            try:
+                out_queue.put(
+                    (seq, _run_components(components, selectors, data), None))
+            except Exception:
+                out_queue.put((seq, None, traceback.format_exc()))
+        elif kind == _FLUSH:
+            try:
+                for component in components:
+                    component.flush()
+                out_queue.put((seq, None, None))
+            except Exception:
+                out_queue.put((seq, None, traceback.format_exc()))
+        else:
+            for component in components:
+                component.finish(resource)
+            return
+
+
+class PackProcessPool:
+    r"""A pool of worker processes, each of which holds its own initialized
+    copies of a sequence of pack processors. The packs are sent to the
+    workers in the binary format (see :mod:`forte.data.binary_io`), the data
+    packs of a multi pack are sent along with it, and the processed packs are
+    returned in the input order.
+
+    The processors should not share states across the packs (see
+    :attr:`~forte.processors.base.base_processor.BaseProcessor.parallel_safe`),
+    since each worker only sees a part of the packs.
+
+    The returned packs are new objects deserialized from the outputs of the
+    workers, so the identity of the input packs is not kept: the references
+    to an input pack (or to its entries) held by the caller do not see the
+    results of the processing.
+
+    Args:
+        components (list): The processors to run, they are copied to the
+            workers uninitialized.
+        configs (list): The configurations of the processors.
+        selectors (list): The selectors of the processors.
+        resource (Resources): The resources used to initialize the processors
+            in the workers.
+        num_workers (int): The number of worker processes.
+        max_pending (int, optional): The maximum number of packs that are sent
+            to the workers but not yet returned. Default is twice the number
+            of workers.
+    """
+
+    def __init__(self, components: List[BaseProcessor],
+                 configs: List[Optional[Config]],
+                 selectors: List[Selector],
+                 resource: Resources,
+                 num_workers: int,
+                 max_pending: Optional[int] = None):
+        if num_workers < 1:
+            raise ValueError("The number of workers must be positive.")
+
+        self._num_workers = num_workers
+        self._max_pending = max_pending or 2 * num_workers
+        self._out_queue: mp.Queue = mp.Queue()
+        self._in_queues: List[mp.Queue] = []
+        self._workers: List[mp.Process] = []
+        for _ in range(num_workers):
+            in_queue: mp.Queue = mp.Queue()
+            worker = mp.Process(
+                target=_worker_loop,
+                args=(components, configs, selectors, resource, in_queue,
+                      self._out_queue),
+                daemon=True)
+            worker.start()
+            self._in_queues.append(in_queue)
+            self._workers.append(worker)
+
+        self._seq: int = 0
+        # The worker of each pack or flush request that is not returned yet.
+        self._assigned: Dict[int, int] = {}
+        self._loads: List[int] = [0] * num_workers
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    def _send(self, kind: int, worker: int,
+              data: Optional[List[bytes]]) -> int:
+        seq = self._seq
+        self._seq += 1
+        self._assigned[seq] = worker
+        self._loads[worker] += 1
+        self._in_queues[worker].put((kind, seq, data))
+        return seq
+
+    def _receive(self) -> Tuple[int, Optional[List[bytes]]]:
+        while True:
+            try:
+                seq, data, error = self._out_queue.get(timeout=_POLL_INTERVAL)
+                break
+            except queue.Empty:
+                if not all(w.is_alive() for w in self._workers):
+                    raise ProcessExecutionException(
+                        "A worker process exited unexpectedly.") from None
+        if error is not None:
+            raise ProcessExecutionException(
+                f"Exception occurred in a worker process:\n{error}")
+        self._loads[self._assigned.pop(seq)] -= 1
+        return seq, data
+
+    def process(self, data_iter: Iterator[PackType]) -> Iterator[PackType]:
+        r"""Process the packs with the workers, the processors are flushed
+        after the input is exhausted.
+
+        Args:
+            data_iter (iterator): The packs to be processed.
+
+        Returns:
+            An iterator of the processed packs, in the input order.
+        """
+        order: List[int] = []
+        results: Dict[int, PackType] = {}
+        try:
+            for pack in data_iter:
+                worker = self._loads.index(min(self._loads))
+                order.append(self._send(_PACK, worker, _encode(pack)))
+                while len(self._assigned) >= self._max_pending:
+                    seq, data = self._receive()
+                    results[seq] = _decode(data)  # type: ignore
+                while order and order[0] in results:
+                    yield results.pop(order.pop(0))
+
+            while self._assigned:
+                seq, data = self._receive()
+                results[seq] = _decode(data)  # type: ignore
+            for seq in order:
+                yield results.pop(seq)
+            order.clear()
+            self.flush()
+        finally:
+            # Discard the packs that are not consumed, e.g. the caller stops
+            # iterating early.
+            while self._assigned:
+                self._receive()
+
+    def flush(self):
+        r"""Call the :meth:`flush` of the processors in every worker."""
+        for worker in range(self._num_workers):
+            self._send(_FLUSH, worker, None)
+        while self._assigned:
+            self._receive()
+
+    def close(self):
+        r"""Call the :meth:`finish` of the processors in every worker, and
+        stop the workers."""
+        for in_queue in self._in_queues:
+            in_queue.put((_STOP, -1, None))
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+        self._in_queues.clear()
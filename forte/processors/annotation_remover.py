@@ -6,6 +6,8 @@ from forte.utils import get_class
 
 
 class AnnotationRemover(PackProcessor):
+    parallel_safe = True
+
     def _process(self, input_pack: DataPack):
         for type_name in self.configs.removal_types:
             type_cls = get_class(type_name)
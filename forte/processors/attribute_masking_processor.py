@@ -24,6 +24,7 @@ __all__ = [
 
 
 class AttributeMasker(PackProcessor):
+    parallel_safe = True
 
     # pylint: disable=attribute-defined-outside-init
     def initialize(self, _: Resources, config: Config):
@@ -32,8 +32,19 @@ __all__ = [
 class BaseProcessor(PipelineComponent[PackType], ABC):
     r"""Base class inherited by all kinds of processors such as trainer,
     predictor and evaluator.
+
+    Attributes:
+        parallel_safe (bool): Whether the processor can process different
+            packs in separate worker processes, i.e., it does not keep states
+            across the packs. Such processors at the beginning of a
+            :class:`~forte.pipeline.Pipeline` are run in parallel when the
+            pipeline is created with multiple workers. Default is `False`,
+            processors that are known to be stateless should opt in by
+            setting it to `True`.
     """
 
+    parallel_safe: bool = False
+
     def __init__(self):
         super().__init__()
         self.selector = DummySelector()
@@ -43,6 +54,11 @@ class BaseProcessor(PipelineComponent[PackType], ABC):
         input_pack.set_control_component(self.name)
         self._process(input_pack)
 
+        if self._process_manager is None:
+            # Not run by the job queues of a pipeline, e.g., run in a worker
+            # process of the pipeline.
+            return
+
         # Change status for pack processors
         q_index = self._process_manager.current_queue_index
         u_index = self._process_manager.unprocessed_queue_indices[q_index]
@@ -15,6 +15,7 @@
 The processors that process data in batch.
 """
 import itertools
+import time
 from abc import abstractmethod, ABC
 from typing import Dict, Optional, Type, Any
 
@@ -22,20 +23,24 @@ from forte.common import Resources, ProcessorConfigError
 from forte.common.configuration import Config
 from forte.data import slice_batch
 from forte.data.base_pack import PackType
-from forte.data.batchers import ProcessingBatcher, FixedSizeDataPackBatcher
+from forte.data.batchers import (
+    ProcessingBatcher, FixedSizeDataPackBatcher, FixedSizePackBatcher)
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Annotation
 from forte.data.types import DataRequest
 from forte.process_manager import ProcessJobStatus
+from forte.profiler import ComponentStats
 from forte.processors.base.base_processor import BaseProcessor
+from forte.utils import utils
 
 __all__ = [
     "BaseBatchProcessor",
     "BatchProcessor",
     "MultiPackBatchProcessor",
     "FixedSizeBatchProcessor",
-    "FixedSizeMultiPackBatchProcessor"
+    "FixedSizeMultiPackBatchProcessor",
+    "MultiPackInstanceBatchProcessor",
 ]
 
 
@@ -54,19 +59,35 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         self.input_info: DataRequest = self._define_input_info()
         self.batcher: ProcessingBatcher = self.define_batcher()
         self.use_coverage_index = False
+        # Set by the pipeline to record the batch sizes and time.
+        self.profile_stats: Optional[ComponentStats] = None
 
     def initialize(self, resources: Resources, configs: Optional[Config]):
         super().initialize(resources, configs)
 
         assert configs is not None
         try:
-            self.batcher.initialize(configs.batcher)
+            batcher_configs = configs.batcher
         except AttributeError as e:
             raise ProcessorConfigError(
                 "Error in handling batcher config, please provide the "
                 "check the config to see if you have the key 'batcher'."
             ) from e
 
+        # The batcher can be replaced by the class named by `type`, which is
+        # configured by `kwargs`.
+        batcher_type = batcher_configs.todict().get('type')
+        if batcher_type is not None:
+            batcher = utils.create_class_with_kwargs(batcher_type, {})
+            if not isinstance(batcher, ProcessingBatcher):
+                raise ProcessorConfigError(
+                    f"The batcher {batcher_type} is not a ProcessingBatcher.")
+            self.batcher = batcher
+            batcher_configs = Config(
+                batcher_configs.todict().get('kwargs') or {},
+                batcher.default_configs())
+        self.batcher.initialize(batcher_configs)
+
     @staticmethod
     @abstractmethod
     def _define_context() -> Type[Annotation]:
@@ -118,14 +139,19 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         if self.use_coverage_index:
             self.prepare_coverage_index(input_pack)
 
-        for batch in self.batcher.get_batch(
-                input_pack, self.context_type, self.input_info):
-            pred = self.predict(batch)
-            self.pack_all(pred)
-            self.update_batcher_pool(-1)
+        batches = self.batcher.get_batch(
+            input_pack, self.context_type, self.input_info)
+        if self.profile_stats is not None:
+            batches = self.profile_stats.timed_batches(batches)
+        for batch in batches:
+            self._predict_and_pack(batch)
+            self.update_batcher_pool(self.batcher.finished_pool_end(True))
+
+        self.update_batcher_pool(self.batcher.finished_pool_end(False))
 
-        if len(self.batcher.current_batch_sources) == 0:
-            self.update_batcher_pool()
+        if self._process_manager is None:
+            # Not run by the job queues of a pipeline.
+            return
 
         # update the status of the jobs. The jobs which were removed from
         # data_pack_pool will have status "PROCESSED" else they are "QUEUED"
@@ -141,11 +167,30 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
             else:
                 job_i.set_status(ProcessJobStatus.QUEUED)
 
+    def _predict_and_pack(self, batch: Dict):
+        stats = self.profile_stats
+        if stats is None:
+            self.pack_all(self.predict(batch))
+            return
+
+        stats.add_batch(sum(self.batcher.current_batch_sources))
+        start = time.perf_counter()
+        pred = self.predict(batch)
+        predicted = time.perf_counter()
+        self.pack_all(pred)
+        stats.predict_time += predicted - start
+        stats.pack_time += time.perf_counter() - predicted
+
     def flush(self):
         for batch in self.batcher.flush():
-            pred = self.predict(batch)
-            self.pack_all(pred)
-            self.update_batcher_pool(-1)
+            self._predict_and_pack(batch)
+            self.update_batcher_pool(self.batcher.finished_pool_end(True))
+        # All the packs are finished after a flush, which can happen in the
+        # middle of a stream (e.g. by the max wait of a server).
+        self.update_batcher_pool(None)
+
+        if self._process_manager is None:
+            return
 
         current_queue = self._process_manager.current_queue
 
@@ -171,6 +216,9 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         """
         start = 0
         for i in range(len(self.batcher.data_pack_pool)):
+            if self.batcher.current_batch_sources[i] == 0:
+                # The batch has no instances of this pack.
+                continue
             pack_i = self.batcher.data_pack_pool[i]
             output_dict_i = slice_batch(output_dict, start,
                                         self.batcher.current_batch_sources[i])
@@ -183,6 +231,7 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         super_config = super().default_configs()
 
         super_config['batcher'] = cls.define_batcher().default_configs()
+        super_config['batcher'].update({'type': None, 'kwargs': {}})
 
         return super_config
 
@@ -271,3 +320,25 @@ class FixedSizeMultiPackBatchProcessor(MultiPackBatchProcessor, ABC):
     @staticmethod
     def define_batcher() -> ProcessingBatcher:
         return FixedSizeDataPackBatcher()
+
+
+class MultiPackInstanceBatchProcessor(MultiPackBatchProcessor, ABC):
+    r"""The batch processors that build their inputs from the whole multi
+    packs instead of the entries in a context, e.g. to create or search the
+    queries of a batch of multi packs together. Each multi pack is one
+    instance of the batches, see
+    :class:`~forte.data.batchers.FixedSizePackBatcher`.
+    """
+
+    @staticmethod
+    def _define_context() -> Type[Annotation]:
+        # The inputs are built from the whole packs.
+        return Annotation
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {}
+
+    @staticmethod
+    def define_batcher() -> ProcessingBatcher:
+        return FixedSizePackBatcher()
@@ -16,9 +16,9 @@ Processors that augment the data. The processor will call
 replacement ops to generate texts similar to those in the input pack
 and create a new pack with them.
 """
-from copy import deepcopy
 from collections import defaultdict
-from typing import List, Tuple, Dict, DefaultDict, Set, Union, cast
+from typing import (
+    List, Tuple, Dict, DefaultDict, Optional, Set, Union, cast)
 from bisect import bisect_right, bisect_left
 from sortedcontainers import SortedList, SortedDict
 from forte.data.ontology.core import Entry, BaseLink
@@ -410,7 +410,7 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
             The links and groups will be copied if there members are copied.
         """
         if len(replaced_annotations) == 0:
-            return deepcopy(data_pack)
+            return data_pack.fork()
 
         spans: List[Span] = [
             span for span, _ in replaced_annotations]
@@ -444,7 +444,7 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
             new_spans.append(Span(new_begin, new_end))
             bias = new_end - old_end
 
-        new_pack: DataPack = DataPack()
+        new_pack: DataPack = DataPack(columnar=data_pack.columnar)
         new_pack.set_text(new_text)
 
         entries_to_copy: List[str] = \
@@ -462,10 +462,9 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
         def _insert_new_span(
                 insert_ind: int,
                 inserted_annos: List[Tuple[int, int]],
-                new_pack: DataPack,
                 spans: List[Span],
                 new_spans: List[Span]
-        ):
+        ) -> Span:
             r"""
             An internal helper function for insertion.
             """
@@ -480,19 +479,14 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
                 # Include the inserted span itself.
                 is_inclusive=True
             )
-            insert_begin: int = insert_end - length
-            new_anno = create_class_with_kwargs(
-                entry,
-                {
-                    "pack": new_pack,
-                    "begin": insert_begin,
-                    "end": insert_end
-                }
-            )
-            new_pack.add_entry(new_anno)
+            return Span(insert_end - length, insert_end)
 
-        # Iterate over all the original entries and modify their spans.
+        # Iterate over all the original entries and modify their spans. The
+        # new annotations of each type are added to the new pack at once.
         for entry in entries_to_copy:
+            # The new spans, and the original tids (`None` for insertions).
+            aligned_spans: List[Span] = []
+            orig_tids: List[Optional[int]] = []
             for orig_anno in data_pack.get(get_class(entry)):
                 # Dealing with insertion/deletion only for augment_entry.
                 if entry == self.configs['augment_entry']:
@@ -501,13 +495,13 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
                         # Preserve the order of the spans with merging sort.
                         # It is a 2-way merging from the inserted spans
                         # and original spans based on the begin index.
-                        _insert_new_span(
+                        aligned_spans.append(_insert_new_span(
                             insert_ind,
                             inserted_annos,
-                            new_pack,
                             spans,
                             new_spans
-                        )
+                        ))
+                        orig_tids.append(None)
                         insert_ind += 1
 
                     # Deletion
@@ -530,29 +524,30 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
                     span_new_end = modify_index(
                         orig_anno.end, spans, new_spans, False, is_inclusive)
 
-                new_anno = create_class_with_kwargs(
-                    entry,
-                    {
-                        "pack": new_pack,
-                        "begin": span_new_begin,
-                        "end": span_new_end
-                    }
-                )
-                new_pack.add_entry(new_anno)
-                entry_map[orig_anno.tid] = new_anno.tid
+                aligned_spans.append(Span(span_new_begin, span_new_end))
+                orig_tids.append(orig_anno.tid)
 
             # Deal with spans after the last annotation in the original pack.
             if entry == self.configs['augment_entry']:
                 while insert_ind < len(inserted_annos):
-                    _insert_new_span(
+                    aligned_spans.append(_insert_new_span(
                         insert_ind,
                         inserted_annos,
-                        new_pack,
                         spans,
                         new_spans
-                    )
+                    ))
+                    orig_tids.append(None)
                     insert_ind += 1
 
+            new_tids: List[int] = new_pack.add_annotations(
+                get_class(entry),
+                [span.begin for span in aligned_spans],
+                [span.end for span in aligned_spans]
+            )
+            for orig_tid, new_tid in zip(orig_tids, new_tids):
+                if orig_tid is not None:
+                    entry_map[orig_tid] = new_tid
+
         # Iterate over and copy the links/groups in the datapack.
         for link in data_pack.get(Link):
             self._copy_link_or_group(link, entry_map, new_pack)
@@ -603,7 +598,7 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
 
         # Get the children entries.
         children: List[Entry]
-        if is_link:
+        if isinstance(entry, Link):
             children = [entry.get_parent(), entry.get_child()]
         else:
             children = entry.get_members()
@@ -660,7 +655,7 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
         # The entry should be either MultiPackLink or MultiPackGroup.
         is_link: bool = isinstance(entry, BaseLink)
         children: List[Entry]
-        if is_link:
+        if isinstance(entry, MultiPackLink):
             children = [entry.get_parent(), entry.get_child()]
         else:
             children = entry.get_members()
@@ -34,7 +34,6 @@ class BasePackProcessor(BaseProcessor[PackType], ABC):
     are looking for batching (that might happen across packs, refer to
     :class:`BaseBatchProcessor`.
     """
-    pass
 
 
 class PackProcessor(BaseProcessor[DataPack], ABC):
@@ -15,7 +15,7 @@
 Processors that handle query
 """
 from abc import ABC
-from typing import Union, Tuple, Dict, Any
+from typing import Union, Tuple, Dict, Any, List, Sequence
 
 import numpy as np
 
@@ -23,10 +23,13 @@ from forte.common import EntryNotFoundError
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Query
+from forte.processors.base.batch_processor import (
+    MultiPackInstanceBatchProcessor)
 from forte.processors.base.pack_processor import MultiPackProcessor
 
 __all__ = [
-    "QueryProcessor"
+    "QueryProcessor",
+    "BatchQueryProcessor",
 ]
 
 QueryType = Union[Dict[str, Any], np.ndarray]
@@ -71,12 +74,57 @@ class QueryProcessor(MultiPackProcessor, ABC):
 
     def _process(self, input_pack: MultiPack):
         query_pack, query_value = self._process_query(input_pack)
+        _set_query(query_pack, query_value)
 
-        # Make sure we only have one query on this pack.
-        query: Query
-        try:
-            query = query_pack.get_single(Query)  # type: ignore
-        except EntryNotFoundError:
-            query = Query(pack=query_pack)
 
-        query.value = query_value
+class BatchQueryProcessor(MultiPackInstanceBatchProcessor, ABC):
+    r"""A base class for the processors that create the queries of a batch
+    of multi packs together, e.g. to encode the queries in one forward pass
+    of a neural model. Each multi pack is one instance of the batches.
+    """
+
+    def _query_text(self, input_pack: MultiPack) -> Tuple[DataPack, str]:
+        r"""Subclasses of BatchQueryProcessor should implement this method
+        which fetches the text to create the query of `input_pack`.
+
+        Args:
+            input_pack (MultiPack): A multi pack for which a query is
+                generated.
+
+        Returns:
+            A tuple containing the `(query_pack, text)`, `query_pack` is the
+            data pack of `input_pack` to add the query to.
+        """
+        raise NotImplementedError
+
+    def _build_queries(self, texts: List[str]) -> Sequence[QueryType]:
+        r"""Subclasses of BatchQueryProcessor need to implement this method to
+        create the queries of a batch of texts.
+
+        Args:
+            texts (list): The texts for which the queries will be generated.
+
+        Returns:
+            A list of the queries of `texts`.
+        """
+        raise NotImplementedError
+
+    def predict(self, data_batch: Dict) -> Dict:
+        texts = [self._query_text(input_pack)[1]
+                 for input_pack in data_batch['pack']]
+        return {'query': self._build_queries(texts)}
+
+    def pack(self, pack: MultiPack, inputs: Dict):
+        query_pack, _ = self._query_text(pack)
+        _set_query(query_pack, inputs['query'][0])
+
+
+def _set_query(query_pack: DataPack, query_value: QueryType):
+    # Make sure we only have one query on this pack.
+    query: Query
+    try:
+        query = query_pack.get_single(Query)  # type: ignore
+    except EntryNotFoundError:
+        query = Query(pack=query_pack)
+
+    query.value = query_value
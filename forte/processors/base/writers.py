@@ -26,7 +26,9 @@ import posixpath
 from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.base_pack import BasePack
+from forte.data.binary_io import pack_suffix
 from forte.data.data_pack import DataPack
+from forte.data.data_utils import serialize
 from forte.data.multi_pack import MultiPack
 from forte.processors.base.pack_processor import PackProcessor, \
     MultiPackProcessor
@@ -42,7 +44,8 @@ __all__ = [
 
 def write_pack(input_pack: BasePack, output_dir: str, sub_path: str,
                indent: Optional[int] = None, zip_pack: bool = False,
-               overwrite: bool = False, drop_record: bool = False) -> str:
+               overwrite: bool = False, drop_record: bool = False,
+               serialize_method: str = "jsonpickle") -> str:
     """
     Write a pack to a path.
 
@@ -54,30 +57,42 @@ def write_pack(input_pack: BasePack, output_dir: str, sub_path: str,
         zip_pack: Whether to zip the output JSON.
         overwrite: Whether to overwrite the file if already exists.
         drop_record: Whether to drop the creation records in the serialization.
+        serialize_method: The serialization method, either `"jsonpickle"` or
+            `"binary"`. The binary packs are written with the `.bin` suffix,
+            and `indent` does not apply to them.
 
     Returns:
         If successfully written, will return the path of the output file.
         otherwise, will return None.
 
     """
-    output_path = os.path.join(output_dir, sub_path) + '.json'
+    output_path = os.path.join(
+        output_dir, sub_path) + pack_suffix(serialize_method)
     if overwrite or not os.path.exists(output_path):
         if zip_pack:
             output_path = output_path + '.gz'
 
         ensure_dir(output_path)
 
-        out_str: str = input_pack.serialize(drop_record)
+        out_data = serialize(input_pack, drop_record, serialize_method)
 
-        if indent:
-            out_str = json.dumps(json.loads(out_str), indent=indent)
-
-        if zip_pack:
-            with gzip.open(output_path, 'wt') as out:
-                out.write(out_str)
+        if isinstance(out_data, bytes):
+            if zip_pack:
+                with gzip.open(output_path, 'wb') as out:
+                    out.write(out_data)
+            else:
+                with open(output_path, 'wb') as out:
+                    out.write(out_data)
         else:
-            with open(output_path, 'w') as out:
-                out.write(out_str)
+            if indent:
+                out_data = json.dumps(json.loads(out_data), indent=indent)
+
+            if zip_pack:
+                with gzip.open(output_path, 'wt') as out:
+                    out.write(out_data)
+            else:
+                with open(output_path, 'w') as out:
+                    out.write(out_data)
     else:
         logging.info("Will not overwrite existing path %s", output_path)
 
@@ -122,7 +137,8 @@ class JsonPackWriter(PackProcessor, ABC):
             'output_dir': None,
             'zip_pack': False,
             'indent': None,
-            'drop_record': False
+            'drop_record': False,
+            'serialize_method': 'jsonpickle'
         })
         return config
 
@@ -135,7 +151,8 @@ class JsonPackWriter(PackProcessor, ABC):
         maybe_create_dir(self.configs.output_dir)
         write_pack(input_pack, self.configs.output_dir, sub_path,
                    self.configs.indent, self.configs.zip_pack,
-                   self.configs.overwrite, self.configs.drop_record)
+                   self.configs.overwrite, self.configs.drop_record,
+                   self.configs.serialize_method)
 
 
 class MultiPackWriter(MultiPackProcessor):
@@ -180,7 +197,7 @@ class MultiPackWriter(MultiPackProcessor):
             pack_out = write_pack(
                 pack, pack_out_dir, self.pack_name(pack), self.configs.indent,
                 self.configs.zip_pack, self.configs.overwrite,
-                self.configs.drop_record)
+                self.configs.drop_record, self.configs.serialize_method)
 
             self.pack_idx_out.write(
                 f'{pack.meta.pack_id}\t'
@@ -190,7 +207,7 @@ class MultiPackWriter(MultiPackProcessor):
             input_pack, multi_out_dir,
             self.multipack_name(input_pack), self.configs.indent,
             self.configs.zip_pack, self.configs.overwrite,
-            self.configs.drop_record
+            self.configs.drop_record, self.configs.serialize_method
         )
 
         self.multi_idx_out.write(
@@ -208,6 +225,7 @@ class MultiPackWriter(MultiPackProcessor):
             'output_dir': None,
             'zip_pack': False,
             'indent': None,
-            'drop_record': False
+            'drop_record': False,
+            'serialize_method': 'jsonpickle'
         })
         return config
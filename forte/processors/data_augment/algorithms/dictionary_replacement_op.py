@@ -60,7 +60,9 @@ class DictionaryReplacementOp(TextReplacementOp):
         if random.random() > self.configs["prob"]:
             return False, input.text
         word = input.text
-        pos_tag = input.pos
+        # The Part-of-Speech is only available on the annotations having it,
+        # such as Token.
+        pos_tag = getattr(input, "pos", "")
         lang = self.configs["lang"]
         synonyms = self.dictionary.get_synonyms(word, pos_tag, lang)
         if len(synonyms) == 0:
@@ -14,7 +14,7 @@
 
 # pylint: disable=attribute-defined-outside-init
 import pickle
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import torch
@@ -25,24 +25,21 @@ from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
-from forte.processors.base import QueryProcessor
+from forte.processors.base import QueryProcessor, BatchQueryProcessor
 
 __all__ = [
-    "BertBasedQueryCreator"
+    "BertBasedQueryCreator",
+    "BatchBertBasedQueryCreator",
 ]
 
 
-class BertBasedQueryCreator(QueryProcessor):
-    r"""This processor searches relevant documents for a query"""
+class _BertQueryEncoder:
+    r"""Encodes the queries by the embeddings of the `[CLS]` token of a BERT
+    encoder, shared by the query creators below."""
 
-    # pylint: disable=useless-super-delegation
-    def __init__(self) -> None:
-        super().__init__()
-
-    def initialize(self, resources: Resources, configs: Config):
-        self.resource = resources
-        self.config = configs
+    config: Config
 
+    def _initialize_encoder(self):
         self.device = torch.device("cuda" if torch.cuda.is_available()
                                    else "cpu")
 
@@ -62,22 +59,7 @@ class BertBasedQueryCreator(QueryProcessor):
             self.encoder.load_state_dict(state_dict["bert"])
 
         self.encoder.to(self.device)
-
-    @classmethod
-    def default_configs(cls) -> Dict[str, Any]:
-        config = super().default_configs()
-        config.update({
-            "model": {
-                'path': None,
-                "name": "bert-base-uncased",
-            },
-            "tokenizer": {
-                "name": "bert-base-uncased"
-            },
-            "max_seq_length": 128,
-            "query_pack_name": "query"
-        })
-        return config
+        self.encoder.eval()
 
     @torch.no_grad()
     def get_embeddings(self, inputs, sequence_length, segment_ids):
@@ -88,23 +70,34 @@ class BertBasedQueryCreator(QueryProcessor):
 
         return cls_token
 
-    def _build_query(self, text: str) -> np.ndarray:
-        input_ids, segment_ids, input_mask = \
-            self.tokenizer.encode_text(
-                text_a=text, max_seq_length=self.config.max_seq_length)
-        input_ids = torch.LongTensor(input_ids).unsqueeze(0).to(self.device)
-        segment_ids = torch.LongTensor(segment_ids).unsqueeze(0).to(self.device)
-        input_mask = torch.LongTensor(input_mask).unsqueeze(0).to(self.device)
-        sequence_length = (~(input_mask == 0)).sum(dim=1)
-        query_vector = self.get_embeddings(inputs=input_ids,
-                                           sequence_length=sequence_length,
-                                           segment_ids=segment_ids)
-        query_vector = torch.mean(query_vector, dim=0, keepdim=True)
-        query_vector = query_vector.cpu().numpy()
-        return query_vector
-
-    def _process_query(self, input_pack: MultiPack) \
-            -> Tuple[DataPack, Dict[str, Any]]:
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        r"""Encode ``texts`` in one forward pass, the texts are padded to the
+        longest one.
+
+        Returns:
+            An array of shape ``[len(texts), hidden_size]``.
+        """
+        encoded = [self.tokenizer.encode_text(
+            text_a=text, max_seq_length=self.config.max_seq_length)
+            for text in texts]
+        lengths = [sum(input_mask) for _, _, input_mask in encoded]
+        # The texts are padded at the end to the maximum sequence length,
+        # which is cut to the longest text.
+        max_length = max(lengths)
+        input_ids = torch.tensor(
+            [input_ids[:max_length] for input_ids, _, _ in encoded],
+            dtype=torch.long, device=self.device)
+        segment_ids = torch.tensor(
+            [segment_ids[:max_length] for _, segment_ids, _ in encoded],
+            dtype=torch.long, device=self.device)
+        sequence_length = torch.tensor(
+            lengths, dtype=torch.long, device=self.device)
+        query_vectors = self.get_embeddings(inputs=input_ids,
+                                            sequence_length=sequence_length,
+                                            segment_ids=segment_ids)
+        return query_vectors.cpu().numpy()
+
+    def _query_text(self, input_pack: MultiPack) -> Tuple[DataPack, str]:
         query_pack: DataPack = input_pack.get_pack(self.config.query_pack_name)
         context = [query_pack.text]
 
@@ -117,8 +110,77 @@ class BertBasedQueryCreator(QueryProcessor):
             bot_pack = input_pack.get_pack("bot_utterance")
             context.append(bot_pack.text)
 
-        text = ' '.join(context)
+        return query_pack, ' '.join(context)
+
+
+class BertBasedQueryCreator(_BertQueryEncoder, QueryProcessor):
+    r"""This processor searches relevant documents for a query"""
+
+    # pylint: disable=useless-super-delegation
+    def __init__(self) -> None:
+        super().__init__()
+
+    def initialize(self, resources: Resources, configs: Config):
+        self.resource = resources
+        self.config = configs
+        self._initialize_encoder()
+
+    @classmethod
+    def default_configs(cls) -> Dict[str, Any]:
+        config = super().default_configs()
+        config.update({
+            "model": {
+                'path': None,
+                "name": "bert-base-uncased",
+            },
+            "tokenizer": {
+                "name": "bert-base-uncased"
+            },
+            "max_seq_length": 128,
+            "query_pack_name": "query"
+        })
+        return config
+
+    def _build_query(self, text: str) -> np.ndarray:
+        return self._encode([text])
+
+    def _process_query(self, input_pack: MultiPack) \
+            -> Tuple[DataPack, Dict[str, Any]]:
+        query_pack, text = self._query_text(input_pack)
 
         query_vector = self._build_query(text=text)
 
         return query_pack, query_vector
+
+
+class BatchBertBasedQueryCreator(_BertQueryEncoder, BatchQueryProcessor):
+    r"""This processor creates the queries of the multi packs in the same way
+    as :class:`BertBasedQueryCreator`, but the queries of a batch of packs
+    (configured by ``batcher.batch_size``) are encoded together in one
+    forward pass."""
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self.resource = resources
+        self.config = configs
+        self._initialize_encoder()
+
+    @classmethod
+    def default_configs(cls) -> Dict[str, Any]:
+        config = super().default_configs()
+        config.update({
+            "model": {
+                'path': None,
+                "name": "bert-base-uncased",
+            },
+            "tokenizer": {
+                "name": "bert-base-uncased"
+            },
+            "max_seq_length": 128,
+            "query_pack_name": "query"
+        })
+        return config
+
+    def _build_queries(self, texts: List[str]) -> List[np.ndarray]:
+        query_vectors = self._encode(texts)
+        return [query_vectors[i:i + 1] for i in range(len(texts))]
@@ -14,7 +14,7 @@
 
 # pylint: disable=attribute-defined-outside-init
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 import torch
 
@@ -57,6 +57,7 @@ class BertRerankingProcessor(MultiPackProcessor):
             pretrained_model_name=self.config.pretrained_model_name,
             cache_dir=cache_dir,
             hparams=self.config).to(self.device)
+        self.model.eval()
 
         self.tokenizer = BERTTokenizer(
             pretrained_model_name=self.config.pretrained_model_name,
@@ -73,37 +74,71 @@ class BertRerankingProcessor(MultiPackProcessor):
             "field": "content",
             "pretrained_model_name": pretrained_model_name,
             "model_dir": os.path.join(os.path.dirname(__file__), "models"),
-            "max_seq_length": 512
+            "max_seq_length": 512,
+            # The number of documents scored in one forward pass, all the
+            # documents of a pack are scored at once if it is not positive.
+            "batch_size": 32,
         })
         return configs
 
     def _process(self, input_pack: MultiPack):
-        max_len = self.config.max_seq_length
         query_pack_name = self.config.query_pack_name
 
         query_pack = input_pack.get_pack(self.config.query_pack_name)
         query_entry = list(query_pack.get(Query))[0]
-        query_text = query_pack.text
 
-        packs = {}
-        for doc_id in input_pack.pack_names:
-            if doc_id == query_pack_name:
-                continue
-
-            pack = input_pack.get_pack(doc_id)
-            document_text = pack.text
-
-            # BERT Inference
-            input_ids, segment_ids, input_mask = [
-                torch.LongTensor(item).unsqueeze(0).to(self.device)
-                for item in self.tokenizer.encode_text(
-                    query_text, document_text, max_len)]
-
-            seq_length = (input_mask == 1).sum(dim=-1)
-            logits, _ = self.model(input_ids, seq_length, segment_ids)
-            preds = torch.nn.functional.softmax(torch.Tensor(logits), dim=1)
-
-            score = preds.detach().tolist()[0][1]
-
-            query_entry.update_results({doc_id: score})
-            packs[doc_id] = pack
+        doc_ids = [doc_id for doc_id in input_pack.pack_names
+                   if doc_id != query_pack_name]
+        scores = self.score_documents(
+            query_pack.text,
+            [input_pack.get_pack(doc_id).text for doc_id in doc_ids])
+        query_entry.update_results(dict(zip(doc_ids, scores)))
+
+    def score_documents(self, query_text: str,
+                        document_texts: List[str]) -> List[float]:
+        r"""Score the relevance of the documents to the query with the BERT
+        classifier. The documents are sorted by the lengths of the encoded
+        query and document pairs and scored in batches of
+        ``config.batch_size``, so each batch is only padded to the longest
+        pair in it.
+
+        Args:
+            query_text: The text of the query.
+            document_texts: The texts of the documents.
+
+        Returns:
+            The relevance scores of the documents, in the same order as
+            ``document_texts``.
+        """
+        encoded = [self.tokenizer.encode_text(
+            query_text, document_text, self.config.max_seq_length)
+            for document_text in document_texts]
+        lengths = [sum(input_mask) for _, _, input_mask in encoded]
+        order = sorted(range(len(encoded)), key=lengths.__getitem__)
+        batch_size = self.config.batch_size
+        if batch_size <= 0:
+            batch_size = max(len(order), 1)
+
+        scores = [0.0] * len(encoded)
+        with torch.no_grad():
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                # The pairs are padded at the end to the maximum sequence
+                # length, which is cut to the longest pair in the batch.
+                batch_length = lengths[batch[-1]]
+                input_ids = torch.tensor(
+                    [encoded[i][0][:batch_length] for i in batch],
+                    dtype=torch.long, device=self.device)
+                segment_ids = torch.tensor(
+                    [encoded[i][1][:batch_length] for i in batch],
+                    dtype=torch.long, device=self.device)
+                seq_length = torch.tensor(
+                    [lengths[i] for i in batch], dtype=torch.long,
+                    device=self.device)
+
+                logits, _ = self.model(input_ids, seq_length, segment_ids)
+                preds = torch.nn.functional.softmax(logits, dim=1)
+
+                for i, score in zip(batch, preds[:, 1].tolist()):
+                    scores[i] = score
+        return scores
@@ -13,60 +13,127 @@
 # limitations under the License.
 
 # pylint: disable=attribute-defined-outside-init
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import numpy as np
 
 from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Query
 from forte.indexers import EmbeddingBasedIndexer
-from forte.processors.base import MultiPackProcessor
+from forte.processors.base import (
+    MultiPackProcessor, MultiPackInstanceBatchProcessor)
 from ft.onto.base_ontology import Document
 
 __all__ = [
-    "SearchProcessor"
+    "SearchProcessor",
+    "BatchSearchProcessor",
 ]
 
 
 class SearchProcessor(MultiPackProcessor):
-    r"""This processor searches for relevant documents for a query"""
-
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.index = EmbeddingBasedIndexer(config={
-            "index_type": "GpuIndexFlatIP",
-            "dim": 768,
-            "device": "gpu0"
-        })
+    r"""This processor searches for relevant documents for a query. All the
+    queries in the query pack are searched with one index lookup."""
 
     def initialize(self, resources: Resources, configs: Config):
         self.resources = resources
         self.config = configs
+        self.index = EmbeddingBasedIndexer(config=self.config.index_config)
         self.index.load(self.config.model_dir)
         self.k = self.config.k or 5
 
     def _process(self, input_pack: MultiPack):
         query_pack = input_pack.get_pack(self.config.query_pack_name)
-        first_query = list(query_pack.get(Query))[0]
-        results = self.index.search(first_query.value, self.k)
-        documents = [r[1] for result in results for r in result]
+        query_vectors = _query_vectors(query_pack.get(Query))
+        ids, _ = self.index.search_ids(query_vectors, self.k)
+        _add_documents(input_pack, self.index.get_meta_data(_unique_hits(ids)),
+                       self.config.response_pack_name_prefix)
+
+    @classmethod
+    def default_configs(cls) -> Dict[str, Any]:
+        config = super().default_configs()
+        config.update(_search_configs())
+        return config
+
+
+class BatchSearchProcessor(MultiPackInstanceBatchProcessor):
+    r"""This processor searches for relevant documents for the queries in the
+    same way as :class:`SearchProcessor`, but the queries of a batch of multi
+    packs (configured by ``batcher.batch_size``) are searched with one index
+    lookup."""
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self.config = configs
+        self.index = EmbeddingBasedIndexer(config=self.config.index_config)
+        self.index.load(self.config.model_dir)
+        self.k = self.config.k or 5
 
-        packs = {}
-        for i, doc in enumerate(documents):
-            pack = input_pack.add_pack()
-            pack.set_text(doc)
+    def predict(self, data_batch: Dict) -> Dict:
+        query_vectors = [
+            _query_vectors(input_pack.get_pack(
+                self.config.query_pack_name).get(Query))
+            for input_pack in data_batch['pack']]
+        ids, _ = self.index.search_ids(np.concatenate(query_vectors), self.k)
 
-            Document(pack, 0, len(doc))
-            packs[self.config.response_pack_name_prefix + f'_{i}'] = pack
+        # Split the hits by the packs.
+        pack_ids: List[np.ndarray] = []
+        start = 0
+        for vectors in query_vectors:
+            pack_ids.append(ids[start:start + len(vectors)])
+            start += len(vectors)
+        return {'ids': pack_ids}
 
-        input_pack.update_pack(packs)
+    def pack(self, pack: MultiPack, inputs: Dict):
+        _add_documents(
+            pack, self.index.get_meta_data(_unique_hits(inputs['ids'][0])),
+            self.config.response_pack_name_prefix)
 
     @classmethod
     def default_configs(cls) -> Dict[str, Any]:
         config = super().default_configs()
-        config.update({
-            'model_dir': None,
-            'response_pack_name_prefix': 'doc'
-        })
+        config.update(_search_configs())
         return config
+
+
+def _search_configs() -> Dict[str, Any]:
+    return {
+        'model_dir': None,
+        'query_pack_name': 'query',
+        'k': 5,
+        'index_config': {
+            "index_type": "GpuIndexFlatIP",
+            "dim": 768,
+            "device": "gpu0"
+        },
+        'response_pack_name_prefix': 'doc'
+    }
+
+
+def _query_vectors(queries) -> np.ndarray:
+    r"""Stack the values of ``queries`` into an array of shape
+    ``[num_queries, dim]``, each value can be one or more vectors."""
+    return np.concatenate(
+        [np.atleast_2d(query.value) for query in queries]).astype(np.float32)
+
+
+def _unique_hits(ids: np.ndarray) -> List[int]:
+    r"""The ids in ``ids`` (of shape ``[num_queries, k]``) without the
+    duplicates found by several queries, ordered by their best rank. The
+    missing hits (-1) are skipped."""
+    hits: Dict[int, None] = {}
+    # Visit the hits of all the queries rank by rank.
+    for idx in ids.T.ravel():
+        if idx >= 0:
+            hits.setdefault(int(idx))
+    return list(hits)
+
+
+def _add_documents(input_pack: MultiPack, documents: List[str],
+                   response_pack_name_prefix: str):
+    for i, doc in enumerate(documents):
+        pack = input_pack.add_pack(f'{response_pack_name_prefix}_{i}')
+        pack.set_text(doc)
+
+        Document(pack, 0, len(doc))
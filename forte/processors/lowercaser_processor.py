@@ -21,6 +21,7 @@ __all__ = [
 
 
 class LowerCaserProcessor(PackProcessor):
+    parallel_safe = True
 
     def _process(self, input_pack: DataPack):
         input_pack.set_text(input_pack.text.lower())
@@ -284,8 +284,7 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
         r"""Default config for NER Predictor"""
 
         configs = super().default_configs()
-        # TODO: Batcher in NER need to be update to use the sytem one.
-        configs["batcher"] = {"batch_size": 10}
+        configs["batcher"]["batch_size"] = 16
 
         more_configs = {
             "config_data": {
@@ -341,9 +340,6 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                 "model_path": "",
                 "resource_dir": ""
             },
-            "batcher": {
-                "batch_size": 16
-            }
         }
 
         configs.update(more_configs)
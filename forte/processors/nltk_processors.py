@@ -37,19 +37,22 @@ __all__ = [
 class NLTKWordTokenizer(PackProcessor):
     r"""A wrapper of NLTK word tokenizer.
     """
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
         self.tokenizer = TreebankWordTokenizer()
 
     def _process(self, input_pack: DataPack):
-        for begin, end in self.tokenizer.span_tokenize(input_pack.text):
-            Token(input_pack, begin, end)
+        spans = list(self.tokenizer.span_tokenize(input_pack.text))
+        input_pack.add_annotations(
+            Token, [begin for begin, _ in spans], [end for _, end in spans])
 
 
 class NLTKPOSTagger(PackProcessor):
     r"""A wrapper of NLTK pos tagger.
     """
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
@@ -67,6 +70,7 @@ class NLTKPOSTagger(PackProcessor):
 class NLTKLemmatizer(PackProcessor):
     r"""A wrapper of NLTK lemmatizer.
     """
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
@@ -103,6 +107,7 @@ def penn2morphy(penntag: str) -> str:
 class NLTKChunker(PackProcessor):
     r"""A wrapper of NLTK chunker.
     """
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
@@ -155,6 +160,7 @@ class NLTKChunker(PackProcessor):
 class NLTKSentenceSegmenter(PackProcessor):
     r"""A wrapper of NLTK sentence tokenizer.
     """
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
@@ -168,6 +174,7 @@ class NLTKSentenceSegmenter(PackProcessor):
 class NLTKNER(PackProcessor):
     r"""A wrapper of NLTK NER.
     """
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
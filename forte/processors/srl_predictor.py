@@ -64,10 +64,6 @@ class SRLPredictor(FixedSizeBatchProcessor):
         model_dir = configs.storage_path if configs is not None else None
         logger.info("restoring SRL model from %s", model_dir)
 
-        # initialize the batcher
-        if configs:
-            self.batcher.initialize(configs.batcher)
-
         self.word_vocab = tx.data.Vocab(
             os.path.join(model_dir, "embeddings/word_vocab.english.txt"))
         self.char_vocab = tx.data.Vocab(
@@ -151,8 +147,6 @@ class SRLPredictor(FixedSizeBatchProcessor):
         configs = super().default_configs()
         configs.update({
             'storage_path': None,
-            "batcher": {
-                "batch_size": 4
-            }
         })
+        configs["batcher"]["batch_size"] = 4
         return configs
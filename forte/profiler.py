@@ -0,0 +1,202 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Timing and throughput instrumentation of the pipeline components.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from forte.data.base_pack import BasePack
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ComponentStats",
+    "PipelineProfiler",
+]
+
+T = TypeVar('T')
+
+
+class ComponentStats:
+    r"""The statistics of a pipeline component (or the reader).
+
+    Attributes:
+        name (str): The name of the component.
+        num_calls (int): The number of times the component is called.
+        wall_time (float): The seconds spent in the component.
+        packs_in (int): The number of packs passed to the component.
+        packs_out (int): The number of packs finished by the component.
+        entries_created (int): The number of entries created by the component
+            in the finished packs, according to their creation records.
+        num_batches (int): The number of batches, for batch processors.
+        num_instances (int): The total size of the batches.
+        max_batch_size (int): The size of the largest batch.
+        get_batch_time (float): The seconds spent in creating the batches.
+        predict_time (float): The seconds spent in `predict`.
+        pack_time (float): The seconds spent in `pack_all`.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.num_calls: int = 0
+        self.wall_time: float = 0.0
+        self.packs_in: int = 0
+        self.packs_out: int = 0
+        self.entries_created: int = 0
+
+        self.num_batches: int = 0
+        self.num_instances: int = 0
+        self.max_batch_size: int = 0
+        self.get_batch_time: float = 0.0
+        self.predict_time: float = 0.0
+        self.pack_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        r"""The number of finished packs per second spent in the component.
+        """
+        if self.wall_time == 0:
+            return 0.0
+        return self.packs_out / self.wall_time
+
+    def add_batch(self, batch_size: int):
+        self.num_batches += 1
+        self.num_instances += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+
+    def timed_batches(self, batches: Iterator[T]) -> Iterator[T]:
+        r"""Wrap the iterator of batches to record the time spent in creating
+        them."""
+        while True:
+            start = time.perf_counter()
+            try:
+                batch = next(batches)
+            except StopIteration:
+                self.get_batch_time += time.perf_counter() - start
+                return
+            self.get_batch_time += time.perf_counter() - start
+            yield batch
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "name": self.name,
+            "num_calls": self.num_calls,
+            "wall_time": self.wall_time,
+            "packs_in": self.packs_in,
+            "packs_out": self.packs_out,
+            "entries_created": self.entries_created,
+            "throughput": self.throughput,
+        }
+        if self.num_batches > 0:
+            result.update({
+                "num_batches": self.num_batches,
+                "mean_batch_size": self.num_instances / self.num_batches,
+                "max_batch_size": self.max_batch_size,
+                "get_batch_time": self.get_batch_time,
+                "predict_time": self.predict_time,
+                "pack_time": self.pack_time,
+            })
+        return result
+
+    def __repr__(self):
+        return (f"{self.name}: {self.num_calls} calls, "
+                f"{self.wall_time:.3f}s, {self.packs_in} packs in, "
+                f"{self.packs_out} packs out, "
+                f"{self.entries_created} entries created")
+
+
+class PipelineProfiler:
+    r"""Record the :class:`ComponentStats` of the reader and the components
+    of a pipeline.
+
+    Args:
+        reader_name (str): The name of the reader.
+        component_names (list): The names of the components, in the pipeline
+            order.
+        log_interval (float, optional): If given, the report is logged (or
+            passed to the `callback`) every `log_interval` seconds while the
+            pipeline is running.
+        callback (callable, optional): The function that receives the
+            periodic reports, instead of logging them.
+    """
+
+    def __init__(self, reader_name: str, component_names: List[str],
+                 log_interval: Optional[float] = None,
+                 callback: Optional[
+                     Callable[[List[Dict[str, Any]]], None]] = None):
+        self.reader_stats = ComponentStats(reader_name)
+        self.component_stats: List[ComponentStats] = [
+            ComponentStats(name) for name in component_names]
+        self._log_interval = log_interval
+        self._callback = callback
+        self._last_report = time.perf_counter()
+
+    def timed_reader(self, data_iter: Iterator[T]) -> Iterator[T]:
+        r"""Wrap the iterator of the reader to record its time."""
+        stats = self.reader_stats
+        while True:
+            start = time.perf_counter()
+            try:
+                pack = next(data_iter)
+            except StopIteration:
+                stats.wall_time += time.perf_counter() - start
+                return
+            stats.wall_time += time.perf_counter() - start
+            stats.num_calls += 1
+            stats.packs_out += 1
+            yield pack
+
+    def record_call(self, index: int, num_packs: int, wall_time: float):
+        r"""Record a call of the component at `index` on `num_packs` packs.
+        """
+        stats = self.component_stats[index]
+        stats.num_calls += 1
+        stats.packs_in += num_packs
+        stats.wall_time += wall_time
+
+    def record_out(self, index: int, pack: BasePack):
+        r"""Record that the component at `index` finishes the `pack`."""
+        stats = self.component_stats[index]
+        stats.packs_out += 1
+        stats.entries_created += len(
+            pack.creation_records.get(stats.name, ()))
+        self._maybe_report()
+
+    def report(self) -> List[Dict[str, Any]]:
+        r"""The statistics of the reader and the components.
+
+        Returns:
+            A list of dictionaries (see :meth:`ComponentStats.to_dict`), the
+            first one is the reader.
+        """
+        return [self.reader_stats.to_dict()] + [
+            stats.to_dict() for stats in self.component_stats]
+
+    def log_report(self):
+        for stats in [self.reader_stats] + self.component_stats:
+            logger.info("%s", stats)
+
+    def _maybe_report(self):
+        if self._log_interval is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_report < self._log_interval:
+            return
+        self._last_report = now
+        if self._callback is None:
+            self.log_report()
+        else:
+            self._callback(self.report())
@@ -0,0 +1,311 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A server that runs a pipeline over the packs submitted by concurrent callers,
+so that the batch processors batch the packs of different callers.
+"""
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future
+from typing import (
+    Any, Callable, Deque, Dict, Generic, List, Optional, Sequence, Tuple)
+
+import numpy as np
+
+from forte.common.exception import (
+    ProcessExecutionException, ProcessFlowException)
+from forte.data.base_pack import PackType
+from forte.data.readers.base_reader import BaseReader
+from forte.data.selector import Selector
+from forte.pipeline_component import PipelineComponent
+from forte.profiler import PipelineProfiler
+from forte.stage_scheduler import _ComponentRunner
+
+__all__ = [
+    "ServingStats",
+    "PipelineServer",
+]
+
+# The seconds to wait for a request when no pack is in the pipeline.
+_POLL_INTERVAL = 0.1
+
+# The request that stops the server.
+_STOP = object()
+
+
+class ServingStats:
+    r"""The statistics of a :class:`PipelineServer`.
+
+    Attributes:
+        num_packs (int): The number of packs returned to the callers.
+        elapsed (float): The seconds since the server is started.
+        latencies (list): The seconds from the submission to the return of
+            the recent packs.
+    """
+
+    def __init__(self, num_packs: int, elapsed: float,
+                 latencies: Sequence[float]):
+        self.num_packs = num_packs
+        self.elapsed = elapsed
+        self.latencies: List[float] = list(latencies)
+
+    @property
+    def throughput(self) -> float:
+        r"""The number of packs returned per second."""
+        if self.elapsed == 0:
+            return 0.0
+        return self.num_packs / self.elapsed
+
+    def latency(self, percentile: float) -> float:
+        r"""The latency at ``percentile`` (between 0 and 100) of the recent
+        packs, in seconds."""
+        if not self.latencies:
+            return 0.0
+        return float(np.percentile(self.latencies, percentile))
+
+    @property
+    def p50(self) -> float:
+        return self.latency(50)
+
+    @property
+    def p99(self) -> float:
+        return self.latency(99)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_packs": self.num_packs,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "latency_p50": self.p50,
+            "latency_p99": self.p99,
+        }
+
+    def __repr__(self):
+        return (f"{self.num_packs} packs, {self.throughput:.1f} packs/s, "
+                f"latency p50 {self.p50 * 1000:.1f}ms, "
+                f"p99 {self.p99 * 1000:.1f}ms")
+
+
+class PipelineServer(Generic[PackType]):
+    r"""Run the components of a pipeline in a background thread over the
+    packs submitted by concurrent callers, each caller gets back its own
+    processed pack. The batch processors collect the packs of different
+    callers until a batch is full, or until the oldest pack in the pipeline
+    has waited for ``max_wait`` seconds, then the batch processors are
+    flushed so that the partial batches are processed. This bounds the
+    latency added by the batching.
+
+    The server is usually created by
+    :meth:`~forte.pipeline.Pipeline.serve`. The server stops after an
+    exception in a component, and the exception is raised to the callers of
+    the packs in the pipeline.
+
+    Args:
+        components (list): The (component, selector) pairs to run, in the
+            pipeline order.
+        max_wait (float): The maximum seconds a pack waits for the batches
+            to be filled.
+        reader (BaseReader, optional): The reader used by
+            :meth:`process_one`.
+        profiler (PipelineProfiler, optional): The profiler to record the
+            statistics of the components.
+        first_index (int): The index of the first component in the profiler.
+        on_close (callable, optional): A function called after the server is
+            closed.
+        max_latencies (int): The number of the recent latencies kept for the
+            statistics.
+    """
+
+    def __init__(self, components: List[Tuple[PipelineComponent, Selector]],
+                 max_wait: float, reader: Optional[BaseReader] = None,
+                 profiler: Optional[PipelineProfiler] = None,
+                 first_index: int = 0,
+                 on_close: Optional[Callable[[], None]] = None,
+                 max_latencies: int = 10000):
+        if max_wait < 0:
+            raise ValueError("The max wait cannot be negative.")
+        self._runners = [
+            _ComponentRunner(component, selector, profiler, first_index + i)
+            for i, (component, selector) in enumerate(components)]
+        self._max_wait = max_wait
+        self._reader = reader
+        self._reader_lock = threading.Lock()
+        self._on_close = on_close
+
+        self._requests: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._error: Optional[str] = None
+
+        # The futures and the submission time of the packs in the pipeline,
+        # keyed by the sequence number of the submission. The packs leave the
+        # pipeline in the submission order.
+        self._pending: Dict[int, Tuple[Future, float]] = {}
+        self._num_submitted = 0
+        self._num_packs = 0
+        self._latencies: Deque[float] = deque(maxlen=max_latencies)
+        self._start_time = time.perf_counter()
+
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def submit(self, pack: PackType) -> Future:
+        r"""Submit a pack to be processed.
+
+        Args:
+            pack: The pack to be processed.
+
+        Returns:
+            A :class:`~concurrent.futures.Future` of the processed pack.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._error is not None:
+                raise ProcessExecutionException(
+                    f"The server is stopped by an exception:\n{self._error}")
+            if self._closed:
+                raise ProcessFlowException("The server is closed.")
+            self._requests.put((pack, future, time.perf_counter()))
+        return future
+
+    def process(self, pack: PackType,
+                timeout: Optional[float] = None) -> PackType:
+        r"""Process a pack and wait for the result.
+
+        Args:
+            pack: The pack to be processed.
+            timeout (float, optional): The maximum seconds to wait.
+
+        Returns:
+            The processed pack.
+        """
+        return self.submit(pack).result(timeout)
+
+    def process_one(self, *args, **kwargs) -> PackType:
+        r"""Read the first pack from the reader of the pipeline with the
+        arguments, like :meth:`~forte.pipeline.Pipeline.process_one`, and
+        process it.
+        """
+        if self._reader is None:
+            raise ProcessFlowException("The server has no reader.")
+        with self._reader_lock:
+            pack = next(iter(self._reader.iter(*args, **kwargs)), None)
+        if pack is None:
+            raise ValueError("Input data source contains no packs.")
+        return self.process(pack)
+
+    def stats(self) -> ServingStats:
+        r"""The statistics since the server is started."""
+        with self._lock:
+            return ServingStats(
+                self._num_packs, time.perf_counter() - self._start_time,
+                self._latencies)
+
+    def close(self):
+        r"""Process the remaining packs and stop the server."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(_STOP)
+        self._thread.join()
+        if self._on_close is not None:
+            self._on_close()
+
+    def __enter__(self) -> "PipelineServer[PackType]":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _feed(self, pack: PackType) -> List[Any]:
+        items: List[Any] = [(pack, None)]
+        for runner in self._runners:
+            items = [o for i in items for o in runner.feed(i)]
+        return items
+
+    def _flush(self) -> List[Any]:
+        items: List[Any] = []
+        for runner in self._runners:
+            items = [o for i in items for o in runner.feed(i)]
+            items.extend(runner.flush())
+        return items
+
+    def _finish(self, items: List[Any]):
+        now = time.perf_counter()
+        finished = []
+        with self._lock:
+            for pack, _ in items:
+                future, start = self._pending.pop(next(iter(self._pending)))
+                self._num_packs += 1
+                self._latencies.append(now - start)
+                finished.append((future, pack))
+        # The callbacks of the futures may submit packs, so they are called
+        # out of the lock.
+        for future, pack in finished:
+            future.set_result(pack)
+
+    def _deadline(self) -> Optional[float]:
+        if not self._pending:
+            return None
+        _, start = next(iter(self._pending.values()))
+        return start + self._max_wait
+
+    def _serve(self):
+        # pylint: disable=broad-except
+        try:
+            while True:
+                deadline = self._deadline()
+                timeout = (_POLL_INTERVAL if deadline is None
+                           else max(deadline - time.perf_counter(), 0))
+                try:
+                    request = self._requests.get(timeout=timeout)
+                except queue.Empty:
+                    request = None
+
+                if request is _STOP:
+                    if self._pending:
+                        self._finish(self._flush())
+                    return
+
+                if request is not None:
+                    pack, future, start = request
+                    self._pending[self._num_submitted] = (future, start)
+                    self._num_submitted += 1
+                    self._finish(self._feed(pack))
+
+                deadline = self._deadline()
+                if deadline is not None and time.perf_counter() >= deadline:
+                    self._finish(self._flush())
+        except Exception:
+            self._fail(traceback.format_exc())
+
+    def _fail(self, error: str):
+        with self._lock:
+            self._error = error
+            failed = [future for future, _ in self._pending.values()]
+            self._pending.clear()
+            while True:
+                try:
+                    request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is not _STOP:
+                    failed.append(request[1])
+        for future in failed:
+            future.set_exception(ProcessExecutionException(
+                f"Exception occurred in the server:\n{error}"))
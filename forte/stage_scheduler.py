@@ -0,0 +1,351 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A scheduler that runs the stages of a pipeline concurrently, each in its own
+thread, connected by bounded queues.
+"""
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+from forte.common.exception import ProcessExecutionException
+from forte.data.base_pack import PackType
+from forte.data.caster import Caster
+from forte.data.selector import Selector
+from forte.evaluation.base.base_evaluator import Evaluator
+from forte.pipeline_component import PipelineComponent
+from forte.processors.base.base_processor import BaseProcessor
+from forte.processors.base.batch_processor import BaseBatchProcessor
+from forte.profiler import PipelineProfiler
+
+__all__ = [
+    "StageStats",
+    "StageScheduler",
+]
+
+# The seconds to wait on a full or empty queue before checking whether the
+# run is stopped.
+_POLL_INTERVAL = 0.1
+
+# The item that marks the end of the input.
+_END = object()
+
+# A pack and its gold copy (if any evaluator needs it).
+_Item = Tuple[Any, Optional[Any]]
+
+
+class StageStats:
+    r"""The statistics of a stage of the :class:`StageScheduler`.
+
+    Attributes:
+        name (str): The name of the stage.
+        num_packs (int): The number of packs that have left the stage.
+        busy_time (float): The seconds spent in the components of the stage.
+        queue_depth (int): The number of packs waiting in the input queue of
+            the stage.
+        max_queue_depth (int): The maximum number of waiting packs observed
+            in the input queue.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.num_packs: int = 0
+        self.busy_time: float = 0.0
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+
+    @property
+    def throughput(self) -> float:
+        r"""The number of packs processed per busy second."""
+        if self.busy_time == 0:
+            return 0.0
+        return self.num_packs / self.busy_time
+
+    def __repr__(self):
+        return (f"{self.name}: {self.num_packs} packs, "
+                f"{self.throughput:.1f} packs/s, "
+                f"queue depth {self.queue_depth} "
+                f"(max {self.max_queue_depth})")
+
+
+class _ComponentRunner:
+    r"""Run one component on the packs of a stage, and keep the packs that
+    are not finished by a batch processor."""
+
+    def __init__(self, component: PipelineComponent, selector: Selector,
+                 profiler: Optional[PipelineProfiler], index: int):
+        self.component = component
+        self.selector = selector
+        self.waiting: Deque[_Item] = deque()
+        # The number of packs selected from each waiting item, all of them
+        # went into the pool of the batcher.
+        self.num_selected: Deque[int] = deque()
+        self.profiler = profiler
+        self.index = index
+
+    def feed(self, item: _Item) -> List[_Item]:
+        if self.profiler is None:
+            return self._feed(item)
+
+        start = time.perf_counter()
+        done = self._feed(item)
+        self.profiler.record_call(
+            self.index, 1, time.perf_counter() - start)
+        for pack, _ in done:
+            self.profiler.record_out(self.index, pack)
+        return done
+
+    def flush(self) -> List[_Item]:
+        start = time.perf_counter()
+        self.component.flush()
+        done = list(self.waiting)
+        self.clear()
+        if self.profiler is not None:
+            self.profiler.record_call(
+                self.index, 0, time.perf_counter() - start)
+            for pack, _ in done:
+                self.profiler.record_out(self.index, pack)
+        return done
+
+    def clear(self):
+        self.waiting.clear()
+        self.num_selected.clear()
+
+    def _feed(self, item: _Item) -> List[_Item]:
+        pack, gold = item
+        component = self.component
+        num_selected = 0
+        for selected in self.selector.select(pack):
+            num_selected += 1
+            if isinstance(component, Caster):
+                item = (component.cast(selected), gold)
+            elif isinstance(component, BaseProcessor):
+                component.process(selected)
+            elif isinstance(component, Evaluator):
+                component.consume_next(selected, gold)
+            selected.add_all_remaining_entries()
+
+        if not isinstance(component, BaseBatchProcessor):
+            return [item]
+
+        # The pool of the batcher keeps the last selected packs that are not
+        # finished, an item is done when all its selected packs have left the
+        # pool. The items without any selected pack wait for the items before
+        # them to keep the order.
+        self.waiting.append(item)
+        self.num_selected.append(num_selected)
+        num_finished = sum(self.num_selected) - len(
+            component.batcher.data_pack_pool)
+        done = []
+        while self.waiting and self.num_selected[0] <= num_finished:
+            num_finished -= self.num_selected.popleft()
+            done.append(self.waiting.popleft())
+        return done
+
+
+class _Stage:
+    def __init__(self, name: str, runners: List[_ComponentRunner],
+                 queue_size: int):
+        self.runners = runners
+        self.in_queue: queue.Queue = queue.Queue(queue_size)
+        self.stats = StageStats(name)
+
+    def process(self, item: Any) -> List[Any]:
+        start = time.perf_counter()
+        if item is _END:
+            items: List[Any] = []
+            for runner in self.runners:
+                items = [o for i in items for o in runner.feed(i)]
+                items.extend(runner.flush())
+            items.append(_END)
+        else:
+            items = [item]
+            for runner in self.runners:
+                items = [o for i in items for o in runner.feed(i)]
+        self.stats.busy_time += time.perf_counter() - start
+        self.stats.num_packs += sum(1 for i in items if i is not _END)
+        return items
+
+
+class StageScheduler:
+    r"""A scheduler that runs each stage (a component or a group of
+    components) of a pipeline in its own thread, the reader runs in a thread
+    as well. The stages are connected by bounded queues, so that a slow stage
+    blocks the stages before it instead of letting the packs pile up. The
+    packs go through each stage in the input order, so the output order is
+    preserved.
+
+    This works best when the components release the GIL, e.g. the models on
+    GPU and the I/O of the readers and writers. The CPU bound processors can
+    be run by worker processes, see
+    :class:`~forte.process_pool.PackProcessPool`.
+
+    Args:
+        stages (list): The stages, each is a tuple of the stage name and the
+            list of the (component, selector) pairs of the stage.
+        queue_size (int): The maximum number of packs waiting before each
+            stage.
+        copy_gold (callable, optional): The function to copy the input packs
+            for the evaluators, if any.
+        profiler (PipelineProfiler, optional): The profiler to record the
+            statistics of the components.
+        first_index (int): The index of the first component in the profiler.
+    """
+
+    def __init__(self,
+                 stages: List[Tuple[str, List[Tuple[PipelineComponent,
+                                                    Selector]]]],
+                 queue_size: int,
+                 copy_gold: Optional[Callable[[Any], Any]] = None,
+                 profiler: Optional[PipelineProfiler] = None,
+                 first_index: int = 0):
+        if queue_size < 1:
+            raise ValueError("The queue size must be positive.")
+        self._stages: List[_Stage] = []
+        index = first_index
+        for name, group in stages:
+            runners = []
+            for component, selector in group:
+                runners.append(
+                    _ComponentRunner(component, selector, profiler, index))
+                index += 1
+            self._stages.append(_Stage(name, runners, queue_size))
+        self._out_queue: queue.Queue = queue.Queue(queue_size)
+        self._copy_gold = copy_gold
+        self._stop = threading.Event()
+        self._errors: List[str] = []
+
+    def stats(self) -> List[StageStats]:
+        r"""The statistics of the stages, in the pipeline order."""
+        for stage in self._stages:
+            stage.stats.queue_depth = stage.in_queue.qsize()
+        return [stage.stats for stage in self._stages]
+
+    def _put(self, target: queue.Queue, item: Any,
+             stats: Optional[StageStats] = None) -> bool:
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            if stats is not None:
+                stats.max_queue_depth = max(
+                    stats.max_queue_depth, target.qsize())
+            return True
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _next_queue(self, index: int) -> Tuple[queue.Queue,
+                                                Optional[StageStats]]:
+        if index < len(self._stages):
+            stage = self._stages[index]
+            return stage.in_queue, stage.stats
+        return self._out_queue, None
+
+    def _read(self, data_iter: Iterator[PackType],
+              gold_packs: Optional[Deque[PackType]]):
+        target, stats = self._next_queue(0)
+        # pylint: disable=broad-except
+        try:
+            for pack in data_iter:
+                gold = None
+                if gold_packs is not None:
+                    gold = gold_packs.popleft()
+                elif self._copy_gold is not None:
+                    gold = self._copy_gold(pack)
+                if not self._put(target, (pack, gold), stats):
+                    return
+        except Exception:
+            self._fail(traceback.format_exc())
+            return
+        self._put(target, _END, stats)
+
+    def _run_stage(self, index: int):
+        stage = self._stages[index]
+        target, stats = self._next_queue(index + 1)
+        # pylint: disable=broad-except
+        while True:
+            item = self._get(stage.in_queue)
+            if self._stop.is_set():
+                return
+            try:
+                outputs = stage.process(item)
+            except Exception:
+                self._fail(
+                    f"Exception occurred in the stage {stage.stats.name}:\n"
+                    f"{traceback.format_exc()}")
+                return
+            for output in outputs:
+                if not self._put(target, output, stats):
+                    return
+            if item is _END:
+                return
+
+    def _fail(self, error: str):
+        self._errors.append(error)
+        self._stop.set()
+
+    def run(self, data_iter: Iterator[PackType],
+            gold_packs: Optional[Deque[PackType]] = None
+            ) -> Iterator[PackType]:
+        r"""Run the stages over the packs.
+
+        Args:
+            data_iter (iterator): The input packs.
+            gold_packs (deque, optional): The gold copies of the input packs
+                taken beforehand, in the same order as the packs.
+
+        Returns:
+            An iterator of the processed packs, in the input order.
+        """
+        self._stop.clear()
+        self._errors.clear()
+        threads = [threading.Thread(
+            target=self._read, args=(data_iter, gold_packs), daemon=True)]
+        threads.extend(
+            threading.Thread(target=self._run_stage, args=(i,), daemon=True)
+            for i in range(len(self._stages)))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(self._out_queue)
+                if self._errors:
+                    raise ProcessExecutionException(self._errors[0])
+                if item is _END:
+                    break
+                yield item[0]
+        finally:
+            # Stop the threads, e.g. when the caller stops iterating early.
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            for stage in self._stages:
+                for runner in stage.runners:
+                    runner.clear()
+                with stage.in_queue.mutex:
+                    stage.in_queue.queue.clear()
+            with self._out_queue.mutex:
+                self._out_queue.queue.clear()
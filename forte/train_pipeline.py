@@ -103,19 +103,21 @@ class TrainPipeline:
         validation_result = {"epoch": epoch}
 
         if self.predictor is not None:
+            self.evaluator.reset()
             for pack in self.dev_reader.iter(
                     self.configs.config_data.val_path):
-                predicted_pack = pack.view()
-                self.predictor.process(predicted_pack)
-                self.evaluator.consume_next(predicted_pack, pack)
+                gold_pack = pack.snapshot(self.evaluator.gold_entry_types())
+                self.predictor.process(pack)
+                self.evaluator.consume_next(pack, gold_pack)
             validation_result["eval"] = self.evaluator.get_result()
 
         if self.evaluator is not None:
+            self.evaluator.reset()
             for pack in self.dev_reader.iter(
                     self.configs.config_data.test_path):
-                predicted_pack = pack.view()
-                self.predictor.process(predicted_pack)
-                self.evaluator.consume_next(predicted_pack, pack)
+                gold_pack = pack.snapshot(self.evaluator.gold_entry_types())
+                self.predictor.process(pack)
+                self.evaluator.consume_next(pack, gold_pack)
             validation_result["test"] = self.evaluator.get_result()
 
         return validation_result
@@ -32,7 +32,8 @@ def create(args_):
     merged_path = normalize_path(args_.merged_path)
     leient_prefix = args_.lenient_prefix
 
-    generator = OntologyCodeGenerator(spec_paths, args_.gen_all)
+    generator = OntologyCodeGenerator(spec_paths, args_.gen_all,
+                                      args_.use_slots)
     if args_.no_dry_run is None:
         log.info("Ontology will be generated in a temporary directory as "
                  "--no_dry_run is not specified by the user.")
@@ -154,6 +155,14 @@ def main():
                                action='store_true',
                                help='If True, will not enforce prefix check.')
 
+    create_parser.add_argument('--use_slots',
+                               required=False,
+                               default=False,
+                               action='store_true',
+                               help='If True, will declare the attributes of '
+                                    'the generated classes in `__slots__` to '
+                                    'save memory.')
+
     create_parser.set_defaults(func=create)
 
     # Parsing for cleaning.
@@ -0,0 +1,192 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the columnar annotation store of data packs.
+"""
+import os
+import pickle
+import unittest
+
+import numpy as np
+
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
+from forte.data.readers import OntonotesReader
+from forte.pipeline import Pipeline
+from ft.onto.base_ontology import Token, Sentence, EntityMention
+
+
+def copy_to_columnar(pack: DataPack) -> DataPack:
+    columnar_pack = DataPack(columnar=True)
+    columnar_pack.set_text(pack.text)
+    for a in pack.annotations:
+        if isinstance(a, Token):
+            Token(columnar_pack, a.begin, a.end).pos = a.pos
+        elif isinstance(a, EntityMention):
+            EntityMention(columnar_pack, a.begin, a.end).ner_type = a.ner_type
+        else:
+            type(a)(columnar_pack, a.begin, a.end)  # type: ignore
+    columnar_pack.add_all_remaining_entries()
+    return columnar_pack
+
+
+def sentence_summary(pack: DataPack):
+    summary = []
+    for sent in pack.get(Sentence):
+        summary.append((
+            sent.text,
+            [(t.text, t.pos) for t in pack.get(Token, sent)],
+            [(e.text, e.ner_type) for e in pack.get(EntityMention, sent)],
+        ))
+    return summary
+
+
+class AnnotationStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        file_dir_path = os.path.dirname(__file__)
+        data_path = os.path.join(file_dir_path, os.pardir, os.pardir,
+                                 'test_data', 'ontonotes')
+
+        pipeline: Pipeline = Pipeline()
+        pipeline.set_reader(OntonotesReader())
+        pipeline.initialize()
+        self.data_pack: DataPack = pipeline.process_one(data_path)
+        self.columnar_pack: DataPack = copy_to_columnar(self.data_pack)
+
+    def test_get(self):
+        self.assertTrue(self.columnar_pack.columnar)
+        self.assertEqual(len(self.columnar_pack.annotations),
+                         len(self.data_pack.annotations))
+        self.assertEqual(sentence_summary(self.columnar_pack),
+                         sentence_summary(self.data_pack))
+        self.assertEqual(
+            [(type(a), a.text) for a in self.columnar_pack.annotations],
+            [(type(a), a.text) for a in self.data_pack.annotations])
+
+    def test_lazy_deserialization(self):
+        pack: DataPack = deserialize(self.columnar_pack.serialize())
+        self.assertTrue(pack.columnar)
+        self.assertEqual(pack.annotations.num_materialized, 0)
+
+        sentences = list(pack.get(Sentence))
+        self.assertEqual(pack.annotations.num_materialized, len(sentences))
+
+        self.assertEqual(sentence_summary(pack),
+                         sentence_summary(self.data_pack))
+
+        sentences = list(self.data_pack.get(Sentence))
+        self.assertEqual(
+            [[t.text for t in tokens] for tokens in pack.get_in_ranges(
+                Token, [s.span for s in sentences])],
+            [[t.text for t in tokens] for tokens in
+             self.data_pack.get_in_ranges(Token, sentences)])
+
+        # The modifications on the materialized objects are kept.
+        token: Token = pack.get_single(Token)
+        token.pos = "TEST"
+        pack = deserialize(pack.serialize())
+        self.assertEqual(pack.get_single(Token).pos, "TEST")
+
+    def test_get_data(self):
+        request = {
+            Token: ["pos"],
+            EntityMention: {"fields": ["ner_type"], "unit": "Token"},
+        }
+        pack: DataPack = deserialize(self.columnar_pack.serialize())
+        expected = list(self.data_pack.get_data(Sentence, request))
+        actual = list(pack.get_data(Sentence, request))
+
+        self.assertEqual(len(expected), len(actual))
+        for e, a in zip(expected, actual):
+            self.assertEqual(e["context"], a["context"])
+            for entry_type in ("Token", "EntityMention"):
+                for field, value in e[entry_type].items():
+                    if field == "tid":
+                        continue
+                    self.assertTrue(
+                        np.array_equal(value, a[entry_type][field]))
+
+    def test_delete_entry(self):
+        pack: DataPack = deserialize(self.columnar_pack.serialize())
+        sentences = list(pack.get(Sentence))
+        pack.delete_entry(sentences[0])
+        self.assertEqual(len(list(pack.get(Sentence))), len(sentences) - 1)
+        self.assertEqual(len(list(pack.get_data(Sentence))),
+                         len(sentences) - 1)
+
+    def test_fork(self):
+        pack: DataPack = deserialize(self.columnar_pack.serialize())
+        num_tokens = len(pack.get_ids_by_type(Token))
+        first: Token = pack.get_single(Token)
+        first.pos = "BEFORE"
+
+        fork = pack.fork()
+        self.assertTrue(fork.columnar)
+        self.assertEqual(fork.annotations.num_materialized, 0)
+
+        # The field values stored in the shared columns are not shared.
+        last_tid = max(pack.get_ids_by_type(Token))
+        fork.get_entry(last_tid).ud_features["key"] = "FORK"
+        self.assertEqual(pack.get_entry(last_tid).ud_features, {})
+        self.assertEqual(sentence_summary(fork), sentence_summary(pack))
+
+        # The modifications of the objects are not shared.
+        fork_first: Token = fork.get_entry(first.tid)
+        self.assertEqual(fork_first.pos, "BEFORE")
+        fork_first.pos = "FORK"
+        fork_first.ud_features["key"] = "FORK"
+        first.pos = "SOURCE"
+        self.assertEqual(pack.get_entry(first.tid).ud_features, {})
+        self.assertEqual(fork.get_single(Token).pos, "FORK")
+
+        # The columns are copied when either pack adds or deletes entries.
+        Token(fork, 0, 1)
+        fork.add_all_remaining_entries()
+        sentences = list(pack.get(Sentence))
+        pack.delete_entry(sentences[0])
+        self.assertEqual(len(list(pack.get(Token))), num_tokens)
+        self.assertEqual(len(list(fork.get(Token))), num_tokens + 1)
+        self.assertEqual(len(list(fork.get(Sentence))), len(sentences))
+
+        # The fork of a fork, keeping only the sentences.
+        sentence_fork = fork.fork([Sentence])
+        self.assertEqual(len(list(sentence_fork.get(Token))), 0)
+        self.assertEqual([s.text for s in sentence_fork.get(Sentence)],
+                         [s.text for s in fork.get(Sentence)])
+        self.assertEqual(
+            deserialize(sentence_fork.serialize()).get_single(Sentence).text,
+            sentences[0].text)
+
+    def test_set_span(self):
+        for pack in (self.columnar_pack, self.data_pack):
+            pack = deserialize(pack.serialize())
+            last: Token = list(pack.get(Token))[-1]
+            last.set_span(0, 1)
+
+            for result in (pack, pickle.loads(pickle.dumps(pack)),
+                           pack.fork(), deserialize(pack.serialize())):
+                tokens = list(result.get(Token))
+                self.assertEqual((tokens[0].begin, tokens[0].end), (0, 1))
+                self.assertEqual(tokens[0].tid, last.tid)
+                self.assertEqual(
+                    [t.span for t in tokens], sorted(t.span for t in tokens))
+                first_sentence = next(iter(result.get(Sentence)))
+                self.assertIn(
+                    last.tid,
+                    [t.tid for t in result.get(Token, first_sentence)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the binary serialization format.
+"""
+import json
+import os
+import unittest
+
+from forte.data.binary_io import (
+    deserialize_binary, is_binary, serialize_binary)
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize, serialize
+from forte.data.multi_pack import MultiPack
+from forte.data.readers import OntonotesReader
+from forte.pipeline import Pipeline
+from ft.onto.base_ontology import (
+    Token, Sentence, PredicateLink, CoreferenceGroup, CrossDocEntityRelation,
+    EntityMention)
+
+
+class BinaryIOTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        file_dir_path = os.path.dirname(__file__)
+        data_path = os.path.join(file_dir_path, os.pardir, os.pardir,
+                                 'test_data', 'ontonotes')
+
+        pipeline: Pipeline = Pipeline()
+        pipeline.set_reader(OntonotesReader())
+        pipeline.initialize()
+        self.data_pack: DataPack = pipeline.process_one(data_path)
+
+    def test_data_pack(self):
+        data = serialize(self.data_pack, serialize_method="binary")
+        self.assertTrue(is_binary(data))
+        self.assertFalse(is_binary(self.data_pack.serialize()))
+
+        pack: DataPack = deserialize(data)
+        self.assertEqual(json.loads(pack.serialize()),
+                         json.loads(self.data_pack.serialize()))
+        self.assertEqual([a.tid for a in pack.annotations],
+                         [a.tid for a in self.data_pack.annotations])
+
+        for sent in pack.get(Sentence):
+            for token in pack.get(Token, sent):
+                self.assertEqual(token.pack, pack)
+        self.assertEqual(
+            [(link.get_parent().text, link.get_child().text)
+             for link in pack.get(PredicateLink)],
+            [(link.get_parent().text, link.get_child().text)
+             for link in self.data_pack.get(PredicateLink)])
+        self.assertEqual(
+            [sorted(m.text for m in group.get_members())
+             for group in pack.get(CoreferenceGroup)],
+            [sorted(m.text for m in group.get_members())
+             for group in self.data_pack.get(CoreferenceGroup)])
+
+    def test_columnar_pack(self):
+        columnar_pack = DataPack(columnar=True)
+        columnar_pack.set_text(self.data_pack.text)
+        for token in self.data_pack.get(Token):
+            Token(columnar_pack, token.begin, token.end).pos = token.pos
+        columnar_pack.add_all_remaining_entries()
+
+        pack: DataPack = deserialize_binary(serialize_binary(columnar_pack))
+        self.assertTrue(pack.columnar)
+        self.assertEqual(pack.annotations.num_materialized, 0)
+        self.assertEqual(
+            [(t.text, t.pos) for t in pack.get(Token)],
+            [(t.text, t.pos) for t in self.data_pack.get(Token)])
+
+        pack = deserialize_binary(serialize_binary(columnar_pack),
+                                  entry_types=[])
+        self.assertEqual(len(pack.annotations), 0)
+        self.assertEqual(
+            [(t.text, t.pos) for t in pack.get(Token)],
+            [(t.text, t.pos) for t in self.data_pack.get(Token)])
+
+    def test_lazy_entries(self):
+        data = serialize_binary(self.data_pack)
+        expected = json.loads(self.data_pack.serialize())
+        pack: DataPack = deserialize(data, entry_types=[Sentence])
+        self.assertEqual(len(pack.annotations),
+                         len(list(self.data_pack.get(Sentence))))
+        # The ids of the encoded entries are known before decoding.
+        self.assertEqual(pack.get_ids_by_type(Token),
+                         self.data_pack.get_ids_by_type(Token))
+
+        self.assertEqual([t.text for t in pack.get(Token)],
+                         [t.text for t in self.data_pack.get(Token)])
+        self.assertNotIn(
+            PredicateLink, {type(e) for e in pack.links})
+
+        # The parent of the link is decoded when looked up by id.
+        link: PredicateLink = self.data_pack.get_single(PredicateLink)
+        lazy_link = pack.get_entry(link.tid)
+        self.assertEqual(lazy_link.get_parent().text,
+                         link.get_parent().text)
+
+        # The blocks not decoded are written back as they are.
+        pack = deserialize(data, entry_types=[])
+        self.assertEqual(json.loads(
+            deserialize(serialize_binary(pack)).serialize()), expected)
+        self.assertEqual(json.loads(pack.serialize()), expected)
+
+    def test_multi_pack(self):
+        multi_pack = MultiPack()
+        multi_pack.add_pack_(self.data_pack, 'default')
+        mentions = list(self.data_pack.get(EntityMention))
+        link = CrossDocEntityRelation(multi_pack, mentions[0], mentions[1])
+        link.rel_type = 'coreference'
+        multi_pack.add_entry(link)
+
+        pack: MultiPack = deserialize(serialize_binary(multi_pack))
+        self.assertEqual(json.loads(pack.serialize()),
+                         json.loads(multi_pack.serialize()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,11 +20,14 @@ import unittest
 from typing import List, Tuple
 
 from forte.data.data_pack import DataPack
+from forte.data.data_utils_io import batch_instances, slice_columnar_data
+from forte.data.ontology.top import Annotation
+from forte.data.span import Span
 from forte.pipeline import Pipeline
 from forte.utils import utils
 from ft.onto.base_ontology import (
     Token, Sentence, Document, EntityMention, PredicateArgument, PredicateLink,
-    PredicateMention, CoreferenceGroup)
+    PredicateMention, CoreferenceGroup, Utterance)
 from forte.data.readers import OntonotesReader
 
 logging.basicConfig(level=logging.DEBUG)
@@ -90,6 +93,44 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(len(instances[0]["Token"]), 5)
         self.assertEqual(len(instances[0]["EntityMention"]), 3)
 
+        # case 6: context fields of dict values are returned as they are
+        sentence = list(self.data_pack.get(Sentence))[0]
+        sentence.sentiment = {"positive": 1.0}
+        instances = list(self.data_pack.get_data(
+            Sentence, request={Sentence: ["sentiment"], Token: []}))
+        self.assertEqual(instances[0]["sentiment"], {"positive": 1.0})
+        self.assertNotIn("row_splits", instances[0]["Token"])
+
+    def test_get_columnar_data(self):
+        requests = {
+            Token: ["pos"],
+            EntityMention: ["ner_type"],
+            PredicateMention: [],
+            PredicateArgument: {
+                "fields": [],
+                "unit": "Token"
+            },
+            PredicateLink: ["arg_type"],
+        }
+        instances = list(self.data_pack.get_data(Sentence, requests))
+        data = self.data_pack.get_columnar_data(Sentence, requests)
+        self.assertEqual(len(data["context"]), len(instances))
+        self.assertEqual(data["Token"]["row_splits"].tolist(),
+                         [0, 27, 39])
+
+        expected = batch_instances(instances[1:])
+        batch = slice_columnar_data(data, 1, len(instances))
+        self.assertEqual(batch.keys(), expected.keys())
+        for key, value in expected.items():
+            if not isinstance(value, dict):
+                self.assertEqual(batch[key], value)
+                continue
+            self.assertEqual(batch[key].keys(), value.keys())
+            for field, arrays in value.items():
+                self.assertEqual(
+                    [a.tolist() for a in batch[key][field]],
+                    [a.tolist() for a in arrays])
+
     def test_get_entries(self):
         # case 1: test get annotation
         sent_texts: List[Tuple[int, str]] = []
@@ -169,6 +210,52 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(groups, [
             ['He', 'The Indonesian billionaire James Riady', 'he']])
 
+    def test_get_in_ranges(self):
+        sentences = list(self.data_pack.get(Sentence))
+        tokens = list(self.data_pack.get(Token))
+
+        # case 1: annotations inside the ranges
+        expected = [[t for t in tokens if sent.begin <= t.begin and
+                     t.end <= sent.end] for sent in sentences]
+        self.assertEqual(
+            self.data_pack.get_in_ranges(Token, sentences), expected)
+        self.assertEqual(
+            [list(self.data_pack.get(Token, sent)) for sent in sentences],
+            expected)
+
+        # case 2: annotations overlapping with the ranges
+        span = Span(tokens[1].begin + 1, tokens[3].end - 1)
+        self.assertEqual(
+            self.data_pack.get_in_ranges(Token, [span], overlap=True),
+            [tokens[1:4]])
+        self.assertEqual(
+            self.data_pack.get_in_ranges(Token, [span]), [tokens[2:3]])
+
+        # case 3: the index is updated with the new annotations
+        token = Token(self.data_pack, tokens[0].begin, tokens[0].end)
+        self.data_pack.add_entry(token)
+        self.assertIn(
+            token.tid, [t.tid for t in self.data_pack.get(
+                Token, sentences[0])])
+        self.data_pack.delete_entry(token)
+        self.assertEqual(list(self.data_pack.get(Token, sentences[0])),
+                         expected[0])
+
+    def test_get_ids_by_type(self):
+        num_annotations = len(self.data_pack.annotations)
+        self.assertEqual(len(self.data_pack.get_ids_by_type(Annotation)),
+                         num_annotations)
+        self.assertEqual(set(self.data_pack.iter_ids_by_type(Annotation)),
+                         self.data_pack.get_ids_by_type(Annotation))
+
+        # A new type added after the lookup is found by the next lookup.
+        self.assertEqual(len(list(self.data_pack.get(Utterance))), 0)
+        utterance = Utterance(self.data_pack, 0, 3)
+        self.data_pack.add_entry(utterance)
+        self.assertEqual(len(self.data_pack.get_ids_by_type(Annotation)),
+                         num_annotations + 1)
+        self.assertEqual(list(self.data_pack.get(Utterance)), [utterance])
+
     def test_delete_entry(self):
         # test delete entry
         sentences = list(self.data_pack.get(Sentence))
@@ -178,6 +265,92 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(len(list(self.data_pack.get_data(Sentence))),
                          num_sent - 1)
 
+    def test_coverage_index(self):
+        def covered_ids(entry_type):
+            return [sorted(e.tid for e in self.data_pack.get(entry_type, s))
+                    for s in self.data_pack.get(Sentence)]
+
+        entry_types = [Token, EntityMention, PredicateLink]
+        expected = [covered_ids(t) for t in entry_types]
+        for entry_type in entry_types:
+            self.data_pack.index.build_coverage_index(
+                self.data_pack, Sentence, entry_type)
+        self.assertEqual([covered_ids(t) for t in entry_types], expected)
+
+        # The index is kept up to date when entries are added and removed.
+        sentence = list(self.data_pack.get(Sentence))[1]
+        token = Token(self.data_pack, sentence.begin, sentence.begin + 2)
+        self.data_pack.add_entry(token)
+        new_sentence = Sentence(self.data_pack, 0, sentence.end)
+        self.data_pack.add_entry(new_sentence)
+        coverage = self.data_pack.index.coverage_index(Sentence, Token)
+        self.assertIsNotNone(coverage)
+        self.assertIn(token.tid, coverage[sentence.tid])
+        self.assertIn(token.tid, coverage[new_sentence.tid])
+
+        self.data_pack.delete_entry(token)
+        self.assertNotIn(token.tid, coverage[sentence.tid])
+        expected = [covered_ids(t) for t in entry_types]
+        self.data_pack.index.deactivate_coverage_index()
+        self.assertEqual([covered_ids(t) for t in entry_types], expected)
+
+    def test_snapshot(self):
+        snapshot = self.data_pack.snapshot([Sentence, Token])
+        self.assertEqual(snapshot.text, self.data_pack.text)
+        self.assertEqual(snapshot.pack_name, self.data_pack.pack_name)
+        for entry_type in (Sentence, Token):
+            self.assertEqual(
+                [(e.tid, e.span) for e in snapshot.get(entry_type)],
+                [(e.tid, e.span) for e in self.data_pack.get(entry_type)])
+        for entry_type in (EntityMention, PredicateLink, CoreferenceGroup):
+            self.assertEqual(len(list(snapshot.get(entry_type))), 0)
+        self.assertEqual(
+            [t.pos for t in snapshot.get(Token, next(snapshot.get(Sentence)))],
+            [t.pos for t in self.data_pack.get(
+                Token, next(self.data_pack.get(Sentence)))])
+
+        # The copied entries are independent of the original ones.
+        token = next(snapshot.get(Token))
+        token.pos = "changed"
+        self.assertNotEqual(next(self.data_pack.get(Token)).pos, "changed")
+        for tids in snapshot.creation_records.values():
+            self.assertTrue(all(
+                isinstance(snapshot.get_entry(tid), (Sentence, Token))
+                for tid in tids))
+
+    def test_add_annotations(self):
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                pack = DataPack(columnar=columnar)
+                pack.set_text("The quick fox. It runs.")
+                pack.set_control_component("tokenizer")
+                tids = pack.add_annotations(
+                    Token, [0, 4, 10, 15, 18], [3, 9, 13, 17, 22],
+                    {"pos": ["DT", "JJ", "NN", "PRP", "VBZ"]})
+                pack.add_annotations(Sentence, [0, 15], [14, 23])
+
+                self.assertEqual(
+                    [(t.tid, t.text, t.pos) for t in pack.get(Token)],
+                    [(tids[0], "The", "DT"), (tids[1], "quick", "JJ"),
+                     (tids[2], "fox", "NN"), (tids[3], "It", "PRP"),
+                     (tids[4], "runs", "VBZ")])
+                self.assertEqual(
+                    [[t.text for t in pack.get(Token, sent)]
+                     for sent in pack.get(Sentence)],
+                    [["The", "quick", "fox"], ["It", "runs"]])
+                self.assertTrue(
+                    set(tids) <= pack.creation_records["tokenizer"])
+                self.assertIn((tids[0], "pos"),
+                              pack.field_records["tokenizer"])
+                self.assertEqual(pack.add_annotations(Token, [], []), [])
+
+                with self.assertRaises(ValueError):
+                    pack.add_annotations(Token, [0, 1], [1])
+                with self.assertRaises(ValueError):
+                    pack.add_annotations(Token, [5], [4])
+                with self.assertRaises(ValueError):
+                    pack.add_annotations(Token, [20], [30])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,12 @@ from typing import Optional, List, Any, Iterator
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology import Generics, MultiPackGeneric, Annotation
-from forte.data.ontology.core import FList, FDict, MpPointer, Pointer
+from forte.data.ontology.core import (
+    FList, FDict, MpPointer, Pointer, set_type_check)
 from forte.data.readers.base_reader import PackReader, MultiPackReader
 from forte.pipeline import Pipeline
 from forte.processors.base import PackProcessor, MultiPackProcessor
-from ft.onto.base_ontology import EntityMention
+from ft.onto.base_ontology import EntityMention, Token
 
 
 @dataclass
@@ -197,6 +198,45 @@ class EntryDataStructure(unittest.TestCase):
             self.assertTrue(isinstance(v, Pointer))
 
 
+class EntryFieldTest(unittest.TestCase):
+    def setUp(self):
+        self.pack: DataPack = DataPack()
+        self.pack.set_text("Some text to test annotations on.")
+
+    def tearDown(self):
+        set_type_check(True)
+
+    def test_field_access(self):
+        self.pack.set_control_component("tagger")
+        token: Token = self.pack.add_entry(Token(self.pack, 0, 4))
+        token.pos = "DT"
+        self.assertEqual(token.pos, "DT")
+        self.assertEqual(token.__dict__['pos'], "DT")
+        self.assertIn((token.tid, 'pos'), self.pack.field_records["tagger"])
+
+        # The embedding is not allocated until it is set.
+        self.assertEqual(len(token.embedding), 0)
+        token.embedding = [0.5, 1.5]
+        self.assertEqual(token.embedding.tolist(), [0.5, 1.5])
+
+        # The default value of the field is given by the class.
+        entry = ExampleEntry(self.pack)
+        self.assertIsNone(entry.secret_number)
+        self.assertNotIn('secret_number', entry.__dict__)
+        entry.regret_creation()
+
+    def test_type_check(self):
+        token: Token = self.pack.add_entry(Token(self.pack, 0, 4))
+        with self.assertRaises(TypeError):
+            token.pos = 1
+        with self.assertRaises(TypeError):
+            token.ud_features = []
+
+        set_type_check(False)
+        token.pos = 1
+        self.assertEqual(token.pos, 1)
+
+
 class NotHashingTest(unittest.TestCase):
     def setUp(self):
         self.pack: DataPack = DataPack()
@@ -0,0 +1,131 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the on-disk index of the NIF contexts.
+"""
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from forte.data.datasets.wikipedia.db_utils import (
+    NIFBufferedContextReader, NIFContextIndex)
+
+NIF = "http://persistence.uni-leipzig.org/nlp2rdf/ontologies/nif-core#"
+
+
+def statement(page: str, predicate: str, value: str) -> str:
+    return (f'<http://dbpedia.org/resource/{page}?dbpv=2016-10&nif=context> '
+            f'<{NIF}{predicate}> "{value}" '
+            f'<http://en.wikipedia.org/wiki/{page}?oldid=1> .\n')
+
+
+# The statements of "A" are split into two runs, and the contexts are not
+# sorted.
+LINES = [
+    statement("C", "isString", "c text"),
+    statement("A", "isString", "a text"),
+    statement("A", "beginIndex", "0"),
+    statement("B", "isString", "b text"),
+    "<http://a.org/s> <http://a.org/p> <http://a.org/o> .\n",
+    statement("A", "endIndex", "6"),
+]
+
+EXPECTED = {
+    "C": [("isString", "c text")],
+    "A": [("isString", "a text"), ("beginIndex", "0"), ("endIndex", "6")],
+    "B": [("isString", "b text")],
+}
+
+
+def context(page: str) -> str:
+    return f"http://en.wikipedia.org/wiki/{page}"
+
+
+def summary(statements):
+    return [(str(v)[len(NIF):], str(o)) for _, v, o in statements]
+
+
+class NIFContextIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.nif_path = os.path.join(self.temp_dir.name, "nif_context.tql")
+        with open(self.nif_path, "w", encoding="utf-8") as f:
+            f.writelines(LINES)
+        self.index_path = os.path.join(
+            self.temp_dir.name, "index", "nif_context.tql.sqlite")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get(self):
+        index = NIFContextIndex(self.nif_path, self.index_path)
+        self.assertTrue(os.path.exists(self.index_path))
+        self.assertFalse(os.path.exists(self.index_path + ".tmp"))
+
+        for page in ("B", "A", "C"):
+            self.assertEqual(
+                summary(index.get(context(page))), EXPECTED[page])
+            for s, _, _ in index.get(context(page)):
+                self.assertEqual(
+                    str(s), f"http://dbpedia.org/resource/{page}"
+                            f"?dbpv=2016-10&nif=context")
+        self.assertEqual(index.get(context("D")), [])
+        index.close()
+
+    def test_get_from_threads(self):
+        index = NIFContextIndex(self.nif_path, self.index_path, cache_size=0)
+        pages = ["A", "B", "C", "D"] * 10
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda page: summary(index.get(context(page))), pages))
+        self.assertEqual(
+            results, [EXPECTED.get(page, []) for page in pages])
+        index.close()
+
+    def test_cache(self):
+        index = NIFContextIndex(self.nif_path, self.index_path, cache_size=2)
+        statements = index.get(context("A"))
+        self.assertIs(index.get(context("A")), statements)
+
+        # The least recently used context is evicted.
+        index.get(context("B"))
+        index.get(context("C"))
+        self.assertIsNot(index.get(context("A")), statements)
+        self.assertEqual(index.get(context("A")), statements)
+        index.close()
+
+    def test_reuse(self):
+        NIFContextIndex(self.nif_path, self.index_path).close()
+
+        # The existing database is used without reading the NIF file.
+        os.remove(self.nif_path)
+        index = NIFContextIndex(self.nif_path, self.index_path)
+        self.assertEqual(summary(index.get(context("A"))), EXPECTED["A"])
+        index.close()
+
+    def test_buffered_reader(self):
+        reader = NIFBufferedContextReader(
+            self.nif_path, index_dir=os.path.dirname(self.index_path))
+        self.assertIsNotNone(reader.index)
+        self.assertTrue(os.path.exists(self.index_path))
+        for page in ("C", "B", "A"):
+            self.assertEqual(
+                summary(reader.get(context(page))), EXPECTED[page])
+        reader.index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the streaming N-Quads parser.
+"""
+import bz2
+import os
+import tempfile
+import unittest
+
+from forte.data.datasets.wikipedia.nquads import open_nquads, parse_nquads
+
+NIF = "http://persistence.uni-leipzig.org/nlp2rdf/ontologies/nif-core#"
+
+LINES = [
+    f'<http://a.org/A?nif=context> <{NIF}isString> '
+    f'"A \\"quoted\\" text\\nwith \\\\ \\u00e9 \\U0001F600"@en-US '
+    f'<http://a.org/wiki/A?oldid=1> .\n',
+    "# A comment line.\n",
+    "\n",
+    f'<http://a.org/A?nif=context> <{NIF}beginIndex> '
+    f'"0"^^<http://www.w3.org/2001/XMLSchema#nonNegativeInteger> '
+    f'<http://a.org/wiki/A?oldid=1> .\n',
+    "_:b0\t<http://a.org/p>\t_:b1.2\t_:g .\n",
+    "<http://a.org/s> <http://a.org/p> <http://a.org/o> .\n",
+]
+
+EXPECTED = [
+    ("http://a.org/A?nif=context", f"{NIF}isString",
+     ('A "quoted" text\nwith \\ é \U0001F600', "en-US", None),
+     "http://a.org/wiki/A?oldid=1"),
+    ("http://a.org/A?nif=context", f"{NIF}beginIndex",
+     ("0", None, "http://www.w3.org/2001/XMLSchema#nonNegativeInteger"),
+     "http://a.org/wiki/A?oldid=1"),
+    ("_:b0", "http://a.org/p", "_:b1.2", "_:g"),
+    ("http://a.org/s", "http://a.org/p", "http://a.org/o", None),
+]
+
+
+class NQuadsTest(unittest.TestCase):
+
+    def test_parse(self):
+        statements = list(parse_nquads(
+            LINES, literal=lambda value, lang, datatype: (
+                value, lang, datatype)))
+        self.assertEqual(statements, EXPECTED)
+
+        # The literal values are plain strings by default.
+        self.assertEqual(next(parse_nquads(LINES))[2], EXPECTED[0][2][0])
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(parse_nquads(LINES[:1] + ["<http://a.org/s> .\n"]))
+        with self.assertRaisesRegex(ValueError, "escape"):
+            list(parse_nquads(['<s> <p> "\\q" .\n']))
+
+    def test_open(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            plain_path = os.path.join(tmp_dir, "test.nq")
+            with open(plain_path, "w", encoding="utf-8") as f:
+                f.writelines(LINES)
+            bz2_path = plain_path + ".bz2"
+            with bz2.open(bz2_path, "wt", encoding="utf-8") as f:
+                f.writelines(LINES)
+
+            for path in (plain_path, bz2_path):
+                with open_nquads(path, buffer_size=16) as lines:
+                    self.assertEqual(len(list(parse_nquads(lines))),
+                                     len(EXPECTED))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,8 @@ import jsonschema
 from ddt import ddt, data
 from testfixtures import LogCapture, log_capture
 
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize, serialize
 from forte.data.ontology import utils
 from forte.data.ontology.code_generation_exceptions import (
     DuplicatedAttributesWarning, DuplicateEntriesWarning,
@@ -88,6 +90,40 @@ class GenerateOntologyTest(unittest.TestCase):
 
             self.assertEqual(generated_code, expected_code)
 
+    def test_slots(self):
+        self.generator = OntologyCodeGenerator(use_slots=True)
+        json_file_path = os.path.join(
+            self.spec_dir, "example_import_ontology.json")
+        folder_path = self.generator.generate(json_file_path, is_dry_run=True)
+        self.dir_path = folder_path
+
+        module_name = "slotted_example_import_ontology"
+        spec = importlib.util.spec_from_file_location(
+            module_name,
+            os.path.join(folder_path, "ft/onto/example_import_ontology.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        self.assertEqual(module.Token.__slots__, ('pos', 'lemma'))
+
+        pack = DataPack()
+        pack.set_text("Slotted tokens.")
+        token = pack.add_entry(module.Token(pack, 0, 7))
+        token.pos = "JJ"
+        self.assertFalse(hasattr(token, '__dict__'))
+        self.assertEqual(token.pos, "JJ")
+        self.assertIsNone(token.lemma)
+        with self.assertRaises(TypeError):
+            token.lemma = 1
+
+        for method in ("jsonpickle", "binary"):
+            recovered = deserialize(serialize(pack, serialize_method=method))
+            recovered_token = recovered.get_single(module.Token)
+            self.assertEqual(recovered_token.pos, "JJ")
+            self.assertEqual(recovered_token.text, "Slotted")
+        del sys.modules[module_name]
+
     def test_dry_run_false(self):
         temp_dir = tempfile.mkdtemp()
         json_file_path = os.path.join(
@@ -15,13 +15,19 @@
 Unit tests for BaseReader.
 """
 
+import os
+import shutil
+import tempfile
+import time
 import unittest
-from typing import List
+from typing import Iterator, List
 
 from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
 from forte.data.readers.plaintext_reader import PlainTextReader
 from forte.processors.base.pack_processor import PackProcessor
 from forte.pipeline import Pipeline
+from ft.onto.base_ontology import Document
 
 
 class DummyPackProcessor(PackProcessor):
@@ -30,6 +36,15 @@ class DummyPackProcessor(PackProcessor):
         pass
 
 
+class SlowTextReader(PlainTextReader):
+    """Parse the files slower for the smaller file names."""
+
+    def _parse_pack(self, file_path: str) -> Iterator[DataPack]:
+        index = int(os.path.basename(file_path).split(".")[0])
+        time.sleep(0.002 * (10 - index % 10))
+        yield from super()._parse_pack(file_path)
+
+
 class BaseReaderTest(unittest.TestCase):
 
     def setUp(self):
@@ -60,6 +75,117 @@ class BaseReaderTest(unittest.TestCase):
         self.assertFalse(self.reader._cache_ready)
         self.assertTrue(len(self.reader._data_packs) == 0)
 
+    def test_binary_cache(self):
+        cache_directory = tempfile.mkdtemp()
+
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(PlainTextReader(
+            cache_directory=cache_directory,
+            cache_serialize_method="binary"))
+        nlp.initialize()
+        parsed_texts = [pack.text
+                        for pack in nlp.process_dataset(self.dataset_path)]
+
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(PlainTextReader(
+            from_cache=True, cache_directory=cache_directory,
+            cache_serialize_method="binary"))
+        nlp.initialize()
+        cached_texts = [pack.text
+                        for pack in nlp.process_dataset(self.dataset_path)]
+
+        self.assertEqual(len(parsed_texts), 3)
+        self.assertEqual(cached_texts, parsed_texts)
+
+        # The entries are decoded on first access.
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(PlainTextReader(
+            from_cache=True, cache_directory=cache_directory,
+            cache_serialize_method="binary"), config={"entry_types": []})
+        nlp.initialize()
+        for pack, text in zip(nlp.process_dataset(self.dataset_path),
+                              parsed_texts):
+            self.assertEqual(len(pack.annotations), 0)
+            self.assertEqual(
+                [d.text for d in pack.get(Document)], [text])
+        shutil.rmtree(cache_directory)
+
+    def test_prefetch(self):
+        data_dir = tempfile.mkdtemp()
+        for i in range(20):
+            with open(os.path.join(data_dir, f"{i}.txt"), "w") as f:
+                f.write(f"file {i}")
+
+        def read_texts(reader: PlainTextReader) -> List[str]:
+            nlp = Pipeline[DataPack]()
+            nlp.set_reader(reader)
+            nlp.initialize()
+            return [pack.text for pack in nlp.process_dataset(data_dir)]
+
+        expected = read_texts(SlowTextReader())
+        self.assertEqual(len(expected), 20)
+        for workers, depth in ((1, None), (4, None), (4, 2), (8, 20)):
+            self.assertEqual(
+                read_texts(SlowTextReader(prefetch_workers=workers,
+                                          prefetch_depth=depth)),
+                expected)
+
+        # Stop iterating early.
+        reader = SlowTextReader(prefetch_workers=4)
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(reader)
+        nlp.initialize()
+        for pack in nlp.process_dataset(data_dir):
+            self.assertEqual(pack.text, expected[0])
+            break
+
+        with self.assertRaises(ValueError):
+            reader.set_prefetch(-1)
+        shutil.rmtree(data_dir)
+
+    def test_prefetch_cache(self):
+        data_dir = tempfile.mkdtemp()
+        for i in range(20):
+            with open(os.path.join(data_dir, f"{i}.txt"), "w") as f:
+                f.write(f"file {i}")
+
+        class SharedCacheReader(PlainTextReader):
+            """Parse the files slower for the earlier ones, all the packs
+            are cached in the same file."""
+
+            def _collect(self, text_directory) -> Iterator[str]:
+                return iter(sorted(
+                    super()._collect(text_directory),
+                    key=lambda path: int(
+                        os.path.basename(path).split(".")[0])))
+
+            def _parse_pack(self, file_path: str) -> Iterator[DataPack]:
+                index = int(os.path.basename(file_path).split(".")[0])
+                time.sleep(0.005 * (20 - index))
+                yield from super()._parse_pack(file_path)
+
+            def _cache_key_function(self, collection) -> str:
+                return "cached_string_file"
+
+        def read_cache(workers: int) -> List[str]:
+            cache_directory = tempfile.mkdtemp()
+            nlp = Pipeline[DataPack]()
+            nlp.set_reader(SharedCacheReader(
+                cache_directory=cache_directory, prefetch_workers=workers))
+            nlp.initialize()
+            for _ in nlp.process_dataset(data_dir):
+                pass
+            with open(os.path.join(
+                    cache_directory, "cached_string_file")) as f:
+                texts = [deserialize(line).text for line in f]
+            shutil.rmtree(cache_directory)
+            return texts
+
+        # The shared cache file is written in the order of the collections.
+        expected = read_cache(0)
+        self.assertEqual(read_cache(4), expected)
+        shutil.rmtree(data_dir)
+
 
 if __name__ == '__main__':
     unittest.main()
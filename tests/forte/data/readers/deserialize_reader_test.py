@@ -17,6 +17,7 @@ Unit tests for Deserialize Reader.
 import unittest
 
 from forte.data.data_pack import DataPack
+from forte.data.data_utils import serialize
 from forte.data.readers import StringReader, RawDataDeserializeReader
 from forte.pipeline import Pipeline
 
@@ -41,6 +42,18 @@ class DeserializeReaderPipelineTest(unittest.TestCase):
                     [pack.serialize()]):
                 self.assertEqual(pack.text, new_pack.text)
 
+    def test_binary_deserialize(self):
+        another_pipeline = Pipeline[DataPack]()
+        another_pipeline.set_reader(RawDataDeserializeReader())
+        another_pipeline.initialize()
+
+        data = ["Testing Reader", "Testing Deserializer"]
+
+        for pack in self.nlp.process_dataset(data):
+            for new_pack in another_pipeline.process_dataset(
+                    [serialize(pack, serialize_method="binary")]):
+                self.assertEqual(pack.text, new_pack.text)
+
 
 if __name__ == '__main__':
     unittest.main()
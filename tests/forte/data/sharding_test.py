@@ -0,0 +1,149 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the sharding of the DBpedia NIF dumps.
+"""
+import bz2
+import os
+import tempfile
+import unittest
+
+from ddt import ddt, data
+
+from forte.data.datasets.wikipedia.db_utils import (
+    ContextGroupedNIFReader, strip_url_params)
+from forte.data.datasets.wikipedia.dbpedia_infobox_reader import read_index
+from forte.data.datasets.wikipedia.nquads import statement_graph
+from forte.data.datasets.wikipedia.sharding import (
+    merge_pack_indices, shard_nif_file, shard_of, shard_paths)
+
+NUM_SHARDS = 3
+
+
+def statement(page: str, value: str) -> str:
+    return (f'<http://dbpedia.org/resource/{page}?nif=context> '
+            f'<http://a.org/p> "{value}" '
+            f'<http://en.wikipedia.org/wiki/{page}?oldid=1> .\n')
+
+
+LINES = [statement(f"Page_{i % 7}", str(i)) for i in range(20)]
+
+
+@ddt
+class ShardingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.shard_dir = os.path.join(self.temp_dir.name, "shards")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_nif(self, name: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        content = "".join(LINES).encode("utf-8")
+        if name.endswith(".bz2"):
+            content = bz2.compress(content)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_shard_of(self):
+        self.assertEqual(shard_of(None, NUM_SHARDS), 0)
+        context = "http://en.wikipedia.org/wiki/A"
+        shard = shard_of(context, NUM_SHARDS)
+        self.assertTrue(0 <= shard < NUM_SHARDS)
+        # The URL parameters are not considered.
+        self.assertEqual(shard_of(context + "?oldid=1", NUM_SHARDS), shard)
+        self.assertEqual(shard_of(context, 1), 0)
+
+        # The contexts are spread over the shards.
+        shards = {shard_of(f"http://en.wikipedia.org/wiki/Page_{i}",
+                           NUM_SHARDS) for i in range(100)}
+        self.assertEqual(shards, set(range(NUM_SHARDS)))
+
+    @data("nif_context.tql", "nif_context.tql.bz2")
+    def test_shard_nif_file(self, name):
+        paths = shard_nif_file(
+            self.write_nif(name), self.shard_dir, NUM_SHARDS)
+        self.assertEqual(
+            paths, shard_paths(name, self.shard_dir, NUM_SHARDS))
+        self.assertEqual(
+            [os.path.basename(p) for p in paths],
+            [f"nif_context.tql-{i:05d}-of-00003" for i in range(NUM_SHARDS)])
+        self.assertEqual(sorted(os.listdir(self.shard_dir)),
+                         [os.path.basename(p) for p in paths])
+
+        # Each statement is in the shard of its context, in the input order.
+        for i, path in enumerate(paths):
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.readlines(), [
+                    line for line in LINES
+                    if shard_of(statement_graph(line), NUM_SHARDS) == i])
+
+    def test_reuse_shards(self):
+        nif_path = self.write_nif("nif_context.tql")
+        paths = shard_nif_file(nif_path, self.shard_dir, NUM_SHARDS)
+
+        # The existing shards are not split again.
+        os.remove(nif_path)
+        self.assertEqual(
+            shard_nif_file(nif_path, self.shard_dir, NUM_SHARDS), paths)
+
+    def test_merge_pack_indices(self):
+        output_dir = os.path.join(self.temp_dir.name, "packs")
+        shard_dirs = []
+        for i in range(2):
+            shard_dir = os.path.join(output_dir, f"shard_{i:05d}")
+            os.makedirs(shard_dir)
+            with open(os.path.join(shard_dir, "article.idx"), "w") as f:
+                f.write(f"Page_{i}\t{i}/Page_{i}.json\n")
+                f.write(f"Other_{i}\t{i}/Other_{i}.json\n")
+            shard_dirs.append(shard_dir)
+
+        merged_path = merge_pack_indices(shard_dirs, output_dir)
+        self.assertEqual(merged_path, os.path.join(output_dir, "article.idx"))
+        self.assertEqual(read_index(merged_path), {
+            "Page_0": os.path.join("shard_00000", "0", "Page_0.json"),
+            "Other_0": os.path.join("shard_00000", "0", "Other_0.json"),
+            "Page_1": os.path.join("shard_00001", "1", "Page_1.json"),
+            "Other_1": os.path.join("shard_00001", "1", "Other_1.json"),
+        })
+
+    def test_context_grouped_reader(self):
+        paths = shard_nif_file(
+            self.write_nif("nif_context.tql"), self.shard_dir, NUM_SHARDS)
+
+        for i, path in enumerate(paths):
+            expected = []
+            for line in LINES:
+                graph = statement_graph(line)
+                if shard_of(graph, NUM_SHARDS) != i:
+                    continue
+                context = strip_url_params(graph)
+                if not expected or expected[-1][0] != context:
+                    expected.append((context, []))
+                expected[-1][1].append(line.split('"')[1])
+
+            with ContextGroupedNIFReader(path) as reader:
+                self.assertEqual(
+                    [(c, [str(o) for _, _, o in statements])
+                     for c, statements in reader], expected)
+                # The reader stays stopped after the last context.
+                with self.assertRaises(StopIteration):
+                    next(reader)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the CoNLL NER evaluator.
+"""
+import os
+import random
+import shutil
+import subprocess
+import unittest
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from forte.data.data_pack import DataPack
+from forte.evaluation.ner_evaluator import (
+    CoNLLNEREvaluator, count_conll_chunks)
+from ft.onto.base_ontology import Sentence, Token
+
+
+def build_pack(sentences: List[List[str]], tags: List[List[str]]):
+    pack = DataPack()
+    pack.set_text(" ".join(" ".join(words) for words in sentences))
+    offset = 0
+    for words, sentence_tags in zip(sentences, tags):
+        begin = offset
+        for word, tag in zip(words, sentence_tags):
+            token = Token(pack, offset, offset + len(word))
+            token.ner = tag
+            pack.add_entry(token)
+            offset += len(word) + 1
+        pack.add_entry(Sentence(pack, begin, offset - 1))
+    return pack
+
+
+class CoNLLNEREvaluatorTest(unittest.TestCase):
+
+    def setUp(self):
+        sentences = [["John", "Smith", "lives", "in", "New", "York"],
+                     ["Paris"]]
+        self.refer_pack = build_pack(
+            sentences,
+            [["B-PER", "I-PER", "O", "O", "B-LOC", "I-LOC"], ["B-LOC"]])
+        self.pred_pack = build_pack(
+            sentences,
+            [["B-PER", "I-PER", "O", "O", "B-LOC", "O"], ["B-ORG"]])
+
+    def test_scores(self):
+        evaluator = CoNLLNEREvaluator()
+        evaluator.consume_next(self.pred_pack, self.refer_pack)
+        self.assertEqual(evaluator.counts, {
+            "tokens": 7, "correct_tags": 5, "gold_chunks": 3,
+            "pred_chunks": 3, "correct_chunks": 1})
+        result = evaluator.get_result()
+        self.assertAlmostEqual(result["accuracy"], 500 / 7)
+        for key in ("precision", "recall", "f1"):
+            self.assertAlmostEqual(result[key], 100 / 3)
+
+        # The counts are accumulated over the packs.
+        evaluator.consume_next(self.refer_pack, self.refer_pack)
+        self.assertEqual(evaluator.counts["correct_chunks"], 4)
+        self.assertAlmostEqual(evaluator.get_result()["f1"], 200 / 3)
+
+        evaluator.reset()
+        self.assertEqual(evaluator.get_result(), {
+            "accuracy": 0.0, "precision": 0.0, "recall": 0.0, "f1": 0.0})
+
+    @unittest.skipUnless(shutil.which("perl"), "perl is not available")
+    def test_conll03eval_script(self):
+        script = Path(os.path.abspath(__file__)).parents[3] / \
+            "forte/utils/eval_scripts/conll03eval.v2"
+        tag_set = ["O", "B-PER", "I-PER", "E-PER", "S-PER", "B-LOC", "I-LOC",
+                   "I-MISC"]
+        rng = random.Random(0)
+        for _ in range(20):
+            gold_tags, pred_tags, row_splits, lines = [], [], [0], []
+            for _ in range(rng.randint(1, 5)):
+                for i in range(rng.randint(0, 10)):
+                    gold = rng.choice(tag_set)
+                    pred = rng.choice(tag_set) if rng.random() < 0.3 else gold
+                    gold_tags.append(gold)
+                    pred_tags.append(pred)
+                    lines.append(f"{i + 1} w POS CHUNK {gold} {pred}\n")
+                row_splits.append(len(gold_tags))
+                lines.append("\n")
+
+            output = subprocess.run(
+                ["perl", str(script)], input="".join(lines),
+                capture_output=True, text=True, check=True).stdout
+            counts = count_conll_chunks(
+                np.array(gold_tags), np.array(pred_tags),
+                np.array(row_splits))
+            self.assertEqual(
+                output.splitlines()[0],
+                f"processed {counts['tokens']} tokens with "
+                f"{counts['gold_chunks']} phrases; "
+                f"found: {counts['pred_chunks']} phrases; "
+                f"correct: {counts['correct_chunks']}.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,6 +61,17 @@ class TestEmbeddingBasedIndexer(unittest.TestCase):
                     np.all(actual_results[i][j] ==
                            self.index._index.reconstruct(int(t[0]))))
 
+    def test_search_ids(self):
+        search_vectors = np.array([[1, 0], [0.25, 0]], dtype=np.float32)
+        ids, scores = self.index.search_ids(search_vectors, k=2)
+        self.assertEqual(ids.tolist(), [[0, 2], [0, 1]])
+        self.assertEqual(scores.shape, (2, 2))
+        self.assertEqual(self.index.get_meta_data(ids[1]), ["0", "1"])
+
+        # Fewer vectors than k are found.
+        ids, _ = self.index.search_ids(search_vectors, k=4)
+        self.assertEqual(ids[:, 3].tolist(), [-1, -1])
+
     def test_indexer_save_and_load(self):
         self.index.save(path=self.index_path)
         saved_files = ["index.faiss", "index.meta_data"]
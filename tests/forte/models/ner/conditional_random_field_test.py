@@ -0,0 +1,90 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the Viterbi decoding of ConditionalRandomField.
+"""
+import unittest
+
+import torch
+from ddt import ddt, data
+
+from forte.models.ner.conditional_random_field import (
+    ConditionalRandomField, allowed_transitions, viterbi_decode)
+
+
+def sequential_viterbi_tags(crf: ConditionalRandomField,
+                            logits: torch.Tensor, mask: torch.Tensor):
+    """Decode each sequence with `viterbi_decode`, as a reference."""
+    num_tags = crf.num_tags
+    start_tag, end_tag = num_tags, num_tags + 1
+    transitions = torch.full((num_tags + 2, num_tags + 2), -10000.0)
+    inner, start, end = crf._constrained_transitions()
+    transitions[:num_tags, :num_tags] = inner
+    transitions[start_tag, :num_tags] = start
+    transitions[:num_tags, end_tag] = end
+
+    best_paths = []
+    for prediction, prediction_mask in zip(logits, mask):
+        length = int(prediction_mask.sum())
+        tag_sequence = torch.full((length + 2, num_tags + 2), -10000.0)
+        tag_sequence[0, start_tag] = 0.0
+        tag_sequence[1:length + 1, :num_tags] = prediction[:length]
+        tag_sequence[length + 1, end_tag] = 0.0
+        path, score = viterbi_decode(tag_sequence, transitions)
+        best_paths.append((path[1:-1], score.item()))
+    return best_paths
+
+
+@ddt
+class ConditionalRandomFieldTest(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(0)
+        labels = {0: "O", 1: "B-PER", 2: "I-PER", 3: "B-LOC", 4: "I-LOC"}
+        self.constraints = allowed_transitions("BIO", labels)
+        self.num_tags = len(labels)
+
+    @data(True, False)
+    def test_viterbi_tags(self, constrained):
+        crf = ConditionalRandomField(
+            self.num_tags,
+            constraints=self.constraints if constrained else None)
+        logits = torch.randn(8, 12, self.num_tags)
+        lengths = torch.tensor([12, 1, 5, 7, 12, 3, 9, 2])
+        mask = (torch.arange(12).unsqueeze(0) <
+                lengths.unsqueeze(1)).long()
+
+        actual = crf.viterbi_tags(logits, mask)
+        self.assertSameTags(actual, sequential_viterbi_tags(crf, logits, mask))
+        self.assertEqual([len(path) for path, _ in actual],
+                         lengths.tolist())
+
+    def test_no_start_end_transitions(self):
+        crf = ConditionalRandomField(
+            self.num_tags, constraints=self.constraints,
+            include_start_end_transitions=False)
+        logits = torch.randn(4, 6, self.num_tags)
+        mask = torch.ones(4, 6, dtype=torch.long)
+        self.assertSameTags(crf.viterbi_tags(logits, mask),
+                            sequential_viterbi_tags(crf, logits, mask))
+
+    def assertSameTags(self, actual, expected):
+        self.assertEqual([path for path, _ in actual],
+                         [path for path, _ in expected])
+        for (_, score), (_, expected_score) in zip(actual, expected):
+            self.assertAlmostEqual(score, expected_score, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
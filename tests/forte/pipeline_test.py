@@ -17,19 +17,24 @@ Unit tests for Pipeline.
 
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Type, cast
 
 from ddt import ddt, data, unpack
 
+from forte.common.exception import ProcessFlowException
 from forte.data.caster import MultiPackBoxer
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Generics
 from forte.data.readers.base_reader import PackReader, MultiPackReader
-from forte.data.selector import FirstPackSelector, NameMatchSelector
+from forte.data.selector import (
+    FirstPackSelector, NameMatchSelector, RegexNameMatchSelector)
+from forte.evaluation.base import Evaluator
 from forte.pipeline import Pipeline
-from forte.processors.base import PackProcessor, FixedSizeBatchProcessor
+from forte.processors.base import (
+    PackProcessor, FixedSizeBatchProcessor, MultiPackProcessor)
 from ft.onto.base_ontology import Token, Sentence
 from tests.dummy_batch_processor import DummyRelationExtractor
 
@@ -53,7 +58,7 @@ class SentenceReader(PackReader):
         super().__init__()
         self.count = 0
 
-    def _collect(self, file_path) -> Iterator[Any]:  # type: ignore
+    def _collect(self, file_path) -> Iterator[Any]:
         return iter([file_path])
 
     def _cache_key_function(self, text_file: str) -> str:
@@ -84,7 +89,7 @@ class MultiPackSentenceReader(MultiPackReader):
         super().__init__()
         self.count = 0
 
-    def _collect(self, file_path) -> Iterator[Any]:  # type: ignore
+    def _collect(self, file_path) -> Iterator[Any]:
         return iter([file_path])
 
     def _cache_key_function(self, text_file: str) -> str:
@@ -110,7 +115,19 @@ class MultiPackSentenceReader(MultiPackReader):
                 yield m_pack  # type: ignore
 
 
+class AlternatingMultiPackReader(MultiPackSentenceReader):
+    """A multi pack reader whose packs are named "pack" and "other" in
+    turn."""
+
+    def _parse_pack(self, file_path: str) -> Iterator[DataPack]:  # type: ignore
+        for m_pack in super()._parse_pack(file_path):
+            if self.count % 2 == 0:
+                cast(MultiPack, m_pack).rename_pack('pack', 'other')
+            yield m_pack
+
+
 class DummyPackProcessor(PackProcessor):
+    parallel_safe = True
 
     def __init__(self):
         super().__init__()
@@ -120,8 +137,15 @@ class DummyPackProcessor(PackProcessor):
         if len(entries) == 0:
             NewType(pack=input_pack, value="[PACK]")
         else:
-            entry = entries[0]  # type: ignore
-            entry.value += "[PACK]"
+            entry = cast(NewType, entries[0])
+            entry.value = f"{entry.value}[PACK]"
+
+
+class DummyMultiPackProcessor(MultiPackProcessor):
+    parallel_safe = True
+
+    def _process(self, input_pack: MultiPack):
+        NewType(pack=input_pack.get_pack('pack'), value="[MULTI]")
 
 
 class DummmyFixedSizeBatchProcessor(FixedSizeBatchProcessor):
@@ -146,8 +170,8 @@ class DummmyFixedSizeBatchProcessor(FixedSizeBatchProcessor):
         if len(entries) == 0:
             entry = NewType(pack=data_pack, value="[BATCH]")
         else:
-            entry = entries[0]  # type: ignore
-            entry.value += "[BATCH]"
+            entry = cast(NewType, entries[0])
+            entry.value = f"{entry.value}[BATCH]"
 
     @classmethod
     def default_configs(cls):
@@ -160,6 +184,94 @@ class DummmyFixedSizeBatchProcessor(FixedSizeBatchProcessor):
         return config
 
 
+class MultiSentenceReader(PackReader):
+    """A reader of packs with sentences of various lengths, each line of the
+    file is a pack, and the sentences are separated by " | "."""
+
+    def _collect(self, texts) -> Iterator[Any]:
+        return iter(texts)
+
+    def _cache_key_function(self, text: str) -> str:
+        return text
+
+    def _parse_pack(self, text: str) -> Iterator[DataPack]:
+        pack = DataPack()
+        pack.set_text(text)
+        begin = 0
+        for sentence_text in text.split(" | "):
+            end = begin + len(sentence_text)
+            Sentence(pack, begin, end)
+            offset = begin
+            for word in sentence_text.split(" "):
+                Token(pack, offset, offset + len(word))
+                offset += len(word) + 1
+            begin = end + 3
+        yield pack
+
+
+class DummyTokenBatchProcessor(FixedSizeBatchProcessor):
+    """Record the sizes of the batches, and mark each sentence with the
+    number of tokens seen in its batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[List[int]] = []
+
+    @staticmethod
+    def _define_context() -> Type[Sentence]:
+        return Sentence
+
+    @staticmethod
+    def _define_input_info() -> Dict:
+        return {Token: []}
+
+    def predict(self, data_batch: Dict):
+        lengths = [len(tids) for tids in data_batch["Token"]["tid"]]
+        self.batches.append(lengths)
+        return {"tid": data_batch["tid"], "context": data_batch["context"],
+                "length": lengths}
+
+    def pack(self, data_pack: DataPack, output_dict: Optional[Dict] = None):
+        assert output_dict is not None
+        for tid, context, length in zip(output_dict["tid"],
+                                        output_dict["context"],
+                                        output_dict["length"]):
+            sentence = cast(Sentence, data_pack.get_entry(tid))
+            assert sentence.text == context
+            assert sentence.speaker is None
+            sentence.speaker = str(length)
+
+
+class DummyEvaluator(Evaluator):
+    """Check the gold packs are paired with the predicted packs."""
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    def consume_next(self, pred_pack: DataPack, ref_pack: DataPack):
+        self.results.append((
+            pred_pack.text == ref_pack.text,
+            len(list(ref_pack.get_entries_by_type(NewType))),
+        ))
+
+    def get_result(self):
+        return self.results
+
+
+class SentenceEvaluator(DummyEvaluator):
+    """Check only the sentences are kept in the gold packs."""
+
+    def gold_entry_types(self):
+        return {Sentence}
+
+    def consume_next(self, pred_pack: DataPack, ref_pack: DataPack):
+        self.results.append((
+            pred_pack.text == ref_pack.text,
+            [type(e) for e in ref_pack],
+        ))
+
+
 @ddt
 class PipelineTest(unittest.TestCase):
 
@@ -284,6 +396,184 @@ class PipelineTest(unittest.TestCase):
         # check that all packs are yielded
         self.assertEqual(num_packs, reader.count)
 
+    @data(0, 1, 3)
+    def test_parallel_pipeline(self, num_workers):
+        """Tests a chain of Pack->Pack->Batch->Evaluator with workers."""
+
+        nlp = Pipeline[DataPack](num_workers=num_workers)
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummyPackProcessor())
+        nlp.add(component=DummyPackProcessor())
+        nlp.add(component=DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}})
+        evaluator = DummyEvaluator()
+        nlp.add(component=evaluator)
+        nlp.initialize()
+        data_path = data_samples_root + "/random_texts/0.txt"
+
+        texts = []
+        for pack in nlp.process_dataset(data_path):
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, "[PACK][PACK][BATCH]")
+            texts.append(pack.text)
+        nlp.finish()
+
+        with open(data_path, "r", encoding="utf8") as doc:
+            self.assertEqual(texts, [line.strip() for line in doc])
+        self.assertEqual(len(texts), reader.count)
+        # The gold packs are copied before the processing.
+        self.assertEqual(evaluator.get_result(), [(True, 0)] * len(texts))
+
+    def test_parallel_pipeline_reuse(self):
+        """Tests the workers are reused by the runs of a pipeline."""
+
+        nlp = Pipeline[DataPack](num_workers=2)
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummyPackProcessor())
+        nlp.initialize()
+        data_path = data_samples_root + "/random_texts/0.txt"
+
+        # Stop iterating early, the remaining packs are discarded.
+        for _ in nlp.process_dataset(data_path):
+            break
+
+        for _ in range(2):
+            reader.count = 0
+            num_packs = 0
+            for pack in nlp.process_dataset(data_path):
+                types = list(pack.get_entries_by_type(NewType))
+                self.assertEqual(types[0].value, "[PACK]")
+                num_packs += 1
+            self.assertEqual(num_packs, reader.count)
+        nlp.finish()
+
+    def test_parallel_safe_opt_in(self):
+        """Tests the processors are run by the workers only if they opt in."""
+
+        class CountingPackProcessor(PackProcessor):
+            def __init__(self):
+                super().__init__()
+                self.count = 0
+
+            def _process(self, input_pack: DataPack):
+                self.count += 1
+
+        nlp = Pipeline[DataPack](num_workers=2)
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummyPackProcessor())
+        counter = CountingPackProcessor()
+        nlp.add(component=counter)
+        nlp.add(component=DummyPackProcessor())
+        nlp.initialize()
+        data_path = data_samples_root + "/random_texts/0.txt"
+
+        for pack in nlp.process_dataset(data_path):
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(types[0].value, "[PACK][PACK]")
+        nlp.finish()
+
+        # The states of the counter are kept in the current process.
+        self.assertEqual(counter.count, reader.count)
+
+    @data(0, 2)
+    def test_stage_parallel_pipeline(self, num_workers):
+        """Tests a chain of Pack->Batch->Pack->Evaluator in stages."""
+
+        nlp = Pipeline[DataPack](num_workers=num_workers,
+                                 stage_parallel=True, queue_size=2)
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummyPackProcessor())
+        nlp.add(component=DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}}, stage="model")
+        nlp.add(component=DummyPackProcessor(), stage="model")
+        evaluator = DummyEvaluator()
+        nlp.add(component=evaluator)
+        nlp.initialize()
+        data_path = data_samples_root + "/random_texts/0.txt"
+
+        texts = []
+        for pack in nlp.process_dataset(data_path):
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, "[PACK][BATCH][PACK]")
+            texts.append(pack.text)
+        nlp.finish()
+
+        with open(data_path, "r", encoding="utf8") as doc:
+            self.assertEqual(texts, [line.strip() for line in doc])
+        self.assertEqual(evaluator.get_result(), [(True, 0)] * len(texts))
+
+        stats = nlp.stage_stats()
+        self.assertEqual(
+            [s.name for s in stats],
+            ["model", evaluator.name] if num_workers else
+            [DummyPackProcessor().name, "model", evaluator.name])
+        for s in stats:
+            self.assertEqual(s.num_packs, len(texts))
+            self.assertLessEqual(s.max_queue_depth, 2)
+            self.assertEqual(s.queue_depth, 0)
+
+    @data((0, False), (2, False), (0, True))
+    @unpack
+    def test_gold_entry_types(self, num_workers, stage_parallel):
+        nlp = Pipeline[DataPack](num_workers=num_workers,
+                                 stage_parallel=stage_parallel)
+        nlp.set_reader(SentenceReader())
+        nlp.add(component=DummyPackProcessor())
+        evaluator = SentenceEvaluator()
+        nlp.add(component=evaluator)
+        nlp.initialize()
+
+        data_path = data_samples_root + "/random_texts/0.txt"
+        num_packs = 0
+        for pack in nlp.process_dataset(data_path):
+            self.assertEqual(len(list(pack.get(NewType))), 1)
+            num_packs += 1
+        nlp.finish()
+        self.assertEqual(evaluator.get_result(),
+                         [(True, [Sentence])] * num_packs)
+
+    @data(False, True)
+    def test_profiling(self, stage_parallel):
+        """Tests the statistics of a chain of Pack->Batch."""
+
+        nlp = Pipeline[DataPack](stage_parallel=stage_parallel)
+        reader = SentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummyPackProcessor())
+        nlp.add(component=DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}})
+        reports = []
+        nlp.enable_profiling(log_interval=0, callback=reports.append)
+        nlp.initialize()
+
+        data_path = data_samples_root + "/random_texts/0.txt"
+        num_packs = len(list(nlp.process_dataset(data_path)))
+        nlp.finish()
+
+        reader_stats, pack_stats, batch_stats = nlp.profile_report()
+        self.assertEqual(reader_stats["packs_out"], num_packs)
+        for stats in (pack_stats, batch_stats):
+            self.assertEqual(stats["packs_in"], num_packs)
+            self.assertEqual(stats["packs_out"], num_packs)
+            self.assertGreater(stats["wall_time"], 0)
+        # Each pack has one NewType created by the first processor.
+        self.assertEqual(pack_stats["entries_created"], num_packs)
+        self.assertEqual(pack_stats["num_calls"], num_packs + 1)
+        self.assertNotIn("num_batches", pack_stats)
+
+        # Each sentence is an instance of the batches.
+        self.assertEqual(batch_stats["num_batches"], (num_packs + 3) // 4)
+        self.assertEqual(batch_stats["max_batch_size"], 4)
+        self.assertGreater(batch_stats["predict_time"], 0)
+        self.assertGreater(batch_stats["pack_time"], 0)
+        self.assertEqual(len(reports), 2 * num_packs)
+
     @data((2, 3), (4, 5), (8, 9), (3, 2), (5, 4), (9, 8))
     @unpack
     def test_pipeline5(self, batch_size1, batch_size2):
@@ -374,6 +664,129 @@ class PipelineTest(unittest.TestCase):
         # check that all packs are yielded
         self.assertEqual(num_packs, reader.count)
 
+    @data(
+        ("TokenBudgetDataPackBatcher", {"max_tokens": 12}),
+        ("TokenBudgetDataPackBatcher", {"max_tokens": 12, "batch_size": 2}),
+        ("LengthBucketingDataPackBatcher",
+         {"max_tokens": 12, "window_size": 5}),
+        ("LengthBucketingDataPackBatcher",
+         {"max_tokens": 100, "batch_size": 3, "window_size": 100}),
+    )
+    @unpack
+    def test_token_batchers(self, batcher_type, kwargs):
+        texts = [
+            "a b c d e f | a b",
+            "a | a b c | a b c d e f g h i j k l m n",
+            "a b c d",
+            "a b c | a b c | a | a b c d e",
+        ]
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(MultiSentenceReader())
+        processor = DummyTokenBatchProcessor()
+        nlp.add(processor, config={"batcher": {
+            "type": "forte.data.batchers." + batcher_type,
+            "kwargs": kwargs}})
+        nlp.initialize()
+
+        packs = list(nlp.process_dataset(texts))
+        self.assertEqual([pack.text for pack in packs], texts)
+        # Every sentence is packed once, into the right pack.
+        for pack in packs:
+            for sentence in pack.get(Sentence):
+                self.assertEqual(sentence.speaker,
+                                 str(len(list(pack.get(Token, sentence)))))
+
+        self.assertEqual(sum(len(batch) for batch in processor.batches), 10)
+        for batch in processor.batches:
+            if len(batch) > 1:
+                self.assertLessEqual(len(batch) * max(batch),
+                                     kwargs["max_tokens"])
+            self.assertLessEqual(len(batch), kwargs.get("batch_size", 10))
+        if kwargs.get("window_size") == 100:
+            # All the sentences are in the window, so they are batched in
+            # the order of the lengths.
+            self.assertEqual(
+                [sorted(batch) for batch in processor.batches],
+                [[1, 1, 2], [3, 3, 3], [4, 5, 6], [14]])
+
+    def test_serving(self):
+        """Tests the packs of concurrent callers are batched together."""
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(MultiSentenceReader())
+        nlp.add(component=DummyPackProcessor())
+        processor = DummyTokenBatchProcessor()
+        nlp.add(processor, config={"batcher": {"batch_size": 4}})
+        nlp.initialize()
+
+        texts = ["a" + " a" * i for i in range(8)]
+        with nlp.serve(max_wait=60) as server:
+            with ThreadPoolExecutor(8) as executor:
+                packs = list(executor.map(
+                    lambda text: server.process_one([text]), texts))
+            stats = server.stats()
+
+        # Each caller gets its own pack.
+        for text, pack in zip(texts, packs):
+            self.assertEqual(pack.text, text)
+            self.assertEqual(pack.get_single(NewType).value, "[PACK]")
+            self.assertEqual(pack.get_single(Sentence).speaker,
+                             str(len(text.split())))
+        self.assertEqual([len(batch) for batch in processor.batches], [4, 4])
+        self.assertEqual(stats.num_packs, 8)
+        self.assertGreater(stats.throughput, 0)
+        self.assertLessEqual(stats.p50, stats.p99)
+
+        # The pipeline can be run as usual after the server is closed.
+        self.assertEqual(nlp.process_one(["a b"]).text, "a b")
+
+    def test_serving_max_wait(self):
+        """Tests a partial batch is processed after the max wait."""
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(MultiSentenceReader())
+        processor = DummyTokenBatchProcessor()
+        nlp.add(processor, config={"batcher": {"batch_size": 4}})
+        nlp.initialize()
+
+        server = nlp.serve(max_wait=0.05)
+        pack = server.process(next(nlp.reader.iter(["a b c"])), timeout=10)
+        self.assertEqual(pack.get_single(Sentence).speaker, "3")
+        self.assertEqual(processor.batches, [[3]])
+        self.assertGreaterEqual(server.stats().p50, 0.05)
+
+        server.close()
+        with self.assertRaises(ProcessFlowException):
+            server.submit(pack)
+
+    def test_serving_max_wait_repeated(self):
+        """Tests the partial batches of several max waits in a row."""
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(MultiSentenceReader())
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}})
+        nlp.initialize()
+
+        with nlp.serve(max_wait=0.05) as server:
+            for text in ("a", "a b", "a b c"):
+                pack = server.process(
+                    next(nlp.reader.iter([text])), timeout=10)
+                self.assertEqual(pack.text, text)
+                self.assertEqual(pack.get_single(NewType).value, "[BATCH]")
+
+    def test_serving_same_pack(self):
+        """Tests a pack submitted twice gets both results."""
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(MultiSentenceReader())
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}})
+        nlp.initialize()
+
+        pack = next(nlp.reader.iter(["a b c"]))
+        with nlp.serve(max_wait=60) as server:
+            futures = [server.submit(pack), server.submit(pack)]
+        self.assertEqual([f.result(timeout=10) for f in futures],
+                         [pack, pack])
+        self.assertEqual(pack.get_single(NewType).value, "[BATCH][BATCH]")
+
 
 @ddt
 class MultiPackPipelineTest(unittest.TestCase):
@@ -408,6 +821,59 @@ class MultiPackPipelineTest(unittest.TestCase):
                           pack.get(Token, sentence)]
                 self.assertEqual(sent_text, " ".join(tokens))
 
+    def test_stage_selector_without_match(self):
+        """Tests the multi packs without a selected pack keep their order
+        and wait for the batches of the packs before them in stages."""
+        nlp = Pipeline[MultiPack](stage_parallel=True)
+        reader = AlternatingMultiPackReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}},
+                selector=RegexNameMatchSelector("^pack$"))
+        nlp.initialize()
+        data_path = data_samples_root + "/random_texts/0.txt"
+
+        texts = []
+        for m_pack in nlp.process_dataset(data_path):
+            name, pack = next(m_pack.iter_packs())
+            types = list(pack.get_entries_by_type(NewType))
+            if name == 'pack':
+                self.assertEqual(len(types), 1)
+                self.assertEqual(types[0].value, "[BATCH]")
+            else:
+                self.assertEqual(len(types), 0)
+            texts.append(pack.text)
+        nlp.finish()
+
+        with open(data_path, "r", encoding="utf8") as doc:
+            self.assertEqual(
+                texts, [line.strip() for line in doc if line.strip()])
+
+    @data(0, 2)
+    def test_parallel_pipeline(self, num_workers):
+        """Tests the data packs of the multi packs are sent to the
+        workers."""
+        nlp = Pipeline[MultiPack](num_workers=num_workers)
+        reader = MultiPackSentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(component=DummyMultiPackProcessor())
+        nlp.add(component=DummyPackProcessor(), selector=FirstPackSelector())
+        nlp.initialize()
+        data_path = data_samples_root + "/random_texts/0.txt"
+
+        texts = []
+        for m_pack in nlp.process_dataset(data_path):
+            pack = m_pack.get_pack('pack')
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, "[MULTI][PACK]")
+            texts.append(pack.text)
+        nlp.finish()
+
+        with open(data_path, "r", encoding="utf8") as doc:
+            self.assertEqual(
+                texts, [line.strip() for line in doc if line.strip()])
+
     def test_pipeline1(self):
         """Tests a pack processor only."""
 
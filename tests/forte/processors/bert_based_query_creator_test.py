@@ -23,7 +23,8 @@ from ddt import ddt, data, unpack
 
 from forte.data.multi_pack import MultiPack
 from forte.pipeline import Pipeline
-from forte.processors.ir import BertBasedQueryCreator
+from forte.processors.ir import (
+    BertBasedQueryCreator, BatchBertBasedQueryCreator)
 from forte.data.readers import MultiPackSentenceReader
 from forte.data.ontology import Query
 
@@ -64,3 +65,35 @@ class TestBertBasedQueryCreator(unittest.TestCase):
             self.assertIsInstance(query_pack.generics[0], Query)
             query = query_pack.generics[0].value
             self.assertEqual(query.shape, (1, 768))
+
+    @data((["Hello, good morning",
+            "This is a tool for NLP",
+            "The queries are encoded in batches"], 2))
+    @unpack
+    def test_batch_pipeline(self, texts, batch_size):
+        for idx, text in enumerate(texts):
+            file_path = os.path.join(self.test_dir, f"{idx+1}.txt")
+            with open(file_path, 'w') as f:
+                f.write(text)
+
+        nlp = Pipeline[MultiPack]()
+        reader_config = {"input_pack_name": "query",
+                         "output_pack_name": "output"}
+        nlp.set_reader(reader=MultiPackSentenceReader(), config=reader_config)
+        config = {"model": {"name": "bert-base-uncased"},
+                  "tokenizer": {"name": "bert-base-uncased"},
+                  "max_seq_length": 128,
+                  "query_pack_name": "query",
+                  "batcher": {"batch_size": batch_size}}
+        nlp.add(BatchBertBasedQueryCreator(), config=config)
+
+        nlp.initialize()
+
+        m_packs = list(nlp.process_dataset(self.test_dir))
+        self.assertEqual(len(m_packs), len(texts))
+        for m_pack in m_packs:
+            query_pack = m_pack.get_pack("query")
+            self.assertEqual(len(query_pack.generics), 1)
+            self.assertIsInstance(query_pack.generics[0], Query)
+            query = query_pack.generics[0].value
+            self.assertEqual(query.shape, (1, 768))
@@ -0,0 +1,66 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the batched scoring of BertRerankingProcessor.
+"""
+import os
+import random
+import tempfile
+import unittest
+
+import torch
+from ddt import ddt, data
+
+from examples.passage_ranker.reranker_benchmark import (
+    WORDS, build_reranker, sequential_scores)
+
+
+@ddt
+class BertRerankingProcessorTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        torch.manual_seed(0)
+        self.query_text = " ".join(random.choices(WORDS, k=4))
+        # The documents are not sorted by length, and some are longer than
+        # the maximum sequence length.
+        self.document_texts = [
+            " ".join(random.choices(WORDS, k=k))
+            for k in (20, 3, 60, 8, 3, 35, 1)]
+
+    @data(1, 3, 7, 0, -1)
+    def test_score_documents(self, batch_size):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reranker = build_reranker(
+                os.path.join(tmp_dir, "vocab.txt"), batch_size, 32)
+
+        scores = reranker.score_documents(
+            self.query_text, self.document_texts)
+        expected = sequential_scores(
+            reranker, self.query_text, self.document_texts)
+        self.assertEqual(len(scores), len(self.document_texts))
+        self.assertTrue(torch.allclose(
+            torch.tensor(scores), torch.tensor(expected), atol=1e-5))
+
+        # Each score is the score of the document scored alone.
+        for document_text, score in zip(self.document_texts, scores):
+            self.assertAlmostEqual(
+                reranker.score_documents(
+                    self.query_text, [document_text])[0], score, places=5)
+
+        self.assertEqual(reranker.score_documents(self.query_text, []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
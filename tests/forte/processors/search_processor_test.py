@@ -0,0 +1,107 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the search processors.
+"""
+import os
+import tempfile
+import unittest
+from typing import List
+
+import numpy as np
+from ddt import ddt, data
+
+from forte.data.multi_pack import MultiPack
+from forte.data.ontology import Query
+from forte.data.readers import MultiPackSentenceReader
+from forte.indexers import EmbeddingBasedIndexer
+from forte.pipeline import Pipeline
+from forte.processors.base import MultiPackProcessor
+from forte.processors.ir import SearchProcessor, BatchSearchProcessor
+
+DIM = 8
+NUM_DOCUMENTS = 20
+INDEX_CONFIG = {"index_type": "IndexFlatIP", "dim": DIM, "device": "cpu"}
+
+
+class RandomQueryCreator(MultiPackProcessor):
+    r"""Adds two close random queries to the query pack, so that they share
+    some of their hits."""
+
+    def _process(self, input_pack: MultiPack):
+        query_pack = input_pack.get_pack("query")
+        rng = np.random.RandomState(len(query_pack.text))
+        vector = rng.randn(DIM).astype(np.float32)
+        Query(pack=query_pack).value = vector
+        Query(pack=query_pack).value = (
+                vector + 0.1 * rng.randn(DIM).astype(np.float32))
+
+
+@ddt
+class SearchProcessorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.text_dir = os.path.join(self.temp_dir.name, "texts")
+        os.makedirs(self.text_dir)
+        for i in range(7):
+            with open(os.path.join(self.text_dir, f"{i}.txt"), "w") as f:
+                f.write("query" * (i + 1))
+
+        self.model_dir = os.path.join(self.temp_dir.name, "index")
+        index = EmbeddingBasedIndexer(config=INDEX_CONFIG)
+        vectors = np.random.RandomState(0).randn(
+            NUM_DOCUMENTS, DIM).astype(np.float32)
+        index.add(vectors, meta_data={
+            i: f"document {i}" for i in range(NUM_DOCUMENTS)})
+        index.save(self.model_dir)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def search(self, processor, config) -> List[List[str]]:
+        nlp = Pipeline[MultiPack]()
+        nlp.set_reader(MultiPackSentenceReader(),
+                       config={"input_pack_name": "query"})
+        nlp.add(RandomQueryCreator())
+        config.update({"model_dir": self.model_dir, "k": 4,
+                       "index_config": INDEX_CONFIG})
+        nlp.add(processor, config=config)
+        nlp.initialize()
+
+        results = []
+        for m_pack in nlp.process_dataset(self.text_dir):
+            results.append([
+                m_pack.get_pack(f"doc_{i}").text
+                for i in range(len(m_pack.packs) - 2)])
+        nlp.finish()
+        return results
+
+    @data(1, 3, 10)
+    def test_batch_search(self, batch_size):
+        expected = self.search(SearchProcessor(), {})
+        self.assertEqual(len(expected), 7)
+        for documents in expected:
+            # The shared hits of the two queries are added once.
+            self.assertEqual(len(documents), len(set(documents)))
+            self.assertTrue(4 <= len(documents) <= 8)
+
+        self.assertEqual(
+            self.search(BatchSearchProcessor(),
+                        {"batcher": {"batch_size": batch_size}}),
+            expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
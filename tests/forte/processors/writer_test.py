@@ -28,7 +28,7 @@ from forte.processors.annotation_remover import AnnotationRemover
 from forte.processors.nltk_processors import NLTKWordTokenizer, \
     NLTKPOSTagger, NLTKSentenceSegmenter
 from forte.processors.writers import PackNameJsonPackWriter
-from ft.onto.base_ontology import Token
+from ft.onto.base_ontology import Token, Sentence
 
 
 class TestLowerCaserProcessor(unittest.TestCase):
@@ -80,3 +80,51 @@ class TestLowerCaserProcessor(unittest.TestCase):
 
         assert token_counts == expected_count
         shutil.rmtree(output_path)
+
+    def test_binary_serialize_deserialize(self):
+        dataset_path = "data_samples/ontonotes/00"
+        output_path = tempfile.mkdtemp()
+
+        pipe_serialize = Pipeline[DataPack]()
+        pipe_serialize.set_reader(OntonotesReader())
+        pipe_serialize.add(
+            PackNameJsonPackWriter(), {
+                'output_dir': output_path,
+                'serialize_method': 'binary',
+            }
+        )
+        pipe_serialize.run(dataset_path)
+
+        # The suffix of the binary packs is used by default.
+        pipe_deserialize = Pipeline[DataPack]()
+        pipe_deserialize.set_reader(
+            RecursiveDirectoryDeserializeReader(),
+            {'serialize_method': 'binary'})
+        pipe_deserialize.initialize()
+
+        pipe_original = Pipeline[DataPack]()
+        pipe_original.set_reader(OntonotesReader())
+        pipe_original.initialize()
+
+        token_counts: Dict[str, int] = {}
+        for pack in pipe_deserialize.process_dataset(output_path):
+            token_counts[pack.pack_name] = len(list(pack.get(Token)))
+
+        self.assertEqual(token_counts, {
+            pack.pack_name: len(list(pack.get(Token)))
+            for pack in pipe_original.process_dataset(dataset_path)})
+
+        # Only the sentences are decoded when the packs are read.
+        pipe_deserialize = Pipeline[DataPack]()
+        pipe_deserialize.set_reader(
+            RecursiveDirectoryDeserializeReader(),
+            {'suffix': '.bin', 'serialize_method': 'binary',
+             'entry_types': ['ft.onto.base_ontology.Sentence']})
+        pipe_deserialize.initialize()
+        lazy_token_counts: Dict[str, int] = {}
+        for pack in pipe_deserialize.process_dataset(output_path):
+            self.assertEqual(len(pack.annotations),
+                             len(list(pack.get(Sentence))))
+            lazy_token_counts[pack.pack_name] = len(list(pack.get(Token)))
+        self.assertEqual(lazy_token_counts, token_counts)
+        shutil.rmtree(output_path)